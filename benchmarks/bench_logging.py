@@ -0,0 +1,97 @@
+"""
+Measure the per-call overhead of `wreq` with logging disabled and enabled.
+
+Requests are served by an in-process adapter so the numbers reflect wreqs'
+own cost rather than network or server noise. Results are printed as JSON.
+
+Usage:
+    python benchmarks/bench_logging.py [--iterations N]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import json
+import logging
+import time
+from typing import Callable, Dict
+
+from requests import PreparedRequest, Request, Response, Session
+from requests.adapters import BaseAdapter
+
+import wreqs
+from wreqs import wreq
+
+BODY = json.dumps({"items": [{"id": i, "name": f"item-{i}"} for i in range(200)]})
+
+
+class StaticAdapter(BaseAdapter):
+    """Adapter that answers every request with the same JSON body."""
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:  # type: ignore[override]
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url or ""
+        response.request = request
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response._content = BODY.encode()
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _session() -> Session:
+    session = Session()
+    session.mount("http://", StaticAdapter())
+    return session
+
+
+def _time(fn: Callable[[], None], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run(iterations: int) -> Dict[str, float]:
+    session = _session()
+    req = Request("GET", "http://bench.local/items")
+
+    def raw() -> None:
+        session.send(session.prepare_request(req))
+
+    def wrapped() -> None:
+        with wreq(req, session=session) as response:
+            response.status_code
+
+    wreqs_logger = logging.getLogger("wreqs.context")
+    wreqs_logger.propagate = False
+
+    wreqs_logger.setLevel(logging.WARNING)
+    raw_us = _time(raw, iterations)
+    disabled_us = _time(wrapped, iterations)
+
+    wreqs.configure_logger(level=logging.INFO, filename="/dev/null")
+    enabled_us = _time(wrapped, iterations)
+
+    return {
+        "iterations": iterations,
+        "raw_send_us": raw_us,
+        "wreq_logging_disabled_us": disabled_us,
+        "wreq_logging_enabled_us": enabled_us,
+        "overhead_disabled_us": disabled_us - raw_us,
+        "overhead_enabled_us": enabled_us - raw_us,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    print(json.dumps(run(args.iterations), indent=2))
@@ -0,0 +1,227 @@
+"""
+Measure what wreqs costs on top of plain `requests`, against the local test server.
+
+Starts `tests/app.py` on a free port and runs:
+
+- overhead: raw `Session.send` vs `wreq` on a shared session, logging off and on
+- retry: a request that succeeds on the third attempt (`/retry/number`), through
+  `wreq`'s retry loop vs a hand-written loop over `Session.send`
+- session: `wreq` creating a session per call vs reusing one via `wreqs_session`
+- throughput: requests per second through `wreq_many` for each thread count
+
+Results are printed (or written with `--output`) as JSON. Pass `--compare` with an
+earlier result file to add the relative change of every metric, so runs from two
+versions can be compared directly.
+
+Usage:
+    python benchmarks/bench_suite.py [--iterations N] [--threads 1,4,16]
+        [--output results.json] [--compare baseline.json]
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import json
+import logging
+import platform
+import socket
+import subprocess
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Generator, List
+
+import requests
+from requests import Request, Session
+
+import wreqs
+from wreqs import wreq, wreq_many, wreqs_session
+
+APP = Path(__file__).parent.parent / "tests" / "app.py"
+
+
+@contextmanager
+def local_server() -> Generator[str, None, None]:
+    """Run the test app on a free port and yield its base URL."""
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen(
+        [sys.executable, str(APP), str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://localhost:{port}"
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                requests.get(f"{base_url}/ping", timeout=1)
+                break
+            except requests.ConnectionError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("test server did not start")
+                time.sleep(0.05)
+        yield base_url
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def _per_call_us(fn: Callable[[], Any], iterations: int, rounds: int = 3) -> float:
+    """Best per-call time over `rounds` runs, which filters out scheduler noise."""
+    fn()  # warm up connections and caches
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1e6
+
+
+def bench_overhead(base_url: str, iterations: int) -> Dict[str, float]:
+    session = Session()
+    req = Request("GET", f"{base_url}/ping")
+
+    def raw() -> None:
+        session.send(session.prepare_request(req)).content
+
+    def wrapped() -> None:
+        with wreq(req, session=session) as response:
+            response.content
+
+    wreqs_logger = logging.getLogger("wreqs.context")
+    wreqs_logger.propagate = False
+    wreqs_logger.setLevel(logging.WARNING)
+    raw_us = _per_call_us(raw, iterations)
+    disabled_us = _per_call_us(wrapped, iterations)
+
+    wreqs.configure_logger(level=logging.INFO, filename="/dev/null")
+    enabled_us = _per_call_us(wrapped, iterations)
+    wreqs_logger.setLevel(logging.WARNING)
+    session.close()
+
+    return {
+        "raw_send_us": raw_us,
+        "wreq_logging_disabled_us": disabled_us,
+        "wreq_logging_enabled_us": enabled_us,
+        "overhead_logging_disabled_us": disabled_us - raw_us,
+        "overhead_logging_enabled_us": enabled_us - raw_us,
+    }
+
+
+def bench_retry(base_url: str, iterations: int) -> Dict[str, float]:
+    session = Session()
+    url = f"{base_url}/retry/number"
+
+    def retry_request() -> Request:
+        body = {"signature": uuid.uuid4().hex, "succeed_after_attempt": 2}
+        return Request("POST", url, json=body)
+
+    def raw() -> None:
+        prepared = session.prepare_request(retry_request())
+        for _ in range(3):
+            if session.send(prepared).status_code == 200:
+                return
+
+    def wrapped() -> None:
+        check = lambda r: r.status_code != 200  # noqa: E731
+        with wreq(retry_request(), session=session, check_retry=check) as response:
+            response.content
+
+    raw_us = _per_call_us(raw, iterations)
+    wrapped_us = _per_call_us(wrapped, iterations)
+    session.close()
+    return {
+        "raw_three_attempts_us": raw_us,
+        "wreq_three_attempts_us": wrapped_us,
+        "overhead_per_attempt_us": (wrapped_us - raw_us) / 3,
+    }
+
+
+def bench_session(base_url: str, iterations: int) -> Dict[str, float]:
+    req = Request("GET", f"{base_url}/ping")
+
+    def fresh() -> None:
+        with wreq(req) as response:
+            response.content
+
+    fresh_us = _per_call_us(fresh, iterations)
+    with wreqs_session():
+        reused_us = _per_call_us(fresh, iterations)
+    return {
+        "new_session_per_call_us": fresh_us,
+        "wreqs_session_us": reused_us,
+        "speedup": fresh_us / reused_us,
+    }
+
+
+def bench_throughput(
+    base_url: str, iterations: int, thread_counts: List[int]
+) -> Dict[str, float]:
+    results = {}
+    for threads in thread_counts:
+        reqs = [Request("GET", f"{base_url}/ping")] * max(iterations, threads * 10)
+        start = time.perf_counter()
+        failures = sum(
+            not result.ok for result in wreq_many(reqs, max_workers=threads, ordered=False)
+        )
+        elapsed = time.perf_counter() - start
+        results[f"threads_{threads}_rps"] = len(reqs) / elapsed
+        if failures:
+            results[f"threads_{threads}_failures"] = failures
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Relative change of every numeric metric present in both runs."""
+    changes: Dict[str, Dict[str, float]] = {}
+    for group, metrics in current["results"].items():
+        for name, value in metrics.items():
+            before = baseline.get("results", {}).get(group, {}).get(name)
+            if isinstance(before, (int, float)) and before:
+                changes.setdefault(group, {})[name] = (value - before) / before
+    return changes
+
+
+def run(iterations: int, thread_counts: List[int]) -> Dict[str, Any]:
+    with local_server() as base_url:
+        results = {
+            "overhead": bench_overhead(base_url, iterations),
+            "retry": bench_retry(base_url, max(iterations // 3, 1)),
+            "session": bench_session(base_url, iterations),
+            "throughput": bench_throughput(base_url, iterations, thread_counts),
+        }
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "requests": requests.__version__,
+            "platform": platform.platform(),
+            "iterations": iterations,
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--threads", default="1,4,16")
+    parser.add_argument("--output", help="write the JSON result to this file")
+    parser.add_argument("--compare", help="earlier JSON result to compare against")
+    args = parser.parse_args()
+
+    report = run(args.iterations, [int(n) for n in args.threads.split(",")])
+    if args.compare:
+        with open(args.compare) as f:
+            report["relative_change"] = compare(report, json.load(f))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    print(output)
@@ -32,6 +32,7 @@ setup(
     extras_require={
         "dev": ["pytest", "pytest-cov", "flask", "mypy", "flake8", "black"],
         "docs": ["sphinx", "sphinx_rtd_theme"],
+        "fast-json": ["orjson"],
     },
     project_urls={
         "Bug Reports": "https://github.com/munozarturo/wreqs/issues",
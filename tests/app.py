@@ -1,4 +1,5 @@
 from collections import defaultdict
+import sys
 import time
 from typing import Any
 from flask import Flask, Response, json, request
@@ -108,5 +109,33 @@ def retry_time():
     return resp
 
 
+num_reqs_by_cache_key: defaultdict[str, int] = defaultdict(lambda: 0)
+
+
+@app.get("/cached/<key>")
+def cached(key: str):
+    num_reqs_by_cache_key[key] += 1
+    etag: str = f'"{key}-v1"'
+    if request.headers.get("If-None-Match") == etag:
+        resp: Response = app.response_class(status=304)
+    else:
+        resp = app.response_class(
+            response=json.dumps({"key": key, "hits": num_reqs_by_cache_key[key]}),
+            status=200,
+            mimetype="application/json",
+        )
+    resp.headers["Cache-Control"] = f"max-age={request.args.get('max_age', 60)}"
+    resp.headers["ETag"] = etag
+    return resp
+
+
+@app.get("/cached/<key>/count")
+def cached_count(key: str):
+    data: dict[str, Any] = {"count": num_reqs_by_cache_key[key]}
+    return app.response_class(
+        response=json.dumps(data), status=200, mimetype="application/json"
+    )
+
+
 if __name__ == "__main__":
-    app.run(port=5000)
+    app.run(port=int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
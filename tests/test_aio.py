@@ -0,0 +1,291 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+import gzip
+import io
+import json
+from collections import defaultdict
+from typing import Dict, Tuple
+
+import pytest
+import requests
+from wreqs import AsyncSession, StreamTransport, awreq, awreqs_session
+from wreqs.error import RetryRequestError
+
+
+class LocalServer:
+    """Tiny keep-alive HTTP/1.1 server built on asyncio streams."""
+
+    def __init__(self) -> None:
+        self.hits: Dict[str, int] = defaultdict(int)
+        self.connections = 0
+        self.disconnects = 0
+        # close the connection on the next request instead of answering, like a server
+        # dropping an idle keep-alive connection just as the client reuses it
+        self.drop_next = False
+        self.server: asyncio.AbstractServer
+
+    async def __aenter__(self) -> "LocalServer":
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    def url(self, path: str) -> str:
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}{path}"
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, value = line.decode().split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                if self.drop_next:
+                    self.drop_next = False
+                    break
+                if target == "/partial":
+                    # half a body, then wait for the client to give up
+                    self.hits[target] += 1
+                    writer.write(b"HTTP/1.1 200 X\r\nContent-Length: 100\r\n\r\n" + b"x" * 10)
+                    await writer.drain()
+                    await reader.read()
+                    break
+
+                status, extra, payload = await self._route(method, target, headers, body)
+                head = [f"HTTP/1.1 {status} X", *extra]
+                if "Transfer-Encoding: chunked" in extra:
+                    chunks = [payload[:5], payload[5:]]
+                    data = b"".join(b"%x\r\n%s\r\n" % (len(c), c) for c in chunks if c)
+                    data += b"0\r\n\r\n"
+                else:
+                    head.append(f"Content-Length: {len(payload)}")
+                    data = payload
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + data)
+                await writer.drain()
+        finally:
+            self.disconnects += 1
+            writer.close()
+
+    async def _route(self, method, target, headers, body) -> Tuple[int, list, bytes]:
+        path = target.split("?")[0]
+        self.hits[path] += 1
+        if path == "/ping":
+            return 200, ["Content-Type: application/json"], b'{"message": "success"}'
+        if path == "/echo":
+            payload = {"method": method, "headers": headers, "body": body.decode()}
+            return 200, [], json.dumps(payload).encode()
+        if path == "/flaky":
+            status = 200 if self.hits[path] > 2 else 500
+            return status, [], b"{}"
+        if path == "/login":
+            return 200, ["Set-Cookie: token=abc; Path=/"], b""
+        if path == "/redirect":
+            return 302, ["Location: /ping"], b""
+        if path == "/gzip":
+            payload = gzip.compress(b'{"compressed": true}')
+            return 200, ["Content-Encoding: gzip", "Transfer-Encoding: chunked"], payload
+        if path == "/corrupt":
+            return 200, ["Content-Encoding: gzip"], b"not gzip at all"
+        if path == "/slow":
+            await asyncio.sleep(1)
+            return 200, [], b""
+        return 404, [], b""
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_awreq_simple():
+    async def main():
+        async with LocalServer() as server:
+            async with awreq(requests.Request("GET", server.url("/ping"))) as response:
+                assert response.status_code == 200
+                assert response.json() == {"message": "success"}
+
+    run(main())
+
+
+def test_awreq_post_json_and_gzip():
+    async def main():
+        async with LocalServer() as server, awreqs_session():
+            req = requests.Request("POST", server.url("/echo"), json={"a": 1})
+            async with awreq(req) as response:
+                echoed = response.json()
+                assert echoed["method"] == "POST"
+                assert json.loads(echoed["body"]) == {"a": 1}
+
+            async with awreq(requests.Request("GET", server.url("/gzip"))) as response:
+                assert response.json() == {"compressed": True}
+
+    run(main())
+
+
+def test_awreq_retry_with_async_callback():
+    calls = []
+
+    async def retry_callback(response: requests.Response) -> None:
+        calls.append(response.status_code)
+        await asyncio.sleep(0)
+
+    async def main():
+        async with LocalServer() as server:
+            req = requests.Request("GET", server.url("/flaky"))
+            async with awreq(
+                req,
+                check_retry=lambda r: r.status_code != 200,
+                retry_callback=retry_callback,
+            ) as response:
+                assert response.status_code == 200
+
+            with pytest.raises(RetryRequestError):
+                async with awreq(req, check_retry=lambda r: True, max_retries=2):
+                    pytest.fail()
+
+    run(main())
+    assert calls == [500, 500]
+
+
+def test_awreq_timeout():
+    async def main():
+        async with LocalServer() as server:
+            with pytest.raises(requests.Timeout):
+                async with awreq(
+                    requests.Request("GET", server.url("/slow")), timeout=0.2
+                ):
+                    pytest.fail()
+
+    run(main())
+
+
+def test_awreqs_session_cookies_redirects_and_keep_alive():
+    async def main():
+        async with LocalServer() as server, awreqs_session():
+            async with awreq(requests.Request("GET", server.url("/login"))):
+                pass
+
+            async with awreq(requests.Request("GET", server.url("/echo"))) as response:
+                assert response.json()["headers"]["cookie"] == "token=abc"
+
+            async with awreq(requests.Request("GET", server.url("/redirect"))) as response:
+                assert response.status_code == 200
+                assert [r.status_code for r in response.history] == [302]
+
+            assert server.connections == 1
+
+    run(main())
+
+
+def test_awreq_many_concurrent_requests():
+    async def main():
+        async with LocalServer() as server, awreqs_session():
+
+            async def fetch():
+                async with awreq(requests.Request("GET", server.url("/ping"))) as r:
+                    return r.status_code
+
+            statuses = await asyncio.gather(*(fetch() for _ in range(200)))
+            assert statuses == [200] * 200
+
+    run(main())
+
+
+def test_awreq_backoff_uses_async_sleep():
+    from wreqs import ExponentialBackoff
+
+    sleeps = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    async def main():
+        async with LocalServer() as server:
+            req = requests.Request("GET", server.url("/flaky"))
+            backoff = ExponentialBackoff(base=0.5, async_sleep=fake_sleep)
+            async with awreq(
+                req, check_retry=lambda r: r.status_code != 200, backoff=backoff
+            ) as response:
+                assert response.status_code == 200
+
+    run(main())
+    assert sleeps == [0.5, 1.0]
+
+
+def test_stale_connection_resend_keeps_file_body():
+    async def main():
+        async with LocalServer() as server, awreqs_session():
+            async with awreq(requests.Request("GET", server.url("/ping"))):
+                pass
+            server.drop_next = True
+            req = requests.Request("POST", server.url("/echo"), data=io.BytesIO(b"payload"))
+            async with awreq(req) as response:
+                assert response.json()["body"] == "payload"
+            assert server.connections == 2
+
+    run(main())
+
+
+class TrackingTransport(StreamTransport):
+    """Keeps every connection it opens, so they are not closed by garbage collection."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.opened = []
+
+    async def _connect(self, *args):
+        conn = await super()._connect(*args)
+        self.opened.append(conn)
+        return conn
+
+
+def test_cancelled_request_closes_its_connection():
+    async def main():
+        async with LocalServer() as server:
+            transport = TrackingTransport()
+            session = AsyncSession(transport=transport)
+            prepared = session.prepare_request(requests.Request("GET", server.url("/partial")))
+            task = asyncio.ensure_future(session.send(prepared))
+            while not server.hits["/partial"]:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            for _ in range(100):
+                if server.disconnects:
+                    break
+                await asyncio.sleep(0.01)
+            assert server.disconnects == 1
+            assert transport.opened[0][1].is_closing()
+            assert not any(transport._idle.values())
+            await session.aclose()
+
+    run(main())
+
+
+def test_corrupt_gzip_body_raises_content_decoding_error():
+    async def main():
+        async with LocalServer() as server, awreqs_session():
+            with pytest.raises(requests.exceptions.ContentDecodingError):
+                async with awreq(requests.Request("GET", server.url("/corrupt"))):
+                    pytest.fail()
+            # the connection was left in a clean state and is reused
+            async with awreq(requests.Request("GET", server.url("/ping"))) as response:
+                assert response.status_code == 200
+            assert server.connections == 1
+
+    run(main())
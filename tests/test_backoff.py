@@ -0,0 +1,62 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+
+import requests
+from wreqs.backoff import (
+    DecorrelatedJitterBackoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+    parse_retry_after,
+)
+
+NOW = 1_700_000_000.0
+
+
+def make_response(status: int, **headers: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    return response
+
+
+def test_exponential_is_capped():
+    backoff = ExponentialBackoff(base=0.5, cap=3)
+    assert [backoff.delay(n) for n in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+    assert backoff.delay(10_000) == 3
+
+
+def test_jitter_policies_stay_in_bounds():
+    rng = random.Random(42)
+    full = FullJitterBackoff(base=1, cap=10, rng=rng)
+    decorrelated = DecorrelatedJitterBackoff(base=1, cap=10, rng=rng)
+
+    previous = 0.0
+    for attempt in range(1, 50):
+        assert 0 <= full.delay(attempt) <= min(10, 2 ** (attempt - 1))
+        delay = decorrelated.delay(attempt, previous)
+        assert 1 <= delay <= min(10, max(previous, 1) * 3)
+        previous = delay
+
+
+def test_parse_retry_after_formats():
+    assert parse_retry_after(make_response(429, **{"Retry-After": "7"})) == 7
+    date = "Tue, 14 Nov 2023 22:13:40 GMT"  # NOW + 20s
+    assert parse_retry_after(make_response(503, **{"Retry-After": date}), lambda: NOW) == 20
+    assert parse_retry_after(make_response(429, **{"RateLimit-Reset": "3"})) == 3
+    epoch = make_response(429, **{"X-RateLimit-Reset": str(int(NOW + 12))})
+    assert parse_retry_after(epoch, lambda: NOW) == 12
+    assert parse_retry_after(make_response(429)) is None
+
+
+def test_retry_after_only_honored_for_throttling_statuses():
+    backoff = ExponentialBackoff(base=1, cap=5, max_retry_after=60)
+    assert backoff.delay(1, response=make_response(429, **{"Retry-After": "30"})) == 30
+    assert backoff.delay(1, response=make_response(429, **{"Retry-After": "90"})) == 60
+    assert backoff.delay(1, response=make_response(500, **{"Retry-After": "30"})) == 1
+    ignoring = ExponentialBackoff(base=1, respect_retry_after=False)
+    assert ignoring.delay(1, response=make_response(429, **{"Retry-After": "30"})) == 1
@@ -0,0 +1,152 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests import Request, Session
+
+from wreqs import (
+    BodyTooLargeError,
+    MockAdapter,
+    MockResponse,
+    SpilledResponse,
+    wreq,
+    wreq_many,
+    wreq_map,
+    wreq_paginate,
+    wreqs_session,
+)
+from wreqs.fmt import prettify_response_str
+
+DOCUMENT = json.dumps({"items": list(range(50000))}).encode()
+
+
+# runs in a worker process, so it lives at module level
+def count_items(raw):
+    return len(raw.json()["items"])
+
+
+@pytest.fixture
+def base_url():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = DOCUMENT
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if self.path.startswith("/pages/"):
+                page = int(self.path.rsplit("/", 1)[1])
+                if page < 2:
+                    self.send_header("Link", f'</pages/{page + 1}>; rel="next"')
+            if self.path == "/gzip":
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            if self.path == "/chunked":
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for i in range(0, len(body), 8192):
+                    chunk = body[i : i + 8192]
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.wfile.write(b"0\r\n\r\n")
+                return
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_content_length_over_limit_fails_before_reading(base_url):
+    with pytest.raises(BodyTooLargeError) as info:
+        with wreq(Request("GET", f"{base_url}/plain"), max_body_size=1024):
+            pass
+    assert (info.value.limit, info.value.size) == (1024, len(DOCUMENT))
+
+    # within the limit the body is read as usual
+    with wreq(Request("GET", f"{base_url}/plain"), max_body_size=len(DOCUMENT)) as response:
+        assert response.json()["items"][-1] == 49999
+        assert len(response.body) == len(DOCUMENT) and not response.body.spilled
+
+
+@pytest.mark.parametrize("path", ["/chunked", "/gzip"])
+def test_limit_applies_to_decoded_bytes_read(base_url, path):
+    # neither response announces the decoded size; the gzip body is ~110 kB on the wire
+    with pytest.raises(BodyTooLargeError) as info:
+        with wreq(Request("GET", f"{base_url}{path}"), max_body_size=200000):
+            pass
+    assert info.value.size is None
+
+
+def test_large_bodies_spill_to_disk(base_url):
+    with wreqs_session(spill_threshold=4096):
+        for path in ("/plain", "/chunked"):
+            with wreq(Request("GET", f"{base_url}{path}")) as response:
+                assert isinstance(response, SpilledResponse) and response.body.spilled
+                body = response.body
+
+                view = body.getbuffer()
+                assert view[:10] == DOCUMENT[:10] and len(view) == len(DOCUMENT)
+                view.release()
+
+                buffer = bytearray(1000)
+                body.seek(-1000, 2)
+                assert body.readinto(buffer) == 1000 and buffer == DOCUMENT[-1000:]
+                assert body.readinto(buffer) == 0
+
+                assert b"".join(response.iter_content(65536)) == DOCUMENT
+                assert response.json()["items"][0] == 0
+                # logging reports the size instead of loading the body
+                assert f'"spilled":{len(DOCUMENT)}' in prettify_response_str(response)
+            assert body.closed
+
+    # small bodies stay in memory
+    with wreq(Request("GET", f"{base_url}/plain"), spill_threshold=len(DOCUMENT)) as response:
+        assert not isinstance(response, SpilledResponse)
+        assert response.body.getbuffer() == DOCUMENT
+
+
+def test_limit_on_responses_read_by_the_adapter():
+    mock = MockAdapter(default=MockResponse(200, b"x" * 2048, headers={"Content-Length": ""}))
+    session = mock.mount(Session())
+
+    with pytest.raises(BodyTooLargeError) as info:
+        with wreq(Request("GET", "https://api.example.com/"), session=session, max_body_size=1024):
+            pass
+    assert info.value.size == 2048
+
+
+def test_helpers_keep_spilled_bodies_usable(base_url):
+    urls = [f"{base_url}/plain", f"{base_url}/chunked"]
+    with wreqs_session(spill_threshold=4096):
+        results = list(wreq_many(Request("GET", url) for url in urls))
+        pages = list(wreq_paginate(Request("GET", f"{base_url}/pages/0")))
+        items = list(wreq_paginate(Request("GET", f"{base_url}/pages/0"), items="items"))
+        mapped = list(wreq_map((Request("GET", url) for url in urls), count_items, processes=1))
+
+    responses = [r.response for r in results] + pages
+    assert len(responses) == 5
+    for response in responses:
+        assert isinstance(response, SpilledResponse)
+        assert response.content == DOCUMENT and response.json()["items"][-1] == 49999
+        response.close()
+        assert response.body.closed
+    assert len(items) == 3 * 50000
+    assert [m.value for m in mapped] == [50000, 50000]
@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import requests
+from wreqs.breaker import CircuitBreaker, RetryBudget
+from wreqs.error import CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_on_failure_rate_and_recovers():
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_rate_threshold=0.5, minimum_requests=4, reset_timeout=10, clock=clock
+    )
+
+    for success in (True, False, True):
+        breaker.acquire("api")
+        breaker.record("api", success)
+    assert breaker.state("api") == "closed"
+
+    breaker.acquire("api")
+    breaker.record("api", False)
+    assert breaker.state("api") == "open"
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.acquire("api")
+    assert info.value.key == "api"
+    assert info.value.retry_in == pytest.approx(10)
+
+    # other keys are unaffected
+    breaker.acquire("other")
+    breaker.record("other", True)
+
+    clock.now += 10
+    assert breaker.state("api") == "half_open"
+    breaker.acquire("api")
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire("api")  # only one probe at a time
+    breaker.record("api", True)
+    assert breaker.state("api") == "closed"
+
+
+def test_breaker_half_open_failure_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(minimum_requests=1, reset_timeout=5, clock=clock)
+    breaker.acquire("api")
+    breaker.record("api", False)
+
+    clock.now += 5
+    breaker.acquire("api")
+    breaker.record("api", False)
+    assert breaker.state("api") == "open"
+
+
+def test_breaker_window_forgets_old_failures():
+    clock = FakeClock()
+    breaker = CircuitBreaker(minimum_requests=3, window=10, clock=clock)
+    for _ in range(2):
+        breaker.acquire("api")
+        breaker.record("api", False)
+
+    clock.now += 11
+    breaker.acquire("api")
+    breaker.record("api", False)
+    assert breaker.state("api") == "closed"
+
+
+def test_default_failure_classification():
+    breaker = CircuitBreaker()
+    ok, error = requests.Response(), requests.Response()
+    ok.status_code, error.status_code = 404, 503
+    assert not breaker.is_failure(ok, None)
+    assert breaker.is_failure(error, None)
+    assert breaker.is_failure(None, requests.ConnectionError())
+    assert not breaker.is_failure(None, ValueError())
+
+
+def test_retry_budget_caps_retries():
+    clock = FakeClock()
+    budget = RetryBudget(ratio=0.2, min_retries=1, window=10, clock=clock)
+    for _ in range(10):
+        budget.record_request()
+
+    assert [budget.try_retry() for _ in range(4)] == [True, True, True, False]
+
+    clock.now += 11
+    assert budget.try_retry()
+    assert not budget.try_retry()
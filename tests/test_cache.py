@@ -0,0 +1,110 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from typing import Dict, Optional
+
+from requests import Request
+
+from wreqs.cache import ResponseCache
+from wreqs.response import build_response
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def prepare(url: str = "http://example.com/a", headers: Optional[Dict] = None, method="GET"):
+    return Request(method, url, headers=headers).prepare()
+
+
+def respond(status: int = 200, body: bytes = b"body", **headers: str):
+    headers = {k.replace("_", "-"): v for k, v in headers.items()}
+    return build_response(status, body, headers, "http://example.com/a")
+
+
+def test_fresh_entry_is_served_until_max_age():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.update(prepare(), respond(Cache_Control="max-age=10"))
+
+    entry = cache.lookup(prepare())
+    assert entry is not None and cache.is_fresh(prepare(), entry)
+    cached = cache.to_response(entry, prepare())
+    assert cached.content == b"body" and cached.status_code == 200
+
+    clock.now += 11
+    assert cache.lookup(prepare()) is None  # no validators, evicted
+    assert cache.stats().evictions == 1
+
+
+def test_no_store_and_unsafe_methods_are_not_cached():
+    cache = ResponseCache()
+    cache.update(prepare(), respond(Cache_Control="no-store, max-age=10"))
+    cache.update(prepare(method="POST"), respond(Cache_Control="max-age=10"))
+    assert cache.stats().entries == 0
+
+    cache.update(prepare(), respond(Cache_Control="max-age=10"))
+    assert cache.lookup(prepare(headers={"Cache-Control": "no-store"})) is None
+
+
+def test_stale_entry_is_revalidated_with_etag():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.update(prepare(), respond(Cache_Control="max-age=10", ETag='"v1"'))
+    clock.now += 20
+
+    request = prepare()
+    entry = cache.lookup(request)
+    assert entry is not None and not cache.is_fresh(request, entry)
+    cache.add_validators(request, entry)
+    assert request.headers["If-None-Match"] == '"v1"'
+
+    before = cache.stats().bytes
+    merged = cache.update(request, respond(304, b"", Cache_Control="max-age=30", Via="1.1 edge"), entry)
+    assert merged.status_code == 200 and merged.content == b"body"
+    refreshed = cache.lookup(prepare())
+    assert cache.is_fresh(prepare(), refreshed)
+    assert cache.stats().revalidations == 1
+
+    # the entry other threads may still be reading is left untouched
+    assert refreshed is not entry and entry.headers["Cache-Control"] == "max-age=10"
+    assert cache.stats().bytes == refreshed.size == before + len("Via") + len("1.1 edge")
+
+
+def test_request_no_cache_forces_revalidation():
+    cache = ResponseCache()
+    cache.update(prepare(), respond(Cache_Control="max-age=60", ETag='"v1"'))
+    request = prepare(headers={"Cache-Control": "no-cache"})
+    entry = cache.lookup(request)
+    assert entry is not None and not cache.is_fresh(request, entry)
+
+
+def test_vary_headers_must_match():
+    cache = ResponseCache()
+    request = prepare(headers={"Accept-Language": "en"})
+    cache.update(request, respond(Cache_Control="max-age=60", Vary="Accept-Language"))
+
+    assert cache.lookup(prepare(headers={"Accept-Language": "en"})) is not None
+    assert cache.lookup(prepare(headers={"Accept-Language": "fr"})) is None
+
+
+def test_lru_eviction_respects_max_bytes():
+    cache = ResponseCache(max_bytes=300)
+    for name in "abc":
+        cache.update(
+            prepare(f"http://example.com/{name}"),
+            respond(body=b"x" * 100, Cache_Control="max-age=60"),
+        )
+        cache.lookup(prepare("http://example.com/a"))  # keep "a" hot
+
+    stats = cache.stats()
+    assert stats.bytes <= 300 and stats.evictions >= 1
+    assert cache.lookup(prepare("http://example.com/a")) is not None
+    assert cache.lookup(prepare("http://example.com/b")) is None
@@ -0,0 +1,129 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import logging
+
+import pytest
+import requests
+from requests import Request, Session
+from requests.adapters import BaseAdapter
+
+from wreqs import JSONCodec, get_json_codec, set_json_codec, wreq
+from wreqs.response import build_response
+
+
+class BodyAdapter(BaseAdapter):
+    def __init__(self, body: bytes, encoding=None) -> None:
+        super().__init__()
+        self.body = body
+        self.encoding = encoding
+
+    def send(self, request, **kwargs):
+        return build_response(200, self.body, {}, request.url, encoding=self.encoding, request=request)
+
+    def close(self) -> None:
+        pass
+
+
+def session_with(adapter: BaseAdapter) -> Session:
+    session = Session()
+    session.mount("https://", adapter)
+    return session
+
+
+@pytest.fixture
+def counting_codec():
+    calls = []
+
+    def loads(doc):
+        calls.append(doc)
+        return json.loads(doc)
+
+    set_json_codec(JSONCodec("counting", loads, json.dumps))
+    try:
+        yield calls
+    finally:
+        set_json_codec()
+
+
+REQ = Request("GET", "https://api.example.com/items")
+
+
+def test_codec_selection():
+    try:
+        assert set_json_codec("json").name == "json"
+        assert get_json_codec().loads(b'{"a": 1}') == {"a": 1}
+        with pytest.raises(ValueError):
+            set_json_codec("simdjson")
+        assert set_json_codec("auto").name in ("orjson", "ujson", "json")
+    finally:
+        set_json_codec()
+    assert get_json_codec().name == "json"
+
+
+def test_body_is_decoded_once(counting_codec, caplog):
+    session = session_with(BodyAdapter(b'{"items": [1, 2, 3]}'))
+    seen = []
+
+    def check(response):
+        seen.append(response.json())
+        return False
+
+    with caplog.at_level(logging.INFO, logger="wreqs.context"):
+        with wreq(REQ, session=session, check_retry=check) as response:
+            assert response.json() is seen[0]
+            assert response.json() == {"items": [1, 2, 3]}
+
+    # the log summary counts the parsed object's keys
+    assert any('"content":1' in r.getMessage() for r in caplog.records)
+    assert len(counting_codec) == 1
+
+
+def test_invalid_json_raises_requests_error_once(counting_codec, caplog):
+    session = session_with(BodyAdapter(b"<html>busy</html>"))
+
+    with caplog.at_level(logging.INFO, logger="wreqs.context"):
+        with wreq(REQ, session=session) as response:
+            for _ in range(2):
+                with pytest.raises(requests.JSONDecodeError):
+                    response.json()
+
+    # logged as text instead
+    assert any('"content":17' in r.getMessage() for r in caplog.records)
+    assert len(counting_codec) == 1
+
+
+def test_declared_non_utf8_encoding_is_honored():
+    body = '{"name": "Zoë"}'.encode("latin-1")
+    with wreq(REQ, session=session_with(BodyAdapter(body, encoding="latin-1"))) as response:
+        assert response.json() == {"name": "Zoë"}
+        # keyword arguments go to requests' own decoder
+        assert response.json(parse_float=str) == {"name": "Zoë"}
+
+
+def test_results_match_the_standard_library():
+    body = b'{"id": 123456789012345678901234567890, "x": NaN}'
+
+    # the default codec keeps big integers exact and accepts NaN
+    with wreq(REQ, session=session_with(BodyAdapter(body))) as response:
+        document = response.json()
+    assert document["id"] == 123456789012345678901234567890 and document["x"] != document["x"]
+
+    def strict_loads(doc):
+        return json.loads(doc, parse_constant=lambda name: json.loads("x"))
+
+    # a document another codec rejects is decoded again by the standard library
+    set_json_codec(JSONCodec("strict", strict_loads, json.dumps))
+    try:
+        with wreq(REQ, session=session_with(BodyAdapter(body))) as response:
+            document = response.json()
+        assert document["id"] == 123456789012345678901234567890
+        with wreq(REQ, session=session_with(BodyAdapter(b"{"))) as response:
+            with pytest.raises(requests.JSONDecodeError):
+                response.json()
+    finally:
+        set_json_codec()
@@ -0,0 +1,141 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import gzip
+import io
+import json
+import os
+import zlib
+
+from requests import Request, Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3 import HTTPResponse
+
+from wreqs import CompressionPolicy, ExponentialBackoff, MetricsHook, wreq, wreqs_session
+from wreqs.response import build_response
+
+EVENTS = [{"id": i, "type": "click", "page": "/home"} for i in range(200)]
+
+
+def prepare(method="POST", **kwargs):
+    return Session().prepare_request(Request(method, "https://ingest.example.com/batch", **kwargs))
+
+
+def test_large_bodies_are_compressed():
+    policy = CompressionPolicy(min_size=100)
+    prepared = prepare(json=EVENTS)
+
+    compressed = policy.apply(prepared)
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Content-Length"] == str(len(compressed.body))
+    assert json.loads(gzip.decompress(compressed.body)) == EVENTS
+    assert "Content-Encoding" not in prepared.headers  # original left untouched
+
+    form = CompressionPolicy(encoding="deflate", min_size=100).apply(
+        prepare(data={"q": "x" * 500})
+    )
+    assert zlib.decompress(form.body) == b"q=" + b"x" * 500
+
+
+def test_small_incompressible_and_get_bodies_are_left_alone():
+    policy = CompressionPolicy(min_size=100)
+    assert policy.apply(prepare(json={"a": 1})) is None
+    assert policy.apply(prepare(data=os.urandom(4096))) is None
+    assert policy.apply(prepare("GET", params={"q": "x" * 500})) is None
+    assert policy.apply(prepare(data=io.BytesIO(b"x" * 4096))) is None
+
+
+class RecordingAdapter(BaseAdapter):
+    def __init__(self, reject_compressed: bool = False) -> None:
+        super().__init__()
+        self.reject_compressed = reject_compressed
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        encoding = request.headers.get("Content-Encoding")
+        self.sent.append((encoding, len(request.body)))
+        status = 415 if encoding and self.reject_compressed else 200
+        return build_response(status, b"", {}, request.url, request=request)
+
+    def close(self) -> None:
+        pass
+
+
+def test_415_resends_uncompressed_and_is_remembered():
+    adapter = RecordingAdapter(reject_compressed=True)
+    session = Session()
+    session.mount("https://", adapter)
+    policy = CompressionPolicy(min_size=100)
+    req = Request("POST", "https://ingest.example.com/batch", json=EVENTS)
+
+    with wreq(req, session=session, compress=policy) as response:
+        assert response.status_code == 200
+    with wreq(req, session=session, compress=policy) as response:
+        assert response.status_code == 200
+
+    raw_size = len(json.dumps(EVENTS))
+    assert adapter.sent[0][0] == "gzip" and adapter.sent[0][1] < raw_size
+    assert adapter.sent[1:] == [(None, raw_size), (None, raw_size)]
+
+
+def test_session_policy_and_per_call_opt_out():
+    req = Request("POST", "https://ingest.example.com/batch", json=EVENTS)
+    with wreqs_session(compress=True) as session:
+        adapter = RecordingAdapter()
+        session.mount("https://", adapter)
+        with wreq(req):
+            pass
+        with wreq(req, compress=False):
+            pass
+    assert [encoding for encoding, _ in adapter.sent] == ["gzip", None]
+
+
+class GzipAdapter(HTTPAdapter):
+    def __init__(self, body: bytes) -> None:
+        super().__init__()
+        self.body = body
+
+    def send(self, request, **kwargs):
+        compressed = gzip.compress(self.body)
+        raw = HTTPResponse(
+            body=io.BytesIO(compressed),
+            headers={"Content-Encoding": "gzip", "Content-Length": str(len(compressed))},
+            status=200,
+            preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+def test_metrics_report_wire_and_decoded_sizes():
+    attempts, requests = [], []
+
+    class Hook(MetricsHook):
+        def on_attempt(self, info):
+            attempts.append(info)
+
+        def on_request(self, info):
+            requests.append(info)
+
+    body = json.dumps(EVENTS).encode()
+    session = Session()
+    session.mount("https://", GzipAdapter(body))
+
+    with wreq(
+        Request("GET", "https://api.example.com/events"),
+        session=session,
+        metrics=Hook(),
+        check_retry=lambda r: len(attempts) < 2,
+        backoff=ExponentialBackoff(base=0),
+    ):
+        pass
+
+    wire_size = len(gzip.compress(body))
+    assert len(attempts) == 2
+    assert attempts[0].bytes_in == len(body)
+    assert attempts[0].wire_bytes_in == wire_size
+    # the request reports the totals over both attempts
+    assert requests[0].bytes_in == 2 * len(body)
+    assert requests[0].wire_bytes_in == 2 * wire_size
@@ -0,0 +1,158 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+import time
+
+import pytest
+from requests import ReadTimeout, Request, Session, Timeout
+from requests.adapters import BaseAdapter
+
+from wreqs import (
+    DeadlineExceededError,
+    ExponentialBackoff,
+    awreq,
+    time_left,
+    wreq,
+    wreqs_deadline,
+)
+from wreqs.aio import AsyncSession, AsyncTransport
+from wreqs.response import build_response
+
+
+class RecordingAdapter(BaseAdapter):
+    def __init__(self, status: int = 200, delay: float = 0.0, hang: bool = False) -> None:
+        super().__init__()
+        self.status = status
+        self.delay = delay
+        self.hang = hang
+        self.timeouts = []
+
+    def send(self, request, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        if self.hang:
+            time.sleep(timeout[1] if isinstance(timeout, tuple) else timeout)
+            raise ReadTimeout("read timed out")
+        time.sleep(self.delay)
+        return build_response(self.status, b"", {}, request.url, request=request)
+
+    def close(self) -> None:
+        pass
+
+
+def session_with(adapter: BaseAdapter) -> Session:
+    session = Session()
+    session.mount("https://", adapter)
+    return session
+
+
+REQ = Request("GET", "https://api.example.com/")
+
+
+def test_attempt_timeout_shrinks_to_time_left():
+    adapter = RecordingAdapter()
+    with wreq(REQ, session=session_with(adapter), timeout=5, total_timeout=1.0):
+        pass
+    with wreq(REQ, session=session_with(adapter), timeout=(0.5, 10), total_timeout=2.0):
+        pass
+    with wreq(REQ, session=session_with(adapter), timeout=0.1, total_timeout=2.0):
+        pass
+
+    assert 0.9 < adapter.timeouts[0] <= 1.0
+    connect, read = adapter.timeouts[1]
+    assert connect == 0.5 and 1.9 < read <= 2.0
+    assert adapter.timeouts[2] == 0.1
+
+
+def test_deadline_bounds_retry_loop():
+    adapter = RecordingAdapter(status=503, delay=0.05)
+    check = lambda r: r.status_code == 503  # noqa: E731
+
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        with wreq(
+            REQ,
+            session=session_with(adapter),
+            max_retries=100,
+            check_retry=check,
+            total_timeout=0.2,
+        ):
+            pass
+    assert time.monotonic() - started < 0.35
+    assert 2 <= len(adapter.timeouts) <= 5
+    assert isinstance(exc_info.value, Timeout)
+
+
+def test_backoff_past_deadline_fails_without_sleeping():
+    sleeps = []
+    adapter = RecordingAdapter(status=503)
+    with pytest.raises(DeadlineExceededError):
+        with wreq(
+            REQ,
+            session=session_with(adapter),
+            check_retry=lambda r: True,
+            backoff=ExponentialBackoff(base=5.0, sleep=sleeps.append),
+            total_timeout=1.0,
+        ):
+            pass
+    assert sleeps == [] and len(adapter.timeouts) == 1
+
+
+def test_timeout_at_deadline_is_reported_as_deadline_exceeded():
+    adapter = RecordingAdapter(hang=True)
+    with pytest.raises(DeadlineExceededError) as exc_info:
+        with wreq(REQ, session=session_with(adapter), timeout=5, total_timeout=0.05):
+            pass
+    assert isinstance(exc_info.value.__cause__, ReadTimeout)
+
+
+def test_nested_calls_inherit_deadline():
+    adapter = RecordingAdapter()
+    session = session_with(adapter)
+    assert time_left() is None
+
+    with wreqs_deadline(1.0):
+        with wreqs_deadline(10.0) as deadline:
+            # nested scopes can only shorten the deadline
+            assert deadline <= time.monotonic() + 1.0
+            with wreq(REQ, session=session):
+                with wreq(REQ, session=session, total_timeout=0.5):
+                    assert 0 < time_left() <= 0.5
+                    with wreq(REQ, session=session):
+                        pass
+            assert 0.5 < time_left() <= 1.0
+    assert time_left() is None
+
+    first, second, third = adapter.timeouts
+    assert 0.9 < first <= 1.0
+    assert second <= 0.5 and third <= 0.5
+
+
+def test_passed_deadline_fails_before_sending():
+    adapter = RecordingAdapter()
+    with pytest.raises(DeadlineExceededError):
+        with wreq(REQ, session=session_with(adapter), deadline=time.monotonic() - 1):
+            pass
+    assert adapter.timeouts == []
+
+
+def test_awreq_inherits_deadline():
+    timeouts = []
+
+    class OkTransport(AsyncTransport):
+        async def send(self, request, timeout, proxies, verify, cert):
+            timeouts.append(timeout)
+            return build_response(200, b"", {}, request.url, request=request)
+
+    async def main():
+        session = AsyncSession(Session(), OkTransport())
+        with wreqs_deadline(1.0):
+            async with awreq(REQ, session=session, timeout=(0.2, 5)):
+                pass
+
+    asyncio.run(main())
+    connect, read = timeouts[0]
+    assert connect == 0.2 and 0.9 < read <= 1.0
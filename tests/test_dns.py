@@ -0,0 +1,148 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from requests import Request
+
+from wreqs import DNSCache, SessionPool, wreq, wreqs_session
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeResolver:
+    """Resolves names in `hosts` to 127.0.0.1; anything else fails like a real resolver."""
+
+    def __init__(self, *hosts: str) -> None:
+        self.hosts = set(hosts)
+        self.calls = []
+
+    def __call__(self, host, port, family=0, type=0, proto=0, flags=0):
+        self.calls.append(host)
+        if host not in self.hosts:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+
+def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_entries_expire_after_ttl():
+    clock, resolver = FakeClock(), FakeResolver("api.test")
+    cache = DNSCache(ttl=10, refresh_ahead=None, resolver=resolver, clock=clock)
+
+    first = cache.resolve("api.test", 443)
+    assert cache.resolve("API.test", 443) == first
+    clock.now = 10.0
+    cache.resolve("api.test", 443)
+
+    assert resolver.calls == ["api.test", "api.test"]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+
+def test_failures_are_cached_briefly():
+    clock, resolver = FakeClock(), FakeResolver()
+    cache = DNSCache(negative_ttl=5, resolver=resolver, clock=clock)
+
+    for _ in range(3):
+        with pytest.raises(socket.gaierror):
+            cache.resolve("gone.test", 443)
+    clock.now = 5.0
+    with pytest.raises(socket.gaierror):
+        cache.resolve("gone.test", 443)
+
+    assert len(resolver.calls) == 2
+    assert cache.stats().negative_hits == 2
+
+
+def test_refresh_ahead_runs_in_the_background():
+    clock, resolver = FakeClock(), FakeResolver("api.test")
+    cache = DNSCache(ttl=10, refresh_ahead=0.5, resolver=resolver, clock=clock)
+    cache.resolve("api.test", 443)
+
+    clock.now = 6.0
+    assert cache.resolve("api.test", 443)  # served from the cache at once
+    wait_for(lambda: cache.stats().refreshes == 1)
+    clock.now = 10.5  # past the original expiry, within the refreshed one
+    cache.resolve("api.test", 443)
+    assert resolver.calls == ["api.test", "api.test"]
+
+    # a failing refresh keeps the old addresses until they expire
+    resolver.hosts.clear()
+    clock.now = 11.5
+    cache.resolve("api.test", 443)
+    wait_for(lambda: cache.stats().refresh_errors == 1)
+    assert cache.resolve("api.test", 443)
+    assert cache.stats().hits == 4
+
+
+def test_max_size_drops_least_recently_used():
+    cache = DNSCache(max_size=2, resolver=FakeResolver("a.test", "b.test", "c.test"))
+    for host in ("a.test", "b.test", "a.test", "c.test"):
+        cache.resolve(host, 80)
+    cache.resolve("a.test", 80)
+    assert cache.stats().misses == 3
+
+
+@pytest.fixture
+def server_port():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sessions_resolve_through_the_cache(server_port):
+    resolver = FakeResolver("api.test")
+    cache = DNSCache(resolver=resolver)
+    url = f"http://api.test:{server_port}/"
+
+    with wreqs_session(dns_cache=cache):
+        for _ in range(3):  # the server closes every connection
+            with wreq(Request("GET", url)) as response:
+                assert response.text == "ok"
+        with pytest.raises(requests.ConnectionError):
+            with wreq(Request("GET", f"http://gone.test:{server_port}/")):
+                pass
+
+    sessions = SessionPool(dns_cache=cache)
+    with wreq(Request("GET", url), session=sessions) as response:
+        assert response.text == "ok"
+    sessions.close()
+
+    assert resolver.calls == ["api.test", "gone.test"]
+    assert cache.stats().hits == 3
@@ -0,0 +1,183 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import io
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests import HTTPError, Request
+from requests.exceptions import ChunkedEncodingError
+
+from wreqs import (
+    DeadlineExceededError,
+    DownloadError,
+    ExponentialBackoff,
+    wreq,
+    wreq_download,
+)
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MiB
+
+
+@pytest.fixture
+def file_server():
+    """Serves PAYLOAD with Range support; `drops` cuts the next N responses short."""
+    state = {"drops": 0, "ranges": True, "seen": [], "if_range": [], "etags": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if self.path != "/export":
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            range_header = self.headers.get("Range")
+            state["seen"].append(range_header)
+            state["if_range"].append(self.headers.get("If-Range"))
+            start = 0
+            if range_header and state["ranges"]:
+                start = int(range_header.split("=")[1].rstrip("-"))
+                if start >= len(PAYLOAD):
+                    self.send_response(416)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header(
+                    "Content-Range", f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}"
+                )
+            else:
+                self.send_response(200)
+            body = PAYLOAD[start:]
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", state["etags"].pop(0) if state["etags"] else '"v1"')
+            self.end_headers()
+            if state["drops"]:
+                state["drops"] -= 1
+                self.wfile.write(body[: len(body) // 3])
+                self.wfile.flush()
+                self.close_connection = True
+                self.connection.shutdown(2)
+                return
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://localhost:{server.server_address[1]}/export", state
+    server.shutdown()
+
+
+def test_download_resumes_after_dropped_connection(file_server, tmp_path):
+    url, state = file_server
+    state["drops"] = 2
+    dest = tmp_path / "export.bin"
+    progress = []
+
+    result = wreq_download(
+        Request("GET", url), dest, chunk_size=64 * 1024, progress=lambda n, t: progress.append(n)
+    )
+
+    assert dest.read_bytes() == PAYLOAD
+    assert result.size == len(PAYLOAD) and result.total == len(PAYLOAD)
+    assert result.resumes == 2 and result.restarts == 0
+    assert state["seen"][0] is None and state["seen"][1].startswith("bytes=")
+    assert progress[-1] == len(PAYLOAD)
+
+
+def test_download_restarts_when_server_ignores_range(file_server):
+    url, state = file_server
+    state["drops"] = 1
+    state["ranges"] = False
+    buffer = io.BytesIO()
+
+    result = wreq_download(Request("GET", url), buffer, chunk_size=64 * 1024)
+
+    assert buffer.getvalue() == PAYLOAD
+    assert result.restarts == 1
+
+
+def test_download_refreshes_validator_on_restart(file_server):
+    url, state = file_server
+    state.update(drops=2, ranges=False, etags=['"v1"', '"v2"'])
+    buffer = io.BytesIO()
+
+    result = wreq_download(Request("GET", url), buffer, chunk_size=64 * 1024)
+
+    assert buffer.getvalue() == PAYLOAD and result.restarts == 2
+    # the restarted transfer is resumed against the new representation
+    assert state["if_range"] == [None, '"v1"', '"v2"']
+
+
+def test_download_to_callback_cannot_restart(file_server):
+    url, state = file_server
+    state["drops"] = 1
+    state["ranges"] = False
+
+    with pytest.raises(DownloadError):
+        wreq_download(Request("GET", url), lambda chunk: None, chunk_size=64 * 1024)
+
+
+def test_download_resume_existing_file(file_server, tmp_path):
+    url, state = file_server
+    dest = tmp_path / "export.bin"
+    dest.write_bytes(PAYLOAD[:1000])
+
+    result = wreq_download(Request("GET", url), dest, resume=True)
+    assert dest.read_bytes() == PAYLOAD
+    assert state["seen"] == ["bytes=1000-"]
+
+    result = wreq_download(Request("GET", url), dest, resume=True)
+    assert result.size == len(PAYLOAD)
+
+
+def test_download_gives_up_and_raises_http_errors(file_server):
+    url, state = file_server
+    state["drops"] = 10
+
+    with pytest.raises(ChunkedEncodingError):
+        wreq_download(Request("GET", url), io.BytesIO(), max_retries=2)
+    assert len(state["seen"]) == 3
+
+    with pytest.raises(HTTPError):
+        wreq_download(Request("GET", url.replace("/export", "/missing")), io.BytesIO())
+
+
+def test_download_does_not_retry_past_its_deadline(file_server):
+    url, state = file_server
+    slept = []
+    backoff = ExponentialBackoff(base=1, sleep=slept.append)
+
+    with pytest.raises(DeadlineExceededError):
+        wreq_download(
+            Request("GET", url), io.BytesIO(), backoff=backoff, deadline=time.monotonic() - 1
+        )
+    assert state["seen"] == [] and slept == []
+
+    # each backoff sleep is cut to the time left
+    state["drops"] = 10
+    with pytest.raises(ChunkedEncodingError):
+        wreq_download(
+            Request("GET", url), io.BytesIO(), max_retries=2, backoff=backoff, total_timeout=1.5
+        )
+    assert slept[0] == 1 and 0 < slept[1] < 1.5  # 2 without the deadline
+
+
+def test_stream_response_is_not_read_for_logging(file_server, caplog):
+    url, _ = file_server
+
+    with caplog.at_level(logging.INFO, logger="wreqs.context"):
+        with wreq(Request("GET", url), stream=True) as response:
+            assert response._content is False
+            assert sum(len(c) for c in response.iter_content(65536)) == len(PAYLOAD)
+    assert f'"stream":"{len(PAYLOAD)}"' in caplog.text
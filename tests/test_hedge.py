@@ -0,0 +1,177 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import threading
+
+import pytest
+from requests import ConnectionError, Request, Session
+from requests.adapters import BaseAdapter
+
+from wreqs import HedgePolicy, wreq, wreqs_session
+from wreqs.hedge import hedged_send, policy_for
+from wreqs.response import build_response
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Each send takes the next (gate, body) step; a step with a gate blocks until it is set."""
+
+    def __init__(self, steps) -> None:
+        super().__init__()
+        self.steps = list(steps)
+        self.sent = []
+        self.responses = []
+        self.closed = []
+        self.lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.sent.append(kwargs.get("proxies"))
+            gate, body = self.steps.pop(0)
+        if gate is not None:
+            gate.wait(5)
+        if isinstance(body, Exception):
+            raise body
+        response = build_response(200, body, {}, request.url, request=request)
+        response.close = lambda: self.closed.append(body)
+        self.responses.append(response)
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def session_with(adapter: ScriptedAdapter) -> Session:
+    session = Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def test_slow_primary_is_hedged_and_loser_discarded():
+    gate = threading.Event()
+    adapter = ScriptedAdapter([(gate, b"primary"), (None, b"hedge")])
+    req = Request("GET", "https://api.example.com/item")
+
+    with wreq(req, session=session_with(adapter), hedge_after=0.02) as response:
+        assert response.content == b"hedge"
+
+    gate.set()
+    for _ in range(100):
+        if adapter.closed:
+            break
+        threading.Event().wait(0.01)
+    assert adapter.closed == [b"primary"]
+
+
+def test_fast_primary_sends_no_hedge():
+    adapter = ScriptedAdapter([(None, b"primary")])
+    req = Request("GET", "https://api.example.com/item")
+
+    with wreq(req, session=session_with(adapter), hedge_after=1.0) as response:
+        assert response.content == b"primary"
+    assert len(adapter.sent) == 1
+
+
+def test_requests_with_body_are_never_hedged():
+    gate = threading.Event()
+    threading.Timer(0.1, gate.set).start()
+    adapter = ScriptedAdapter([(gate, b"primary")])
+    req = Request("POST", "https://api.example.com/item", json={"a": 1})
+
+    with wreq(req, session=session_with(adapter), hedge_after=0.01) as response:
+        assert response.content == b"primary"
+    assert len(adapter.sent) == 1
+
+
+def test_hedges_use_next_proxy():
+    gate = threading.Event()
+    adapter = ScriptedAdapter([(gate, b"primary"), (None, b"hedge")])
+    req = Request("GET", "https://api.example.com/item")
+    proxies = ["http://p1:8080", "http://p2:8080"]
+
+    with wreq(
+        req, session=session_with(adapter), proxies=proxies, hedge_after=0.02
+    ) as response:
+        assert response.content == b"hedge"
+    gate.set()
+    assert [p["https"] for p in adapter.sent] == proxies
+
+
+def test_both_attempts_failing_raises_primary_error():
+    gate = threading.Event()
+    threading.Timer(0.1, gate.set).start()
+    adapter = ScriptedAdapter(
+        [(gate, ConnectionError("primary")), (None, ConnectionError("hedge"))]
+    )
+    req = Request("GET", "https://api.example.com/item")
+
+    with pytest.raises(ConnectionError, match="primary"):
+        with wreq(req, session=session_with(adapter), hedge_after=0.02):
+            pass
+
+
+def test_hedge_rate_is_capped():
+    policy = HedgePolicy(delay=0.01, max_hedge_ratio=0, min_hedges=1)
+    gates = [threading.Event() for _ in range(3)]
+    adapter = ScriptedAdapter(
+        [(gates[0], b"slow"), (None, b"hedge"), (gates[1], b"slow-again")]
+    )
+    threading.Timer(0.1, gates[1].set).start()
+    req = Request("GET", "https://api.example.com/item")
+
+    with wreqs_session(hedge_after=policy) as session:
+        session.mount("https://", adapter)
+        with wreq(req) as response:
+            assert response.content == b"hedge"
+        with wreq(req) as response:
+            assert response.content == b"slow-again"
+    gates[0].set()
+    assert len(adapter.sent) == 3
+
+
+def test_learned_delay_follows_percentile_per_host():
+    policy = HedgePolicy(percentile=0.9, min_samples=10)
+    for i in range(9):
+        policy.record_latency("a", i / 100)
+    assert policy.delay("a") is None
+
+    policy.record_latency("a", 0.09)
+    assert policy.delay("a") == pytest.approx(0.08)
+    assert policy.delay("b") is None
+    assert HedgePolicy(delay=0.5).delay("a") == 0.5
+
+
+def test_only_successful_latencies_are_learned():
+    policy = HedgePolicy(min_samples=1)
+    prepared = Request("GET", "https://api.example.com/item").prepare()
+
+    def answer(status):
+        return lambda request, kwargs: build_response(status, b"", {}, request.url)
+
+    hedged_send(policy, "a", answer(503), prepared, {}, dict)
+    assert policy.delay("a") is None
+    hedged_send(policy, "a", answer(200), prepared, {}, dict)
+    assert policy.delay("a") is not None
+
+
+def test_hedged_sends_share_the_policy_threads():
+    policy = HedgePolicy(delay=0.001, max_workers=2, min_hedges=100)
+    adapter = ScriptedAdapter([(None, b"ok")] * 40)
+    req = Request("GET", "https://api.example.com/item")
+
+    with wreqs_session(hedge_after=policy) as session:
+        session.mount("https://", adapter)
+        for _ in range(10):
+            with wreq(req) as response:
+                assert response.content == b"ok"
+    assert len(policy._workers._executor._threads) <= 2
+
+
+def test_fixed_delays_share_one_thread_pool():
+    policies = [policy_for(0.5 + i / 1000) for i in range(200)]
+
+    assert len({p.fixed_delay for p in policies}) == 200
+    assert len({id(p._workers) for p in policies}) == 1
+    assert len({id(p.budget) for p in policies}) == 1
@@ -0,0 +1,151 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import logging
+import types
+
+import pytest
+from requests import Request, Session
+from requests.adapters import BaseAdapter
+
+import wreqs.context
+import wreqs.logs
+from wreqs import StructuredFormatter, configure_logger, wreq
+from wreqs.logs import LogSettings, set_log_settings, stop_async_logging
+from wreqs.response import build_response
+
+REQ = Request("GET", "https://api.example.com/items")
+
+
+class StatusAdapter(BaseAdapter):
+    def __init__(self, *statuses: int) -> None:
+        super().__init__()
+        self.statuses = list(statuses)
+
+    def send(self, request, **kwargs):
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return build_response(status, b"{}", {}, request.url, request=request)
+
+    def close(self) -> None:
+        pass
+
+
+def session_with(adapter: BaseAdapter) -> Session:
+    session = Session()
+    session.mount("https://", adapter)
+    return session
+
+
+@pytest.fixture
+def restore_logger():
+    original = wreqs.context.logger
+    handlers = original.handlers[:]
+    level = original.level
+    yield original
+    stop_async_logging()
+    set_log_settings(LogSettings())
+    wreqs.context.logger = original
+    for handler in original.handlers[:]:
+        original.removeHandler(handler)
+    for handler in handlers:
+        original.addHandler(handler)
+    original.setLevel(level)
+
+
+def test_structured_summaries_are_sampled(restore_logger, caplog):
+    configure_logger(custom_logger=restore_logger, structured=True, sample_successes=3)
+    session = session_with(StatusAdapter(200))
+
+    with caplog.at_level(logging.INFO, logger="wreqs.context"):
+        for _ in range(6):
+            with wreq(REQ, session=session):
+                pass
+
+    # step messages are DEBUG now; only the sampled summaries remain
+    assert len(caplog.records) == 2
+    record = caplog.records[0]
+    assert record.getMessage() == "GET api.example.com -> 200"
+    assert (record.method, record.host, record.status, record.attempt) == (
+        "GET",
+        "api.example.com",
+        200,
+        1,
+    )
+    assert len(record.request_id) == 12 and record.elapsed >= 0
+    assert caplog.records[0].request_id != caplog.records[1].request_id
+
+
+def test_retries_and_failures_are_always_logged(restore_logger, caplog):
+    configure_logger(custom_logger=restore_logger, structured=True, sample_successes=1000)
+    session = session_with(StatusAdapter(503, 200))
+
+    with caplog.at_level(logging.INFO, logger="wreqs.context"):
+        with wreq(REQ, session=session, check_retry=lambda r: r.status_code >= 500):
+            pass
+        with wreq(REQ, session=session_with(StatusAdapter(500))):
+            pass
+
+    retry, retried, failed = caplog.records
+    assert retry.levelno == logging.WARNING and retry.status == 503
+    assert retry.request_id == retried.request_id
+    assert (retried.levelno, retried.status, retried.attempt) == (logging.INFO, 200, 2)
+    assert (failed.levelno, failed.status) == (logging.WARNING, 500)
+
+
+def test_plain_step_messages_are_sampled(restore_logger, caplog):
+    configure_logger(custom_logger=restore_logger, sample_successes=3)
+    session = session_with(StatusAdapter(200))
+
+    with caplog.at_level(logging.INFO, logger="wreqs.context"):
+        for _ in range(6):
+            with wreq(REQ, session=session):
+                pass
+        with wreq(REQ, session=session_with(StatusAdapter(500))):
+            pass
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert sum(m.startswith("Entering RequestContext") for m in messages) == 2
+    # no summary for successes; the failure always gets one
+    assert [m for m in messages if " -> " in m] == ["GET api.example.com -> 500"]
+
+
+def test_disabled_logging_skips_request_fields(restore_logger, monkeypatch):
+    def fail(*args):
+        raise AssertionError("computed although nothing is logged")
+
+    monkeypatch.setattr(wreqs.logs, "os", types.SimpleNamespace(urandom=fail))
+    monkeypatch.setattr(wreqs.logs, "host_key", fail)
+    restore_logger.setLevel(logging.ERROR)
+
+    with wreq(REQ, session=session_with(StatusAdapter(200))) as response:
+        assert response.status_code == 200
+
+
+def test_structured_formatter_writes_json_lines():
+    record = logging.makeLogRecord(
+        {"name": "wreqs.context", "levelno": logging.INFO, "levelname": "INFO",
+         "msg": "%s done", "args": ("GET",), "status": 200, "host": "api.example.com"}
+    )
+    doc = json.loads(StructuredFormatter().format(record))
+    assert doc["message"] == "GET done"
+    assert doc["status"] == 200 and doc["host"] == "api.example.com"
+    assert doc["level"] == "INFO" and "msg" not in doc
+
+
+def test_async_handler_writes_in_the_background(restore_logger, tmp_path):
+    path = tmp_path / "wreqs.log"
+    configure_logger(filename=str(path), structured=True, async_handler=True)
+    handler = restore_logger.handlers[0]
+    assert handler.__class__.__name__ == "_DroppingQueueHandler"
+
+    with wreq(REQ, session=session_with(StatusAdapter(200))):
+        pass
+    stop_async_logging()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["status"] for line in lines] == [200]
+    assert lines[0]["message"] == "GET api.example.com -> 200"
@@ -0,0 +1,187 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import threading
+import time
+
+import pytest
+from requests import ConnectionError, Request, Session
+from requests.adapters import BaseAdapter
+
+from wreqs import MetricsHook, MetricsRegistry, ResponseCache, wreq, wreq_many, wreqs_session
+from wreqs.response import build_response
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Answers with the given statuses (or raises exceptions) in turn."""
+
+    def __init__(self, *outcomes, delay: float = 0.0) -> None:
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.delay = delay
+
+    def send(self, request, **kwargs):
+        time.sleep(self.delay)
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return build_response(
+            outcome, b"x" * 10, {"Cache-Control": "max-age=60"}, request.url, request=request
+        )
+
+    def close(self):
+        pass
+
+
+def session_with(adapter: BaseAdapter) -> Session:
+    session = Session()
+    session.mount("https://", adapter)
+    return session
+
+
+class Recorder(MetricsHook):
+    def __init__(self) -> None:
+        self.attempts = []
+        self.requests = []
+
+    def on_attempt(self, info):
+        self.attempts.append(info)
+
+    def on_request(self, info):
+        self.requests.append(info)
+
+
+def test_hook_receives_attempts_and_request():
+    recorder = Recorder()
+    session = session_with(ScriptedAdapter(503, 200))
+    req = Request("POST", "https://api.example.com/jobs", data="payload")
+
+    with wreq(
+        req, session=session, metrics=recorder, check_retry=lambda r: r.status_code != 200
+    ):
+        pass
+
+    first, second = recorder.attempts
+    assert (first.status, first.attempt, first.retry_reason) == (503, 1, None)
+    assert (second.status, second.attempt, second.retry_reason) == (200, 2, "status_503")
+    assert first.host == "api.example.com" and first.method == "POST"
+    assert first.bytes_out == 7 and first.bytes_in == 10
+
+    (request,) = recorder.requests
+    assert (request.status, request.attempts, request.source) == (200, 2, "network")
+    assert request.duration >= request.queue_wait >= 0
+
+
+def test_failed_request_and_cache_hit_are_reported():
+    recorder = Recorder()
+    session = session_with(ScriptedAdapter(ConnectionError("down")))
+
+    with pytest.raises(ConnectionError):
+        with wreq(Request("GET", "https://api.example.com/"), session=session, metrics=recorder):
+            pass
+    assert recorder.attempts[0].error == "ConnectionError"
+    assert recorder.requests[0].error == "ConnectionError"
+
+    cache = ResponseCache()
+    session = session_with(ScriptedAdapter(200))
+    with wreqs_session(metrics=recorder, cache=cache):
+        for _ in range(2):
+            with wreq(Request("GET", "https://api.example.com/a"), session=session):
+                pass
+    assert [r.source for r in recorder.requests[1:]] == ["network", "cache"]
+    assert recorder.requests[-1].attempts == 0
+
+
+def test_broken_hook_does_not_fail_requests():
+    class Broken(MetricsHook):
+        def on_request(self, info):
+            raise RuntimeError("boom")
+
+    session = session_with(ScriptedAdapter(200))
+    with wreq(Request("GET", "https://api.example.com/"), session=session, metrics=Broken()) as r:
+        assert r.status_code == 200
+
+
+def test_wreq_many_reports_queue_wait():
+    recorder = Recorder()
+    session = session_with(ScriptedAdapter(200, delay=0.05))
+    reqs = [Request("GET", "https://api.example.com/") for _ in range(3)]
+
+    list(wreq_many(reqs, max_workers=1, session=session, metrics=recorder))
+
+    waits = sorted(r.queue_wait for r in recorder.requests)
+    assert waits[0] < 0.04 <= waits[-1]
+
+
+def test_registry_merges_threads_and_renders_prometheus():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    labels = ("GET", "api.example.com")
+
+    def work():
+        for _ in range(1000):
+            registry.inc("sent_bytes_total", labels, 2)
+            registry.observe("ttfb_seconds", labels, 0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    registry.observe("ttfb_seconds", labels, 5.0)
+
+    snapshot = registry.snapshot()
+    assert snapshot["sent_bytes_total"][labels] == 8000
+    assert snapshot["ttfb_seconds"][labels] == ((0, 4000, 4001), 4001, 2005.0)
+
+    text = registry.to_prometheus()
+    assert "# TYPE wreqs_sent_bytes_total counter" in text
+    assert 'wreqs_sent_bytes_total{method="GET",host="api.example.com"} 8000' in text
+    assert 'wreqs_ttfb_seconds_bucket{method="GET",host="api.example.com",le="1.0"} 4000' in text
+    assert 'wreqs_ttfb_seconds_bucket{method="GET",host="api.example.com",le="+Inf"} 4001' in text
+    assert 'wreqs_ttfb_seconds_count{method="GET",host="api.example.com"} 4001' in text
+
+
+def test_shards_of_finished_threads_are_folded():
+    registry = MetricsRegistry(buckets=(1.0,))
+    labels = ("GET", "api.example.com")
+
+    def work():
+        registry.inc("attempts_total", labels)
+        registry.observe("ttfb_seconds", labels, 0.5)
+
+    for _ in range(50):
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    work()
+
+    # only this thread's shard is left
+    assert len(registry._shards) == 1
+    snapshot = registry.snapshot()
+    assert snapshot["attempts_total"][labels] == 201
+    assert snapshot["ttfb_seconds"][labels] == ((201, 201), 201, 100.5)
+
+
+def test_registry_as_hook():
+    registry = MetricsRegistry()
+    session = session_with(ScriptedAdapter(500, 200))
+
+    with wreq(
+        Request("GET", "https://api.example.com/"),
+        session=session,
+        metrics=registry,
+        check_retry=lambda r: r.status_code >= 500,
+    ):
+        pass
+
+    snapshot = registry.snapshot()
+    labels = ("GET", "api.example.com")
+    assert snapshot["attempts_total"] == {labels + ("500",): 1, labels + ("200",): 1}
+    assert snapshot["retries_total"] == {labels + ("status_500",): 1}
+    assert snapshot["requests_total"] == {labels + ("200", "network"): 1}
+    assert snapshot["attempt_duration_seconds"][labels][1] == 2
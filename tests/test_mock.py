@@ -0,0 +1,123 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import random
+import re
+
+import pytest
+import requests
+from requests import Request, Session
+
+from wreqs import (
+    MockAdapter,
+    MockResponse,
+    RecordingAdapter,
+    RetryRequestError,
+    wreq,
+    wreq_many,
+    wreqs_session,
+)
+
+USERS = "https://api.example.com/users"
+
+
+def is_5xx(response) -> bool:
+    return response.status_code >= 500
+
+
+def test_status_sequence_drives_retries():
+    mock = MockAdapter().add("GET", USERS, 503, 502, MockResponse(200, [{"id": 1}]))
+
+    with wreqs_session() as session:
+        mock.mount(session)
+        with wreq(Request("GET", USERS, params={"page": 1}), check_retry=is_5xx) as response:
+            assert response.json() == [{"id": 1}]
+            assert response.headers["Content-Type"] == "application/json"
+        with pytest.raises(RetryRequestError):
+            with wreq(Request("GET", USERS), check_retry=lambda r: True, max_retries=2):
+                pass
+
+    assert mock.calls("GET", USERS) == 5
+    assert [r.url for r in mock.history][0] == f"{USERS}?page=1"
+
+
+def test_latency_and_timeouts_use_the_given_sleep():
+    slept = []
+    rng = random.Random(7)
+    mock = MockAdapter(sleep=slept.append)
+    mock.add(None, re.compile(r"/slow$"), MockResponse(latency=5.0))
+    mock.add(None, re.compile(r"/jitter$"), MockResponse(latency=lambda: rng.uniform(0.1, 0.2)))
+    session = mock.mount(Session())
+
+    with pytest.raises(requests.ReadTimeout):
+        with wreq(Request("GET", "https://api.example.com/slow"), session=session, timeout=(1, 2)):
+            pass
+    with wreq(Request("GET", "https://api.example.com/jitter"), session=session):
+        pass
+
+    # nothing actually waited
+    assert slept[0] == 2 and 0.1 <= slept[1] <= 0.2
+
+
+def test_errors_and_unmatched_requests():
+    mock = MockAdapter().add("POST", USERS, requests.ConnectionError, 201)
+    session = mock.mount(Session())
+
+    with pytest.raises(requests.ConnectionError):
+        with wreq(Request("POST", USERS), session=session):
+            pass
+    with wreq(Request("POST", USERS), session=session) as response:
+        assert response.status_code == 201 and response.reason == "Created"
+    with pytest.raises(requests.ConnectionError, match="No mock response"):
+        with wreq(Request("DELETE", USERS), session=session):
+            pass
+
+
+def test_many_concurrent_requests():
+    mock = MockAdapter(default=MockResponse(200, {"ok": True}))
+    requests_ = (Request("GET", f"{USERS}/{i}") for i in range(2000))
+    results = list(wreq_many(requests_, max_workers=16, session=mock.mount(Session())))
+
+    assert all(r.response.json() == {"ok": True} for r in results)
+    assert mock.call_count == 2000
+
+
+def test_record_then_replay(tmp_path):
+    live = MockAdapter()
+    live.add("GET", f"{USERS}?page=1", MockResponse(200, {"page": 1}))
+    live.add("GET", f"{USERS}?page=2", 500, MockResponse(200, {"page": 2}))
+    live.add("GET", f"{USERS}/avatar", MockResponse(200, b"\x89PNG\x00\xff"))
+    live.add("GET", f"{USERS}/down", requests.ConnectTimeout)
+
+    path = tmp_path / "users.json"
+    with wreqs_session() as session:
+        RecordingAdapter(str(path), adapter=live).mount(session)
+        for page in (1, 2):
+            with wreq(Request("GET", USERS, params={"page": page}), check_retry=is_5xx):
+                pass
+        with wreq(Request("GET", f"{USERS}/avatar")):
+            pass
+        with pytest.raises(requests.ConnectTimeout):
+            with wreq(Request("GET", f"{USERS}/down")):
+                pass
+    # closing the session saved the cassette
+    assert len(json.loads(path.read_text())["interactions"]) == 5
+
+    replay = MockAdapter.from_cassette(str(path))
+    session = replay.mount(Session())
+    with wreq(Request("GET", USERS, params={"page": 2}), session=session, check_retry=is_5xx) as r:
+        assert r.json() == {"page": 2}
+    with wreq(Request("GET", USERS, params={"page": 1}), session=session) as r:
+        assert r.json() == {"page": 1}
+    with wreq(Request("GET", f"{USERS}/avatar"), session=session) as r:
+        assert r.content == b"\x89PNG\x00\xff"
+    with pytest.raises(requests.ConnectTimeout):
+        with wreq(Request("GET", f"{USERS}/down"), session=session):
+            pass
+    with pytest.raises(requests.ConnectionError):
+        with wreq(Request("GET", USERS), session=session):
+            pass
@@ -0,0 +1,163 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from requests import Request, Session
+from requests.adapters import BaseAdapter
+
+from wreqs import (
+    CursorPaginator,
+    OffsetPaginator,
+    RetryRequestError,
+    wreq_paginate,
+)
+from wreqs.response import build_response
+
+ITEMS = list(range(10))
+BASE = "https://api.example.com/items"
+
+
+class PagedAdapter(BaseAdapter):
+    """Serves ITEMS in pages of 3 via Link headers, cursors or offsets."""
+
+    def __init__(self, delay: float = 0.0, fail_page: int = -1) -> None:
+        super().__init__()
+        self.delay = delay
+        self.fail_page = fail_page
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        time.sleep(self.delay)
+        query = {k: v[0] for k, v in parse_qs(urlsplit(request.url).query).items()}
+        start = int(query.get("cursor") or query.get("offset") or query.get("page", 0))
+        limit = int(query.get("limit", 3))
+        if start // 3 == self.fail_page:
+            return build_response(500, b"", {}, request.url, request=request)
+
+        page = ITEMS[start : start + limit]
+        following = start + limit if start + limit < len(ITEMS) else None
+        headers = {}
+        if following is not None:
+            headers["Link"] = f'<{BASE}?page={following}>; rel="next"'
+        body = {"data": page, "meta": {"next_cursor": following and str(following)}}
+        return build_response(200, json.dumps(body).encode(), headers, request.url, request=request)
+
+    def close(self) -> None:
+        pass
+
+
+def session_with(adapter: BaseAdapter) -> Session:
+    session = Session()
+    session.mount("https://", adapter)
+    return session
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_link_header_pages(prefetch):
+    adapter = PagedAdapter()
+    pages = list(
+        wreq_paginate(Request("GET", BASE), session=session_with(adapter), prefetch=prefetch)
+    )
+    assert [p.json()["data"] for p in pages] == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+
+
+def test_cross_origin_links_drop_credentials():
+    links = {
+        f"{BASE}?page=0": f"{BASE}?page=1",
+        f"{BASE}?page=1": "https://cdn.example.net/items?page=2",
+        "https://cdn.example.net/items?page=2": None,
+    }
+    seen = []
+
+    class LinkAdapter(BaseAdapter):
+        def send(self, request, **kwargs):
+            seen.append((request.headers.get("Authorization"), request.headers.get("Cookie")))
+            following = links[request.url]
+            headers = {"Link": f'<{following}>; rel="next"'} if following else {}
+            return build_response(200, b"[]", headers, request.url, request=request)
+
+        def close(self) -> None:
+            pass
+
+    req = Request("GET", BASE, params={"page": 0}, auth=("user", "secret"), cookies={"sid": "1"})
+    list(wreq_paginate(req, session=session_with(LinkAdapter())))
+
+    assert seen[0] == seen[1] and seen[0][0].startswith("Basic ") and seen[0][1] == "sid=1"
+    assert seen[2] == (None, None)
+
+
+def test_cursor_items():
+    adapter = PagedAdapter()
+    items = wreq_paginate(
+        Request("GET", BASE, params={"cursor": ""}),
+        next_page=CursorPaginator("meta.next_cursor"),
+        items="data",
+        session=session_with(adapter),
+    )
+    assert list(items) == ITEMS
+    assert adapter.sent[-1] == f"{BASE}?cursor=9"
+
+
+def test_offset_pages_stop_on_short_page():
+    adapter = PagedAdapter()
+    items = wreq_paginate(
+        Request("GET", BASE),
+        next_page=OffsetPaginator(limit=5, items="data"),
+        items="data",
+        session=session_with(adapter),
+    )
+    assert list(items) == ITEMS
+    assert adapter.sent == [
+        f"{BASE}?offset=0&limit=5",
+        f"{BASE}?offset=5&limit=5",
+        f"{BASE}?offset=10&limit=5",
+    ]
+
+
+def test_prefetch_overlaps_processing_and_is_bounded():
+    adapter = PagedAdapter(delay=0.05)
+    started = time.perf_counter()
+    for _ in wreq_paginate(Request("GET", BASE), session=session_with(adapter), prefetch=1):
+        time.sleep(0.05)
+    # 4 fetches and 4 processing steps of 50ms each, mostly overlapped
+    assert time.perf_counter() - started < 0.35
+
+    adapter = PagedAdapter()
+    pages = wreq_paginate(
+        Request("GET", BASE, params={"limit": 1}), session=session_with(adapter), prefetch=2
+    )
+    next(pages)
+    time.sleep(0.1)
+    # the page handed out, two ready pages and one waiting to be queued
+    assert len(adapter.sent) == 4
+    pages.close()
+    time.sleep(0.2)
+    assert len(adapter.sent) == 4
+
+
+def test_error_is_raised_after_earlier_pages():
+    adapter = PagedAdapter(fail_page=1)
+    seen = []
+    with pytest.raises(RetryRequestError):
+        for page in wreq_paginate(
+            Request("GET", BASE),
+            session=session_with(adapter),
+            check_retry=lambda r: r.status_code >= 500,
+            max_retries=2,
+        ):
+            seen.append(page.json()["data"])
+    assert seen == [[0, 1, 2]]
+    assert len(adapter.sent) == 3
+
+
+def test_stream_is_rejected():
+    with pytest.raises(ValueError):
+        next(wreq_paginate(Request("GET", BASE), stream=True))
@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import requests
+from requests import Request, Session
+
+from wreqs import MockAdapter, MockResponse, wreq_map
+
+BASE = "https://api.example.com/docs"
+BIG = {"items": list(range(50000))}
+
+
+# handlers run in worker processes, so they live at module level
+def summarize(raw):
+    doc = raw.json()
+    return os.getpid(), raw.status_code, len(doc["items"])
+
+
+def view_type(raw):
+    return type(raw.content).__name__, len(raw.content), bytes(raw.content[:9])
+
+
+def fail_on_empty(raw):
+    if not raw.json()["items"]:
+        raise ValueError("empty document")
+    return len(raw.json()["items"])
+
+
+@pytest.fixture(scope="module")
+def executor():
+    pool = ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn"))
+    yield pool
+    pool.shutdown()
+
+
+def docs_session() -> Session:
+    mock = MockAdapter()
+    mock.add("GET", f"{BASE}/big", MockResponse(200, BIG))
+    mock.add("GET", f"{BASE}/empty", MockResponse(200, {"items": []}))
+    mock.add("GET", f"{BASE}/flaky", 503, MockResponse(200, {"items": [1]}))
+    mock.add("GET", f"{BASE}/down", requests.ConnectionError)
+    mock.add("GET", f"{BASE}/0", MockResponse(200, {"items": [0]}))
+    for i in range(1, 20):
+        mock.add("GET", f"{BASE}/{i}", MockResponse(200, {"items": list(range(i))}))
+    return mock.mount(Session())
+
+
+def test_handlers_run_in_other_processes_in_order(executor):
+    reqs = [Request("GET", f"{BASE}/{i}") for i in range(20)] + [Request("GET", f"{BASE}/big")]
+    results = list(
+        wreq_map(reqs, summarize, executor=executor, session=docs_session(), shm_threshold=1024)
+    )
+
+    assert [r.index for r in results] == list(range(21))
+    assert all(r.ok and r.value[0] != os.getpid() for r in results)
+    assert [r.value[2] for r in results] == [1] + list(range(1, 20)) + [50000]
+
+
+def test_zero_copy_bodies_are_memoryviews(executor):
+    reqs = [Request("GET", f"{BASE}/big"), Request("GET", f"{BASE}/3")]
+    small, big = (len(json.dumps(d, separators=(",", ":"))) for d in ({"items": [0, 1, 2]}, BIG))
+    results = wreq_map(
+        reqs, view_type, executor=executor, session=docs_session(),
+        shm_threshold=1024, zero_copy=True,
+    )
+    assert [r.value for r in results] == [
+        ("memoryview", big, b'{"items":'),
+        ("bytes", small, b'{"items":'),
+    ]
+
+
+def test_request_and_handler_failures_are_reported(executor):
+    reqs = [Request("GET", f"{BASE}/{name}") for name in ("flaky", "down", "empty", "2")]
+    results = list(
+        wreq_map(
+            reqs, fail_on_empty, executor=executor, session=docs_session(), ordered=False,
+            check_retry=lambda r: r.status_code >= 500,
+        )
+    )
+    by_index = {r.index: r for r in results}
+
+    assert by_index[0].value == 1  # retried until the 200
+    assert isinstance(by_index[1].exception, requests.ConnectionError)
+    assert isinstance(by_index[2].exception, ValueError)
+    assert by_index[3].value == 2
+
+
+def test_owned_pool_and_stream_rejected():
+    reqs = [Request("GET", f"{BASE}/4")]
+    results = list(wreq_map(reqs, summarize, processes=1, session=docs_session()))
+    assert results[0].value[1:] == (200, 4)
+    with pytest.raises(ValueError):
+        next(wreq_map([Request("GET", BASE)], summarize, stream=True))
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+from collections import Counter
+
+from wreqs.proxy import ProxyPool
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_prefers_fast_healthy_proxies():
+    pool = ProxyPool(["fast", "slow"], rng=random.Random(1))
+    pool.report("fast", 0.05, True)
+    pool.report("slow", 1.0, True)
+
+    picks = Counter(pool.select() for _ in range(1000))
+    assert picks["fast"] > 900
+
+
+def test_untried_proxies_are_explored():
+    pool = ProxyPool(["known", "new"], rng=random.Random(1))
+    pool.report("known", 0.1, True)
+
+    picks = Counter(pool.select() for _ in range(1000))
+    assert picks["new"] > 300
+
+
+def test_failing_proxy_is_ejected_for_cooldown():
+    clock = FakeClock()
+    pool = ProxyPool(["a", "b"], max_failures=2, cooldown=10, clock=clock)
+    pool.report("a", 0.1, False)
+    assert not pool.stats()["a"].ejected
+    pool.report("a", 0.1, False)
+    assert pool.stats()["a"].ejected
+
+    assert {pool.select() for _ in range(50)} == {"b"}
+
+    clock.now = 10
+    assert not pool.stats()["a"].ejected
+    assert "a" in {pool.select() for _ in range(200)}
+
+
+def test_all_ejected_falls_back_to_soonest():
+    clock = FakeClock()
+    pool = ProxyPool(["a", "b"], max_failures=1, cooldown=10, clock=clock)
+    pool.report("a", 0.1, False)
+    clock.now = 5
+    pool.report("b", 0.1, False)
+    assert pool.select() == "a"
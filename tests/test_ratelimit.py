@@ -0,0 +1,185 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import asyncio
+
+import pytest
+from requests import Request, Session
+from requests.adapters import BaseAdapter
+
+from wreqs import (
+    CircuitBreaker,
+    CircuitOpenError,
+    DeadlineExceededError,
+    RateLimiter,
+    RateLimitExceededError,
+    awreq,
+    wreq,
+    wreqs_session,
+)
+from wreqs.aio import AsyncSession, AsyncTransport
+from wreqs.response import build_response
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+def limiter(clock: FakeClock, **kwargs) -> RateLimiter:
+    return RateLimiter(
+        clock=clock,
+        wall_clock=lambda: 1_700_000_000.0,
+        sleep=clock.sleep,
+        async_sleep=clock.async_sleep,
+        **kwargs,
+    )
+
+
+def response(status: int = 200, **headers: str):
+    headers = {k.replace("_", "-"): v for k, v in headers.items()}
+    return build_response(status, b"", headers, "https://api.example.com/")
+
+
+def test_spaces_requests_after_burst():
+    clock = FakeClock()
+    rl = limiter(clock, rate=10, burst=3)
+
+    waits = [rl.acquire("a") for _ in range(5)]
+    assert waits[:3] == [0, 0, 0]
+    assert waits[3:] == pytest.approx([0.1, 0.1])
+    assert rl.acquire("b") == 0  # keys are independent
+
+
+def test_max_wait_fails_fast_without_claiming_a_slot():
+    clock = FakeClock()
+    rl = limiter(clock, rate=1, max_wait=0.5)
+
+    rl.acquire("a")
+    with pytest.raises(RateLimitExceededError) as exc_info:
+        rl.acquire("a")
+    assert exc_info.value.key == "a"
+    assert exc_info.value.retry_in == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert rl.acquire("a") == 0
+
+
+def test_adapts_to_retry_after_and_exhausted_quota():
+    clock = FakeClock()
+    rl = limiter(clock, rate=100)
+
+    rl.update("a", response(429, Retry_After="2"))
+    assert rl.reserve("a") == pytest.approx(2.0)
+
+    rl.update("b", response(200, **{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000005"}))
+    assert rl.reserve("b") == pytest.approx(5.0)
+
+
+def test_adapts_pace_to_remaining_quota():
+    clock = FakeClock()
+    rl = limiter(clock, rate=100)
+
+    rl.update("a", response(200, RateLimit="limit=100, remaining=10, reset=5"))
+    waits = [rl.acquire("a") for _ in range(3)]
+    assert waits == pytest.approx([0, 0.5, 0.5])
+
+    clock.now += 10  # window over, back to the configured pace
+    assert [rl.acquire("a") for _ in range(2)] == pytest.approx([0, 0.01])
+
+
+class OkAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        return build_response(200, b"", {}, request.url, request=request)
+
+    def close(self):
+        pass
+
+
+def test_wreq_waits_on_session_rate_limiter():
+    clock = FakeClock()
+    rl = limiter(clock, rate=2)
+
+    with wreqs_session(rate_limiter=rl) as session:
+        session.mount("https://", OkAdapter())
+        for _ in range(3):
+            with wreq(Request("GET", "https://api.example.com/")) as r:
+                assert r.status_code == 200
+    assert clock.sleeps == pytest.approx([0.5, 0.5])
+
+
+def test_rate_limit_wait_is_bounded_by_deadline():
+    clock = FakeClock()
+    rl = limiter(clock, rate=1)
+    req = Request("GET", "https://api.example.com/")
+
+    with wreqs_session(rate_limiter=rl) as session:
+        session.mount("https://", OkAdapter())
+        with wreq(req):
+            pass
+        with pytest.raises(DeadlineExceededError):
+            with wreq(req, total_timeout=0.5):
+                pass
+    # failed without waiting or claiming the slot
+    assert clock.sleeps == [] and rl.reserve(rl.key(req)) == pytest.approx(1.0)
+
+
+def test_open_circuit_fails_before_taking_a_slot():
+    clock = FakeClock()
+    rl = limiter(clock, rate=1)
+    breaker = CircuitBreaker(minimum_requests=1, reset_timeout=10, clock=clock)
+    req = Request("GET", "https://api.example.com/")
+    key = rl.key(req)
+
+    with wreqs_session(rate_limiter=rl, circuit_breaker=breaker) as session:
+        session.mount("https://", OkAdapter())
+        with wreq(req):
+            pass
+        breaker.acquire("api.example.com")
+        breaker.record("api.example.com", False)
+        with pytest.raises(CircuitOpenError):
+            with wreq(req):
+                pass
+        # neither waited for nor claimed the saturated limiter's next slot
+        assert clock.sleeps == [] and rl.reserve(key) == pytest.approx(1.0)
+
+        # a half-open probe stopped by the deadline gives its trial back
+        clock.now += 10
+        rl.reserve(key)
+        with pytest.raises(DeadlineExceededError):
+            with wreq(req, total_timeout=0.5):
+                pass
+        assert breaker.state("api.example.com") == "half_open"
+        breaker.acquire("api.example.com")
+
+
+def test_awreq_awaits_rate_limiter():
+    class OkTransport(AsyncTransport):
+        async def send(self, request, timeout, proxies, verify, cert):
+            return build_response(200, b"", {}, request.url, request=request)
+
+    clock = FakeClock()
+    rl = limiter(clock, rate=4)
+
+    async def main():
+        session = AsyncSession(Session(), OkTransport())
+        for _ in range(2):
+            async with awreq(Request("GET", "https://api.example.com/"), session=session, rate_limiter=rl):
+                pass
+
+    asyncio.run(main())
+    assert clock.sleeps == pytest.approx([0.25])
@@ -0,0 +1,136 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import threading
+
+import pytest
+from requests import Request
+from requests.adapters import BaseAdapter
+
+from wreqs import (
+    DeadlineExceededError,
+    SessionPool,
+    SessionPoolExhaustedError,
+    wreq,
+    wreq_many,
+)
+from wreqs.response import build_response
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class OkAdapter(BaseAdapter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.closed = False
+
+    def send(self, request, **kwargs):
+        return build_response(200, b"ok", {}, request.url, request=request)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_checkout_reuses_sessions_and_shares_connections():
+    pool = SessionPool(max_size=2)
+    first = pool.checkout()
+    second = pool.checkout()
+    assert first is not second
+    assert first.get_adapter("https://a") is second.get_adapter("http://b") is pool.adapter
+
+    pool.checkin(first)
+    assert pool.checkout() is first
+    assert pool.stats() == (2, 0, 2, 2)
+
+
+def test_checkout_waits_for_checkin_and_times_out():
+    pool = SessionPool(max_size=1)
+    session = pool.checkout()
+
+    with pytest.raises(SessionPoolExhaustedError):
+        pool.checkout(timeout=0.05)
+
+    threading.Timer(0.05, pool.checkin, args=(session,)).start()
+    assert pool.checkout(timeout=2) is session
+
+
+def test_idle_sessions_are_evicted():
+    clock = FakeClock()
+    pool = SessionPool(max_size=4, idle_timeout=10, clock=clock)
+    sessions = [pool.checkout() for _ in range(3)]
+    for session in sessions[:2]:
+        pool.checkin(session)
+
+    clock.now = 5
+    pool.checkin(sessions[2])
+    clock.now = 12
+    assert pool.evict_idle() == 2
+    assert pool.stats() == (1, 1, 0, 4)
+    assert pool.checkout() is sessions[2]
+
+
+def test_per_thread_sessions_are_bound_until_thread_exits():
+    pool = SessionPool(max_size=2, per_thread=True)
+    mine = pool.checkout()
+    pool.checkin(mine)
+    assert pool.checkout() is mine
+
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(pool.checkout()))
+    worker.start()
+    worker.join()
+    assert seen[0] is not mine
+    assert pool.stats().size == 2
+
+    # the exited thread's session goes back to the pool for the next thread
+    worker = threading.Thread(target=lambda: seen.append(pool.checkout()))
+    worker.start()
+    worker.join()
+    assert seen[1] is seen[0]
+
+
+def test_wreq_checks_session_out_per_call():
+    pool = SessionPool(max_size=4)
+    pool.adapter = OkAdapter()
+    req = Request("GET", "https://api.example.com/")
+
+    with wreq(req, session=pool) as response:
+        assert response.text == "ok"
+        assert pool.stats().in_use == 1
+    assert pool.stats() == (1, 1, 0, 4)
+
+    results = list(wreq_many([req] * 20, max_workers=4, session=pool))
+    assert all(r.ok for r in results)
+    assert pool.stats().size <= 4 and pool.stats().in_use == 0
+
+    pool.close()
+    assert pool.adapter.closed
+    with pytest.raises(SessionPoolExhaustedError):
+        pool.checkout()
+
+
+def test_wreq_returns_session_on_bad_options_and_bounds_checkout_by_deadline():
+    pool = SessionPool(max_size=1)
+    pool.adapter = OkAdapter()
+    req = Request("GET", "https://api.example.com/")
+
+    with pytest.raises(ValueError):
+        with wreq(req, session=pool, hedge_after="soon"):
+            pass
+    assert pool.stats().in_use == 0
+
+    held = pool.checkout()
+    with pytest.raises(DeadlineExceededError):
+        with wreq(req, session=pool, total_timeout=0.05):
+            pass
+    pool.checkin(held)
+    assert pool.stats().in_use == 0
@@ -0,0 +1,179 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests import Request, Session
+from requests.adapters import BaseAdapter
+
+from wreqs import DeadlineExceededError, SingleFlight, wreq, wreqs_session
+from wreqs.response import build_response
+
+
+class SlowAdapter(BaseAdapter):
+    """Blocks every send until released; fails the first `failures` sends with 500."""
+
+    def __init__(self, failures: int = 0) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.sent = 0
+        self.failures = failures
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        self.release.wait(5)
+        status = 500 if self.sent <= self.failures else 200
+        return build_response(status, b'{"n": %d}' % self.sent, {}, request.url, request=request)
+
+    def close(self):
+        pass
+
+
+def run_concurrently(n, fn):
+    with ThreadPoolExecutor(n) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, fn) for _ in range(n)]
+        return [f.result() for f in futures]
+
+
+def test_identical_requests_share_one_call():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return build_response(200, b"body", {"X-A": "1"}, "http://example.com")
+
+    def caller():
+        return flight.do("key", fetch)
+
+    with ThreadPoolExecutor(5) as pool:
+        futures = [pool.submit(caller)]
+        started.wait(5)
+        futures += [pool.submit(caller) for _ in range(4)]
+        while flight.stats().shared < 4:
+            pass
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert [shared for _, shared in results].count(False) == 1
+    responses = [r for r, _ in results]
+    assert len({id(r) for r in responses}) == 5
+    responses[0].headers["X-A"] = "changed"
+    assert all(r.headers["X-A"] == "1" for r in responses[1:])
+    assert all(r.content == b"body" for r in responses)
+    assert flight.stats() == (1, 4, 0)
+
+
+def test_exception_is_raised_in_every_caller():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    original = ValueError("boom")
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise original
+
+    def caller():
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            return e
+
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(caller)]
+        started.wait(5)
+        futures += [pool.submit(caller) for _ in range(3)]
+        while flight.stats().shared < 3:
+            pass
+        release.set()
+        errors = [f.result() for f in futures]
+
+    assert errors[0] is original
+    # every waiter raised its own error, chained to the leader's
+    assert len({id(e) for e in errors}) == 4
+    assert all(e.__cause__ is original and e.args == ("boom",) for e in errors[1:])
+    assert flight.stats().in_flight == 0
+
+
+def test_key_distinguishes_vary_headers_and_skips_unsafe_methods():
+    flight = SingleFlight()
+    en = Request("GET", "http://example.com/a", headers={"Accept-Language": "en"}).prepare()
+    fr = Request("GET", "http://example.com/a", headers={"Accept-Language": "fr"}).prepare()
+    params = Request("GET", "http://example.com/a", params={"page": 2}).prepare()
+    post = Request("POST", "http://example.com/a", data={"x": 1}).prepare()
+
+    assert flight.key(en) != flight.key(fr)
+    assert flight.key(en) != flight.key(params)
+    assert flight.key(post) is None
+
+
+def test_wreqs_session_single_flight_shares_post_retry_outcome():
+    adapter = SlowAdapter(failures=1)
+
+    with wreqs_session(single_flight=True) as session:
+        session.mount("http://", adapter)
+
+        def call():
+            with wreq(
+                Request("GET", "http://example.com/flags"),
+                check_retry=lambda r: r.status_code != 200 or "n" not in r.json(),
+            ) as response:
+                return response.status_code, response.json()
+
+        timer = threading.Timer(0.2, adapter.release.set)
+        timer.start()
+        results = run_concurrently(8, call)
+
+    assert adapter.sent == 2
+    assert results == [(200, {"n": 2})] * 8
+    # check_retry decoded the body once; every caller got that same document
+    assert len({id(doc) for _, doc in results}) == 1
+
+
+def test_waiter_gives_up_at_its_own_deadline():
+    adapter = SlowAdapter()
+
+    with wreqs_session(single_flight=True) as session:
+        session.mount("http://", adapter)
+
+        def call(total_timeout):
+            with wreq(Request("GET", "http://example.com/flags"), total_timeout=total_timeout) as r:
+                return r.json()
+
+        with ThreadPoolExecutor(2) as pool:
+            leader = pool.submit(contextvars.copy_context().run, call, 5)
+            while adapter.sent == 0:
+                pass
+            waiter = pool.submit(contextvars.copy_context().run, call, 0.2)
+            with pytest.raises(DeadlineExceededError):
+                waiter.result(timeout=2)
+            # the leader is still waiting on the network
+            assert not leader.done()
+            adapter.release.set()
+            assert leader.result() == {"n": 1}
+    assert adapter.sent == 1
+
+
+def test_single_flight_not_used_without_option():
+    adapter = SlowAdapter()
+    adapter.release.set()
+    session = Session()
+    session.mount("http://", adapter)
+
+    for _ in range(3):
+        with wreq(Request("GET", "http://example.com/flags"), session=session):
+            pass
+    assert adapter.sent == 3
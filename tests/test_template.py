@@ -0,0 +1,97 @@
+import sys
+from pathlib import Path
+
+# alternatively package and install `wreqs` module
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from requests import PreparedRequest, Request, Session
+from requests.adapters import BaseAdapter
+from requests.auth import HTTPDigestAuth
+
+from wreqs import RequestTemplate, wreq
+from wreqs.fmt import prettify_request_str
+from wreqs.response import build_response
+
+
+class StatusAdapter(BaseAdapter):
+    """Answers with the given statuses in turn and records what was sent."""
+
+    def __init__(self, *statuses: int) -> None:
+        super().__init__()
+        self.statuses = list(statuses)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        return build_response(self.statuses.pop(0), b"{}", {}, request.url, request=request)
+
+    def close(self):
+        pass
+
+
+def test_template_builds_urls_and_bodies():
+    session = Session()
+    session.headers["X-Session"] = "1"
+    items = RequestTemplate(
+        "POST",
+        "https://api.example.com/v1/?version=2",
+        headers={"Accept": "application/json"},
+        auth=("user", "secret"),
+        session=session,
+    )
+
+    first = items.prepare("items/new item", params={"tag": ["a", "b"]}, json={"n": 1})
+    second = items.prepare(data={"q": "x"}, headers={"X-Trace": "t"})
+
+    assert first.url == "https://api.example.com/v1/items/new%20item?version=2&tag=a&tag=b"
+    assert first.body == b'{"n": 1}'
+    assert first.headers["Content-Type"] == "application/json"
+    assert first.headers["X-Session"] == "1"
+    assert first.headers["Authorization"].startswith("Basic ")
+    assert "X-Trace" not in first.headers
+
+    assert second.url == "https://api.example.com/v1/?version=2"
+    assert second.body == "q=x"
+    assert second.headers["X-Trace"] == "t"
+
+
+def test_template_reapplies_non_tuple_auth_without_leaking_hooks():
+    template = RequestTemplate("GET", "https://api.example.com", auth=HTTPDigestAuth("u", "p"))
+    hooks = [len(template.prepare("a").hooks["response"]) for _ in range(3)]
+    assert hooks == [hooks[0]] * 3 and hooks[0] > 0
+
+
+def test_request_is_prepared_once_across_retries():
+    adapter = StatusAdapter(500, 500, 200)
+    session = Session()
+    session.mount("https://", adapter)
+    calls = []
+    prepare_request = session.prepare_request
+    session.prepare_request = lambda r: calls.append(r) or prepare_request(r)
+
+    req = Request("GET", "https://api.example.com/flaky")
+    with wreq(req, session=session, check_retry=lambda r: r.status_code != 200) as response:
+        assert response.status_code == 200
+
+    assert len(calls) == 1
+    assert len(adapter.sent) == 3
+    assert len({id(p) for p in adapter.sent}) == 3
+
+
+def test_wreq_accepts_prepared_requests():
+    adapter = StatusAdapter(200)
+    session = Session()
+    session.mount("https://", adapter)
+    template = RequestTemplate("GET", "https://api.example.com")
+
+    with wreq(template.prepare("ping"), session=session) as response:
+        assert response.status_code == 200
+    assert isinstance(adapter.sent[0], PreparedRequest)
+    assert adapter.sent[0].url == "https://api.example.com/ping"
+
+
+def test_prettify_prepared_request():
+    prepared = Request("POST", "https://api.example.com/x", json={"a": 1}).prepare()
+    assert prettify_request_str(prepared) == (
+        '[POST] https://api.example.com/x {"headers":2,"body":8}'
+    )
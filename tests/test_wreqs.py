@@ -19,6 +19,31 @@ def prepare_url(path: str) -> str:
     return f"{BASE_URL}/{path}"
 
 
+@pytest.fixture
+def forward_proxy():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    hits: list = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            upstream = requests.get(self.path)
+            self.send_response(upstream.status_code)
+            self.send_header("Content-Length", str(len(upstream.content)))
+            self.end_headers()
+            self.wfile.write(upstream.content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("localhost", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://localhost:{server.server_address[1]}", hits
+    server.shutdown()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def start_server():
     import subprocess
@@ -230,3 +255,228 @@ def test_wreqs_session_explicit_vs_implicit():
 
         with wreq(req2) as response2:
             assert response2.status_code == 200
+
+
+def test_logging_disabled_skips_formatting(monkeypatch):
+    import logging
+    import wreqs.fmt
+
+    def fail(*args, **kwargs):
+        pytest.fail("response formatted while logging is disabled")
+
+    monkeypatch.setattr(wreqs.fmt, "prettify_response_str", fail)
+    monkeypatch.setattr(wreqs.fmt, "prettify_request_str", fail)
+    monkeypatch.setattr(logging.getLogger("wreqs.context"), "level", logging.WARNING)
+
+    req = requests.Request("GET", prepare_url("/ping"))
+    with wreq(req) as response:
+        assert response.status_code == 200
+
+
+def test_logging_formats_response_once(monkeypatch, caplog):
+    import logging
+    import wreqs.fmt
+
+    calls: list = []
+    original = wreqs.fmt.prettify_response_str
+
+    def counting(response, verbose=False):
+        calls.append(response)
+        return original(response, verbose)
+
+    monkeypatch.setattr(wreqs.fmt, "prettify_response_str", counting)
+
+    req = requests.Request("GET", prepare_url("/ping"))
+    with caplog.at_level(logging.INFO, logger="wreqs.context"):
+        with wreq(req) as response:
+            assert response.status_code == 200
+
+    assert len(calls) == 1
+    assert sum("[200]" in r.getMessage() for r in caplog.records) == 2
+
+
+def test_explicit_session_not_closed():
+    from wreqs import pool_stats
+
+    with requests.Session() as session:
+        req = requests.Request("GET", prepare_url("/ping"))
+        with wreq(req, session=session) as response:
+            assert response.status_code == 200
+
+        stats = pool_stats(session)
+        assert stats["http://localhost:5000"].idle == 1
+        assert stats["http://localhost:5000"].in_use == 0
+
+
+def test_wreqs_session_reuses_connection():
+    from wreqs import pool_stats
+
+    with wreqs_session(pool_maxsize=4, pool_block=True) as session:
+        for _ in range(3):
+            with wreq(requests.Request("GET", prepare_url("/ping"))) as response:
+                assert response.status_code == 200
+
+        stats = pool_stats(session)["http://localhost:5000"]
+        assert stats.maxsize == 4
+        assert stats.open == 1
+
+
+def test_wreq_many_ordered_with_failures():
+    from wreqs import wreq_many
+
+    reqs = [
+        requests.Request("GET", prepare_url("/ping")),
+        requests.Request("POST", prepare_url("/timeout"), json={"timeout": 2}),
+        requests.Request("GET", prepare_url("/protected/ping")),
+    ]
+
+    results = list(wreq_many(reqs, max_workers=3, timeout=1))
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].ok and results[0].response.status_code == 200
+    assert isinstance(results[1].exception, requests.Timeout)
+    assert results[2].response.status_code == 401
+
+
+def test_wreq_many_unordered_retry_error():
+    from wreqs import wreq_many
+
+    reqs = (requests.Request("GET", prepare_url("/ping")) for _ in range(10))
+    results = list(
+        wreq_many(reqs, max_workers=4, ordered=False, check_retry=lambda r: True)
+    )
+
+    assert sorted(r.index for r in results) == list(range(10))
+    assert all(isinstance(r.exception, RetryRequestError) for r in results)
+
+
+def test_wreq_many_uses_wreqs_session():
+    from wreqs import wreq_many
+
+    with wreqs_session():
+        auth_req = requests.Request("POST", prepare_url("/auth"))
+        with wreq(auth_req) as response:
+            assert response.status_code == 200
+
+        reqs = [requests.Request("GET", prepare_url("/protected/ping"))] * 5
+        results = list(wreq_many(reqs, max_workers=5))
+
+    assert [r.response.status_code for r in results] == [200] * 5
+
+
+def test_with_retry_and_backoff():
+    from wreqs import ExponentialBackoff
+
+    signature: str = random.randbytes(4).hex()
+    req = requests.Request(
+        "POST",
+        prepare_url("/retry/number"),
+        json={"signature": signature, "succeed_after_attempt": 3},
+    )
+    sleeps: list = []
+    backoff = ExponentialBackoff(base=1, cap=10, sleep=sleeps.append)
+
+    def retry_if_not_success(res: requests.Response) -> bool:
+        return res.status_code != 200
+
+    with wreq(
+        req, check_retry=retry_if_not_success, max_retries=4, backoff=backoff
+    ) as response:
+        assert response.status_code == 200
+
+    assert sleeps == [1, 2, 4]
+
+
+def test_wreqs_session_circuit_breaker_fails_fast():
+    from wreqs import CircuitBreaker, CircuitOpenError
+
+    breaker = CircuitBreaker(minimum_requests=2, reset_timeout=60)
+    req = requests.Request("GET", "http://localhost:1/unreachable")
+
+    with wreqs_session(circuit_breaker=breaker):
+        for _ in range(2):
+            with pytest.raises(requests.ConnectionError):
+                with wreq(req):
+                    pytest.fail()
+
+        with pytest.raises(CircuitOpenError):
+            with wreq(req):
+                pytest.fail()
+
+        with wreq(requests.Request("GET", prepare_url("/ping"))) as response:
+            assert response.status_code == 200
+
+
+def test_retry_budget_stops_retries():
+    from wreqs import RetryBudget, RetryBudgetExhaustedError
+
+    budget = RetryBudget(ratio=0, min_retries=1)
+    req = requests.Request("GET", prepare_url("/ping"))
+
+    with pytest.raises(RetryBudgetExhaustedError):
+        with wreq(req, check_retry=lambda r: True, retry_budget=budget):
+            pytest.fail()
+
+
+def test_proxies_are_applied(forward_proxy):
+    proxy_url, hits = forward_proxy
+    req = requests.Request("GET", prepare_url("/ping"))
+
+    with wreq(req, proxies=[proxy_url]) as response:
+        assert response.status_code == 200
+    assert hits == [prepare_url("/ping")]
+
+    with pytest.raises(requests.exceptions.ProxyError):
+        with wreq(req, proxies=["http://localhost:1"]):
+            pytest.fail()
+
+
+def test_proxy_pool_ejects_dead_proxy(forward_proxy):
+    from wreqs import ProxyPool
+
+    proxy_url, hits = forward_proxy
+    dead = "http://localhost:1"
+    # equal weights until one is tried; with this seed the dead proxy goes first
+    pool = ProxyPool([dead, proxy_url], max_failures=1, cooldown=60, rng=random.Random(1))
+    failures = 0
+
+    with wreqs_session(proxies=pool):
+        for _ in range(10):
+            try:
+                with wreq(requests.Request("GET", prepare_url("/ping"))) as response:
+                    assert response.status_code == 200
+            except requests.exceptions.ProxyError:
+                failures += 1
+
+    assert failures == 1
+    assert len(hits) == 9
+    assert pool.stats()[dead].ejected
+    assert pool.stats()[proxy_url].latency is not None
+
+
+def test_cache_serves_fresh_and_revalidates_stale():
+    from wreqs import ResponseCache
+
+    cache = ResponseCache()
+    key = f"k{random.randint(0, 10**9)}"
+
+    def count() -> int:
+        with wreq(requests.Request("GET", prepare_url(f"cached/{key}/count"))) as r:
+            return r.json()["count"]
+
+    with wreqs_session(cache=cache):
+        for _ in range(3):
+            with wreq(requests.Request("GET", prepare_url(f"cached/{key}"))) as response:
+                assert response.status_code == 200
+                assert response.json() == {"key": key, "hits": 1}
+    assert count() == 1
+    assert cache.stats().hits == 2
+
+    stale_url = prepare_url(f"cached/{key}?max_age=0")
+    with wreq(requests.Request("GET", stale_url), cache=cache) as response:
+        assert response.json()["hits"] == 2
+    with wreq(requests.Request("GET", stale_url), cache=cache) as response:
+        assert response.status_code == 200
+        assert response.json()["hits"] == 2
+    assert count() == 3
+    assert cache.stats().revalidations == 1
@@ -9,6 +9,26 @@ Main components:
 - wreqs_session: A context manager for managing request sessions.
 - RequestContext: The core class handling request execution and retries.
 - configure_logger: A function to set up logging for the wreqs module.
+- StructuredFormatter: Writes log records, request fields included, as JSON lines.
+- set_json_codec: Picks the JSON library (orjson/ujson/stdlib) used to decode bodies.
+- pool_stats: Reports per-host connection pool usage for a session.
+- SessionPool: Thread-safe pool of sessions sharing one set of connection pools.
+- DNSCache: TTL-bounded host name cache with negative caching and background refresh.
+- awreq / awreqs_session: asyncio counterparts of wreq and wreqs_session.
+- wreq_many: Runs many requests concurrently over a bounded thread pool.
+- wreq_map: Fetches on threads and hands bodies to a process pool for CPU-bound handling.
+- wreq_paginate: Walks paginated APIs, prefetching the next page in the background.
+- ResponseCache: In-memory HTTP cache with LRU eviction and revalidation.
+- SingleFlight: Coalesces identical in-flight requests into one network call.
+- RequestTemplate: Prepares a request once and stamps out copies for hot loops.
+- wreqs_deadline: Bounds every request in a scope by one overall deadline.
+- CompressionPolicy: Gzip/deflate compression of large request bodies.
+- HedgePolicy: Sends a backup attempt for slow idempotent requests.
+- RateLimiter: Per-host client-side rate limiting that adapts to RateLimit headers.
+- MetricsRegistry: Per-attempt metrics with Prometheus text exposition.
+- wreq_download: Streams large bodies to disk, resuming interrupted transfers.
+- MockAdapter / RecordingAdapter: In-process scripted transport and cassette recording.
+- ResponseBody: Zero-copy access to bodies read with max_body_size or spilled to disk.
 
 Typical usage:
 
@@ -24,7 +44,57 @@ For more detailed information, refer to the documentation of each component.
 """
 
 from .context import wreq, wreqs_session, RequestContext, configure_logger
-from .error import RetryRequestError
+from .error import (
+    CircuitOpenError,
+    BodyTooLargeError,
+    DeadlineExceededError,
+    DownloadError,
+    RateLimitExceededError,
+    RetryBudgetExhaustedError,
+    RetryRequestError,
+    SessionPoolExhaustedError,
+)
+from .pool import PoolStats, pool_stats
+from .sessionpool import SessionPool, SessionPoolStats
+from .backoff import (
+    Backoff,
+    ExponentialBackoff,
+    FullJitterBackoff,
+    DecorrelatedJitterBackoff,
+)
+from .breaker import CircuitBreaker, RetryBudget
+from .proxy import ProxyPool, ProxyStats
+from .ratelimit import RateLimiter
+from .hedge import HedgePolicy
+from .compression import CompressionPolicy
+from .codec import JSONCodec, get_json_codec, set_json_codec
+from .logs import StructuredFormatter
+from .dns import DNSCache, DNSCacheStats, DNSCachingAdapter
+from .mock import MockAdapter, MockResponse, RecordingAdapter
+from .body import ResponseBody, SpilledResponse, detach_body
+from .deadline import time_left, wreqs_deadline
+from .cache import CacheStats, ResponseCache
+from .singleflight import SingleFlight, SingleFlightStats
+from .download import DownloadResult, wreq_download
+from .template import RequestTemplate
+from .metrics import AttemptInfo, MetricsHook, MetricsRegistry, RequestInfo
+from .batch import BatchResult, wreq_many
+from .procmap import MapResult, RawResponse, wreq_map
+from .paginate import (
+    CursorPaginator,
+    LinkHeaderPaginator,
+    OffsetPaginator,
+    Paginator,
+    wreq_paginate,
+)
+from .aio import (
+    awreq,
+    awreqs_session,
+    AsyncRequestContext,
+    AsyncSession,
+    AsyncTransport,
+    StreamTransport,
+)
 
 __all__ = [
     "wreq",
@@ -32,6 +102,70 @@ __all__ = [
     "RequestContext",
     "configure_logger",
     "RetryRequestError",
+    "RetryBudgetExhaustedError",
+    "CircuitOpenError",
+    "PoolStats",
+    "pool_stats",
+    "awreq",
+    "awreqs_session",
+    "AsyncRequestContext",
+    "AsyncSession",
+    "AsyncTransport",
+    "StreamTransport",
+    "wreq_many",
+    "BatchResult",
+    "Backoff",
+    "ExponentialBackoff",
+    "FullJitterBackoff",
+    "DecorrelatedJitterBackoff",
+    "CircuitBreaker",
+    "RetryBudget",
+    "ProxyPool",
+    "ProxyStats",
+    "ResponseCache",
+    "CacheStats",
+    "SingleFlight",
+    "SingleFlightStats",
+    "wreq_download",
+    "DownloadResult",
+    "DownloadError",
+    "RequestTemplate",
+    "MetricsHook",
+    "MetricsRegistry",
+    "AttemptInfo",
+    "RequestInfo",
+    "RateLimiter",
+    "RateLimitExceededError",
+    "HedgePolicy",
+    "wreqs_deadline",
+    "time_left",
+    "DeadlineExceededError",
+    "SessionPool",
+    "SessionPoolStats",
+    "SessionPoolExhaustedError",
+    "CompressionPolicy",
+    "JSONCodec",
+    "get_json_codec",
+    "set_json_codec",
+    "wreq_paginate",
+    "Paginator",
+    "LinkHeaderPaginator",
+    "CursorPaginator",
+    "OffsetPaginator",
+    "StructuredFormatter",
+    "MockAdapter",
+    "MockResponse",
+    "RecordingAdapter",
+    "DNSCache",
+    "DNSCacheStats",
+    "DNSCachingAdapter",
+    "wreq_map",
+    "MapResult",
+    "RawResponse",
+    "ResponseBody",
+    "SpilledResponse",
+    "detach_body",
+    "BodyTooLargeError",
 ]
 
 __version__ = "0.1.3"  # Update this with your current version
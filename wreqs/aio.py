@@ -0,0 +1,949 @@
+"""
+Native asyncio counterparts of `wreq`, `wreqs_session` and `RequestContext`.
+
+Requests are still described with `requests.Request` objects and prepared by a
+regular `requests.Session` (headers, cookies, auth), but they are sent through an
+`AsyncTransport`, so thousands of concurrent requests can share one event loop.
+"""
+
+import asyncio
+import http.client
+import inspect
+import io
+import logging
+import os
+import ssl
+import time
+import zlib
+from base64 import b64encode
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from datetime import timedelta
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import unquote, urlsplit
+
+from requests import ConnectionError, ConnectTimeout, PreparedRequest, ReadTimeout
+from requests import Request, Response, Session, TooManyRedirects
+from requests.exceptions import ContentDecodingError
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers
+
+from wreqs import context as _context
+from wreqs.backoff import Backoff
+from wreqs.breaker import default_is_failure
+from wreqs.codec import cache_json
+from wreqs.deadline import TimeoutType, _wreqs_deadline, attempt_timeout, resolve_deadline
+from wreqs.error import DeadlineExceededError, RetryRequestError
+from wreqs.fmt import LazyRequestStr, LazyResponseStr
+from wreqs.logs import RequestLog
+from wreqs.proxy import ProxyPool
+from wreqs.ratelimit import RateLimiter
+
+_awreqs_session: ContextVar[Optional["AsyncSession"]] = ContextVar(
+    "_awreqs_session", default=None
+)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_SUPPORTED_ENCODINGS = ("gzip", "deflate")
+
+
+class AsyncTransport:
+    """
+    Interface for the object that actually puts an async request on the wire.
+
+    Implementations receive a fully prepared request and return a `requests.Response`
+    whose body has already been read into memory. Subclass this to plug in another
+    HTTP client (for example aiohttp or httpx) or a fake transport in tests.
+    """
+
+    async def send(
+        self,
+        request: PreparedRequest,
+        timeout: TimeoutType = None,
+        proxies: Optional[Dict[str, str]] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+    ) -> Response:
+        """
+        Send a single request, without following redirects.
+
+        Args:
+            request (PreparedRequest): The request to send.
+            timeout (TimeoutType, optional): Seconds to wait, or a (connect, read) tuple.
+            proxies (Optional[Dict[str, str]], optional): Scheme to proxy URL mapping.
+            verify (Union[bool, str], optional): TLS verification flag or CA bundle path.
+            cert (Optional[Union[str, Tuple[str, str]]], optional): Client certificate.
+
+        Returns:
+            Response: The response, with its content loaded.
+        """
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """Release every resource held by the transport."""
+
+
+class _RawResponse:
+    """Minimal stand-in for urllib3's response so requests' cookie helpers work."""
+
+    def __init__(self, msg: http.client.HTTPMessage, wire_bytes: int) -> None:
+        self._original_response = _OriginalResponse(msg)
+        self._wire_bytes = wire_bytes
+
+    def tell(self) -> int:
+        return self._wire_bytes
+
+    def close(self) -> None:
+        pass
+
+
+class _OriginalResponse:
+    def __init__(self, msg: http.client.HTTPMessage) -> None:
+        self.msg = msg
+
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+_PoolKey = Tuple[str, str, int, Optional[str]]
+
+
+class StreamTransport(AsyncTransport):
+    """
+    Default `AsyncTransport` speaking HTTP/1.1 over asyncio streams.
+
+    Keep-alive connections are pooled per (scheme, host, port, proxy). HTTP proxies
+    are supported for http:// targets and, through CONNECT tunnels, for https://
+    targets. Response bodies compressed with gzip or deflate are decoded.
+
+    Args:
+        max_connections_per_host (Optional[int], optional): Upper bound on concurrent
+            connections per pool key. None means unbounded. Defaults to None.
+        max_idle_per_host (int, optional): Idle keep-alive connections kept per pool key.
+            Defaults to 10.
+    """
+
+    def __init__(
+        self, max_connections_per_host: Optional[int] = None, max_idle_per_host: int = 10
+    ) -> None:
+        self.max_connections_per_host = max_connections_per_host
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[_PoolKey, List[_Connection]] = {}
+        self._limits: Dict[_PoolKey, asyncio.Semaphore] = {}
+        self._ssl_contexts: Dict[Any, ssl.SSLContext] = {}
+
+    async def send(
+        self,
+        request: PreparedRequest,
+        timeout: TimeoutType = None,
+        proxies: Optional[Dict[str, str]] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+    ) -> Response:
+        connect_timeout, read_timeout = _split_timeout(timeout)
+        url = urlsplit(request.url or "")
+        scheme = url.scheme.lower()
+        host = url.hostname or ""
+        port = url.port or _DEFAULT_PORTS.get(scheme, 80)
+        proxy = (proxies or {}).get(scheme) or (proxies or {}).get("all")
+        key: _PoolKey = (scheme, host, port, proxy)
+        # serialized once: file and generator bodies cannot be read a second time when
+        # a stale connection forces a resend
+        absolute_form = proxy is not None and scheme == "http"
+        data = _serialize_request(request, url, absolute_form, proxy)
+
+        limit = self._limit(key)
+        if limit is not None:
+            await limit.acquire()
+        try:
+            start = time.perf_counter()
+            for reused in (True, False):
+                conn = self._pop_idle(key) if reused else None
+                if reused and conn is None:
+                    continue
+                if conn is None:
+                    conn = await self._connect(
+                        scheme, host, port, proxy, connect_timeout, verify, cert
+                    )
+                try:
+                    return await self._exchange(conn, key, request, data, read_timeout, start)
+                except _StaleConnection:
+                    continue  # server dropped an idle keep-alive connection
+            raise ConnectionError("Connection closed before a response was received")
+        finally:
+            if limit is not None:
+                limit.release()
+
+    async def aclose(self) -> None:
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for _, writer in conns:
+                writer.close()
+
+    def _limit(self, key: _PoolKey) -> Optional[asyncio.Semaphore]:
+        if self.max_connections_per_host is None:
+            return None
+        if key not in self._limits:
+            self._limits[key] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._limits[key]
+
+    def _pop_idle(self, key: _PoolKey) -> Optional[_Connection]:
+        conns = self._idle.get(key)
+        while conns:
+            reader, writer = conns.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()
+        return None
+
+    def _release(self, key: _PoolKey, conn: _Connection, keep_alive: bool) -> None:
+        conns = self._idle.setdefault(key, [])
+        if keep_alive and len(conns) < self.max_idle_per_host:
+            conns.append(conn)
+        else:
+            conn[1].close()
+
+    def _ssl_context(
+        self, verify: Union[bool, str], cert: Optional[Union[str, Tuple[str, str]]]
+    ) -> ssl.SSLContext:
+        cache_key = (verify, cert)
+        if cache_key not in self._ssl_contexts:
+            if verify is False:
+                ctx = ssl.create_default_context()
+                ctx.check_hostname = False
+                ctx.verify_mode = ssl.CERT_NONE
+            elif isinstance(verify, str):
+                ctx = ssl.create_default_context(
+                    cafile=None if os.path.isdir(verify) else verify,
+                    capath=verify if os.path.isdir(verify) else None,
+                )
+            else:
+                ctx = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+            if cert:
+                if isinstance(cert, tuple):
+                    ctx.load_cert_chain(*cert)
+                else:
+                    ctx.load_cert_chain(cert)
+            self._ssl_contexts[cache_key] = ctx
+        return self._ssl_contexts[cache_key]
+
+    async def _connect(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        proxy: Optional[str],
+        connect_timeout: Optional[float],
+        verify: Union[bool, str],
+        cert: Optional[Union[str, Tuple[str, str]]],
+    ) -> _Connection:
+        ssl_ctx = self._ssl_context(verify, cert) if scheme == "https" else None
+        try:
+            if proxy is None:
+                return await asyncio.wait_for(
+                    asyncio.open_connection(
+                        host, port, ssl=ssl_ctx, server_hostname=host if ssl_ctx else None
+                    ),
+                    connect_timeout,
+                )
+            return await asyncio.wait_for(
+                self._connect_via_proxy(host, port, proxy, ssl_ctx), connect_timeout
+            )
+        except asyncio.TimeoutError:
+            raise ConnectTimeout(f"Connection to {host}:{port} timed out")
+        except (OSError, ssl.SSLError) as e:
+            raise ConnectionError(f"Failed to connect to {host}:{port}: {e}")
+
+    async def _connect_via_proxy(
+        self, host: str, port: int, proxy: str, ssl_ctx: Optional[ssl.SSLContext]
+    ) -> _Connection:
+        proxy_url = urlsplit(proxy)
+        reader, writer = await asyncio.open_connection(
+            proxy_url.hostname, proxy_url.port or _DEFAULT_PORTS.get(proxy_url.scheme, 80)
+        )
+        if ssl_ctx is None:
+            return reader, writer
+
+        lines = [f"CONNECT {host}:{port} HTTP/1.1", f"Host: {host}:{port}"]
+        auth = _proxy_authorization(proxy)
+        if auth:
+            lines.append(f"Proxy-Authorization: {auth}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        _, status, _ = _parse_status_line(status_line)
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        if status != 200:
+            writer.close()
+            raise ConnectionError(f"Proxy CONNECT to {host}:{port} failed with {status}")
+
+        await writer.start_tls(ssl_ctx, server_hostname=host)
+        return reader, writer
+
+    async def _exchange(
+        self,
+        conn: _Connection,
+        key: _PoolKey,
+        request: PreparedRequest,
+        data: bytes,
+        read_timeout: Optional[float],
+        start: float,
+    ) -> Response:
+        reader, writer = conn
+        method = (request.method or "GET").upper()
+
+        try:
+            writer.write(data)
+            await writer.drain()
+            status_line = await asyncio.wait_for(reader.readline(), read_timeout)
+        except asyncio.CancelledError:
+            # the connection is mid-exchange and cannot be reused
+            writer.close()
+            raise
+        except asyncio.TimeoutError:
+            writer.close()
+            raise ReadTimeout(f"Read timed out after {read_timeout}s")
+        except OSError:
+            writer.close()
+            raise _StaleConnection()
+        if not status_line:
+            writer.close()
+            raise _StaleConnection()
+
+        try:
+            version, status, reason, msg, body, wire, keep_alive = await asyncio.wait_for(
+                _read_response(reader, status_line, method), read_timeout
+            )
+        except asyncio.CancelledError:
+            writer.close()
+            raise
+        except asyncio.TimeoutError:
+            writer.close()
+            raise ReadTimeout(f"Read timed out after {read_timeout}s")
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            writer.close()
+            raise ConnectionError(f"Connection broken while reading response: {e}")
+
+        self._release(key, conn, keep_alive and version == "HTTP/1.1")
+        # decoded after the release: the body was read in full, so the connection is fine
+        body = _decode_body(body, msg.get("Content-Encoding"), request.url)
+        return _build_response(request, status, reason, msg, body, wire, start)
+
+
+class _StaleConnection(Exception):
+    pass
+
+
+def _split_timeout(timeout: TimeoutType) -> Tuple[Optional[float], Optional[float]]:
+    if isinstance(timeout, tuple):
+        return timeout[0], timeout[1]
+    return timeout, timeout
+
+
+def _proxy_authorization(proxy: str) -> Optional[str]:
+    parsed = urlsplit(proxy)
+    if parsed.username is None:
+        return None
+    credentials = f"{unquote(parsed.username)}:{unquote(parsed.password or '')}"
+    return "Basic " + b64encode(credentials.encode("latin-1")).decode("ascii")
+
+
+def _serialize_request(
+    request: PreparedRequest, url: Any, absolute_form: bool, proxy: Optional[str]
+) -> bytes:
+    method = (request.method or "GET").upper()
+    target = request.url if absolute_form else (request.path_url or "/")
+    headers = CaseInsensitiveDict(request.headers)
+
+    body = request.body
+    if body is None:
+        payload = b""
+    elif isinstance(body, bytes):
+        payload = body
+    elif isinstance(body, str):
+        payload = body.encode("utf-8")
+    elif hasattr(body, "read"):
+        data = body.read()
+        payload = data.encode("utf-8") if isinstance(data, str) else data
+    else:
+        payload = b"".join(
+            chunk.encode("utf-8") if isinstance(chunk, str) else chunk for chunk in body
+        )
+    if body is not None:
+        headers.pop("Transfer-Encoding", None)
+        headers["Content-Length"] = str(len(payload))
+
+    if "Host" not in headers:
+        default_port = _DEFAULT_PORTS.get(url.scheme)
+        netloc = url.hostname or ""
+        if ":" in netloc:
+            netloc = f"[{netloc}]"
+        if url.port and url.port != default_port:
+            netloc = f"{netloc}:{url.port}"
+        headers["Host"] = netloc
+
+    accept = headers.get("Accept-Encoding")
+    if accept:
+        codings = [c.strip() for c in accept.split(",")]
+        supported = [c for c in codings if c.split(";")[0] in _SUPPORTED_ENCODINGS]
+        headers["Accept-Encoding"] = ", ".join(supported) or "identity"
+
+    if absolute_form and proxy:
+        auth = _proxy_authorization(proxy)
+        if auth:
+            headers["Proxy-Authorization"] = auth
+
+    lines = [f"{method} {target} HTTP/1.1"]
+    lines.extend(f"{k}: {v}" for k, v in headers.items())
+    head = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+    return head + payload
+
+
+def _parse_status_line(line: bytes) -> Tuple[str, int, str]:
+    parts = line.decode("latin-1").strip().split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ValueError(f"Malformed status line: {line!r}")
+    return parts[0], int(parts[1]), parts[2] if len(parts) > 2 else ""
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Tuple[bytes, int]:
+    lines = []
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise asyncio.IncompleteReadError(b"".join(lines), None)
+        lines.append(line)
+        if line in (b"\r\n", b"\n"):
+            data = b"".join(lines)
+            return data, len(data)
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> Tuple[bytes, int]:
+    chunks = []
+    wire = 0
+    while True:
+        size_line = await reader.readline()
+        wire += len(size_line)
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            _, trailer = await _read_headers(reader)
+            return b"".join(chunks), wire + trailer
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+        wire += size + 2
+
+
+async def _read_response(
+    reader: asyncio.StreamReader, status_line: bytes, method: str
+) -> Tuple[str, int, str, http.client.HTTPMessage, bytes, int, bool]:
+    version, status, reason = _parse_status_line(status_line)
+    header_bytes, wire = await _read_headers(reader)
+    wire += len(status_line)
+    while 100 <= status < 200 and status != 101:
+        status_line = await reader.readline()
+        version, status, reason = _parse_status_line(status_line)
+        header_bytes, size = await _read_headers(reader)
+        wire += len(status_line) + size
+
+    msg = http.client.parse_headers(io.BytesIO(header_bytes))
+    keep_alive = "close" not in (msg.get("Connection") or "").lower()
+
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        body = b""
+    elif "chunked" in (msg.get("Transfer-Encoding") or "").lower():
+        body, size = await _read_chunked(reader)
+        wire += size
+    elif msg.get("Content-Length") is not None:
+        body = await reader.readexactly(int(msg["Content-Length"]))
+        wire += len(body)
+    else:
+        body = await reader.read()
+        wire += len(body)
+        keep_alive = False
+
+    return version, status, reason, msg, body, wire, keep_alive
+
+
+def _decode_body(body: bytes, content_encoding: Optional[str], url: Optional[str]) -> bytes:
+    encoding = (content_encoding or "").strip().lower()
+    try:
+        if encoding == "gzip":
+            return zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+    except zlib.error as e:
+        # what requests raises for the same body
+        raise ContentDecodingError(f"Failed to decode {encoding} response from {url}: {e}")
+    return body
+
+
+def _build_response(
+    request: PreparedRequest,
+    status: int,
+    reason: str,
+    msg: http.client.HTTPMessage,
+    body: bytes,
+    wire: int,
+    start: float,
+) -> Response:
+    headers: CaseInsensitiveDict = CaseInsensitiveDict()
+    for name, value in msg.items():
+        headers[name] = f"{headers[name]}, {value}" if name in headers else value
+
+    response = Response()
+    response.status_code = status
+    response.reason = reason
+    response.headers = headers
+    response.url = request.url or ""
+    response.request = request
+    response.encoding = get_encoding_from_headers(headers)
+    response.raw = _RawResponse(msg, wire)
+    response._content = body
+    response._content_consumed = True
+    response.elapsed = timedelta(seconds=time.perf_counter() - start)
+    extract_cookies_to_jar(response.cookies, request, response.raw)
+    return response
+
+
+class AsyncSession:
+    """
+    Async session pairing a `requests.Session` with an `AsyncTransport`.
+
+    The wrapped `requests.Session` provides request preparation, default headers,
+    authentication and the cookie jar; the transport sends the bytes.
+
+    Args:
+        session (Optional[Session], optional): Session used for preparation and cookie
+            state. If None, a new one is created and closed by `aclose`. Defaults to None.
+        transport (Optional[AsyncTransport], optional): Transport used to send requests.
+            If None, a `StreamTransport` is created and closed by `aclose`. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        transport: Optional[AsyncTransport] = None,
+    ) -> None:
+        self.owns_session = session is None
+        self.owns_transport = transport is None
+        self.session = session or Session()
+        self.transport = transport or StreamTransport()
+
+    def prepare_request(self, request: Request) -> PreparedRequest:
+        return self.session.prepare_request(request)
+
+    async def send(
+        self,
+        request: PreparedRequest,
+        timeout: TimeoutType = None,
+        proxies: Optional[Dict[str, str]] = None,
+        allow_redirects: bool = True,
+    ) -> Response:
+        """
+        Send a prepared request, persisting cookies and following redirects.
+
+        Args:
+            request (PreparedRequest): The request to send.
+            timeout (TimeoutType, optional): Seconds to wait, or a (connect, read) tuple.
+            proxies (Optional[Dict[str, str]], optional): Scheme to proxy URL mapping.
+            allow_redirects (bool, optional): Follow redirects. Defaults to True.
+
+        Returns:
+            Response: The final response, with any redirects in `response.history`.
+        """
+        history: List[Response] = []
+        while True:
+            response = await self.transport.send(
+                request,
+                timeout=timeout,
+                proxies=proxies,
+                verify=self.session.verify,
+                cert=self.session.cert,
+            )
+            extract_cookies_to_jar(self.session.cookies, request, response.raw)
+
+            if not allow_redirects or not response.is_redirect:
+                break
+            if len(history) >= self.session.max_redirects:
+                raise TooManyRedirects(
+                    f"Exceeded {self.session.max_redirects} redirects.",
+                    response=response,
+                )
+            next_request = next(
+                self.session.resolve_redirects(
+                    response, request, proxies=proxies, yield_requests=True
+                ),
+                None,
+            )
+            if next_request is None:
+                break
+            history.append(response)
+            request = next_request  # type: ignore[assignment]
+
+        response.history = history
+        return response
+
+    async def aclose(self) -> None:
+        if self.owns_transport:
+            await self.transport.aclose()
+        if self.owns_session:
+            self.session.close()
+
+
+async def _maybe_await(value: Union[Any, Awaitable[Any]]) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncRequestContext:
+    """
+    Async equivalent of `RequestContext`, used through `awreq`.
+
+    Args:
+        request (Union[Request, PreparedRequest]): The request to be made. A Request is
+            prepared once and reused for every attempt; a PreparedRequest is sent as is.
+        max_retries (int, optional): The maximum number of retry attempts. Defaults to 3.
+        check_retry (Optional[Callable[[Response], Union[bool, Awaitable[bool]]]], optional):
+            Returns (or resolves to) True if a retry should be attempted. Defaults to None.
+        retry_callback (Optional[Callable[[Response], Union[None, Awaitable[None]]]], optional):
+            Called, and awaited if it returns an awaitable, before each retry. Defaults to None.
+        session (Optional[AsyncSession], optional): The async session to use. If None, a
+            new one is created and closed on exit. Defaults to None.
+        timeout (TimeoutType, optional): Per-attempt timeout in seconds, or a
+            (connect, read) tuple. Defaults to None.
+        proxies (Optional[Union[List[str], ProxyPool]], optional): Proxies rotated
+            round-robin across attempts, or a shared `ProxyPool`. Defaults to None.
+        backoff (Optional[Backoff], optional): Backoff policy awaited (via its
+            `async_sleep`) before each retry. Defaults to None.
+        rate_limiter (Optional[RateLimiter], optional): Limiter awaited (via its
+            `async_sleep`) before each attempt. Defaults to None.
+        total_timeout (Optional[float], optional): Seconds the whole request may take,
+            retries and backoff included. Defaults to None.
+        deadline (Optional[float], optional): Absolute `time.monotonic()` deadline; the
+            earliest of it, `total_timeout` and an enclosing `wreqs_deadline` applies.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        request: Union[Request, PreparedRequest],
+        max_retries: int = 3,
+        check_retry: Optional[
+            Callable[[Response], Union[bool, Awaitable[bool]]]
+        ] = None,
+        retry_callback: Optional[
+            Callable[[Response], Union[None, Awaitable[None]]]
+        ] = None,
+        session: Optional[AsyncSession] = None,
+        timeout: TimeoutType = None,
+        proxies: Optional[Union[List[str], ProxyPool]] = None,
+        backoff: Optional[Backoff] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        total_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> None:
+        self.logger: logging.Logger = _context.logger
+        self.request = request
+        self.response: Optional[Response] = None
+        self.owns_session = session is None
+        self.session = session or AsyncSession()
+        self.max_retries = max_retries
+        self.check_retry = check_retry
+        self.retry_callback = retry_callback
+        self.timeout = timeout
+        self.proxies = proxies
+        self.backoff = backoff
+        self.rate_limiter = rate_limiter
+        self.deadline = resolve_deadline(deadline, total_timeout)
+        self.current_proxy_index: int = 0
+        self._current_proxy: Optional[str] = None
+        self._prepared: Optional[PreparedRequest] = None
+        self._request_str = LazyRequestStr(request)
+        self._response_str: Optional[LazyResponseStr] = None
+        self._log = RequestLog(self.logger, request)
+        self._attempts = 0
+
+        self._log.step("AsyncRequestContext initialized: %s", self._request_str)
+        self.logger.debug("Max retries: %d", max_retries)
+
+    def _get_next_proxy(self) -> Optional[Dict[str, str]]:
+        if not self.proxies:
+            return None
+        if isinstance(self.proxies, ProxyPool):
+            proxy = self.proxies.select()
+        else:
+            proxy = self.proxies[self.current_proxy_index]
+            self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxies)
+        self._current_proxy = proxy
+        return {"http": proxy, "https": proxy}
+
+    def _prepare(self) -> PreparedRequest:
+        if self._prepared is None:
+            self._log.step("Preparing request")
+            if isinstance(self.request, PreparedRequest):
+                self._prepared = self.request
+            else:
+                self._prepared = self.session.prepare_request(self.request)
+        return self._prepared.copy()
+
+    async def _fetch(self) -> Response:
+        prepared_request = self._prepare()
+
+        rate_key = None
+        if self.rate_limiter:
+            rate_key = self.rate_limiter.key(self.request)
+            # never wait for a slot past the deadline
+            left = None if self.deadline is None else self.deadline - time.monotonic()
+            waited = await self.rate_limiter.acquire_async(rate_key, left)
+            if waited:
+                self._log.step("Rate limited, waited %.3fs", waited)
+
+        timeout = attempt_timeout(self.timeout, self.deadline)
+        proxy = self._get_next_proxy()
+        if proxy:
+            self._log.step("Using proxy: %s", proxy)
+
+        self._attempts += 1
+        started = time.perf_counter()
+        try:
+            response = await self.session.send(
+                prepared_request, timeout=timeout, proxies=proxy
+            )
+        except Exception as e:
+            timed_out = isinstance(e, (ConnectTimeout, ReadTimeout))
+            if timed_out:
+                self.logger.error("Request timed out after %ss", timeout)
+            self._report_proxy(time.perf_counter() - started, None, e)
+            if (
+                timed_out
+                and self.deadline is not None
+                and time.monotonic() >= self.deadline
+            ):
+                raise DeadlineExceededError(
+                    f"Deadline exceeded for request {self._request_str}."
+                ) from e
+            raise
+
+        self._report_proxy(time.perf_counter() - started, response, None)
+        response = cache_json(response)
+        if rate_key is not None:
+            self.rate_limiter.update(rate_key, response)
+        if self._log.enabled():
+            self._response_str = LazyResponseStr(response)
+            self._log.step("Received response: %s", self._response_str)
+
+        return response
+
+    def _report_proxy(
+        self,
+        elapsed: float,
+        response: Optional[Response],
+        exception: Optional[BaseException],
+    ) -> None:
+        if isinstance(self.proxies, ProxyPool) and self._current_proxy is not None:
+            failed = default_is_failure(response, exception)
+            self.proxies.report(self._current_proxy, elapsed, not failed)
+
+    async def _handle_retry(self) -> Response:
+        retries = 0
+        delay = 0.0
+        while retries < self.max_retries:
+            self._log.step("Attempt %d/%d", retries + 1, self.max_retries)
+            self.response = await self._fetch()
+            if not self.check_retry or not await _maybe_await(
+                self.check_retry(self.response)
+            ):
+                self._log.step("Request successful, no retry needed")
+                return self.response
+            retries += 1
+
+            self._log.retry(retries, self.max_retries, self.response, self._request_str)
+
+            if self.retry_callback:
+                self._log.step("Calling `retry_callback` before retry.")
+                await _maybe_await(self.retry_callback(self.response))
+
+            if self.backoff and retries < self.max_retries:
+                delay = self.backoff.delay(retries, delay, self.response)
+                if self.deadline is not None and time.monotonic() + delay >= self.deadline:
+                    self.logger.error("Backing off %.3fs would pass the deadline", delay)
+                    raise DeadlineExceededError(
+                        f"Deadline exceeded for request {self._request_str}."
+                    )
+                self._log.step("Backing off %.3fs before retry", delay)
+                await self.backoff.async_sleep(delay)
+
+        self.logger.error("Max retries (%d) reached without success", self.max_retries)
+        raise RetryRequestError(
+            f"Failed after {self.max_retries} retries for request {self._request_str}."
+        )
+
+    async def __aenter__(self) -> Response:
+        self._log.step("Entering AsyncRequestContext: %s", self._request_str)
+        try:
+            if self.check_retry:
+                response = await self._handle_retry()
+            else:
+                response = self.response = await self._fetch()
+        except Exception as e:
+            self.logger.error("Error during request: %s", e)
+            self._log.finished(self._attempts, self.response, e)
+            raise
+        self._log.finished(self._attempts, response, None)
+        return response
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._response_str is not None:
+            self._log.step("Exiting AsyncRequestContext: %s", self._response_str)
+
+        if self.owns_session:
+            self.logger.debug("Closing session")
+            await self.session.aclose()
+
+        if exc_type:
+            self.logger.error("Exception occurred: %s: %s", exc_type.__name__, exc_val)
+
+
+@asynccontextmanager
+async def awreq(
+    req: Union[Request, PreparedRequest],
+    max_retries: int = 3,
+    check_retry: Optional[Callable[[Response], Union[bool, Awaitable[bool]]]] = None,
+    retry_callback: Optional[Callable[[Response], Union[None, Awaitable[None]]]] = None,
+    session: Optional[AsyncSession] = None,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[List[str], ProxyPool]] = None,
+    backoff: Optional[Backoff] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    total_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+) -> AsyncGenerator[Response, None]:
+    """
+    Async context manager for making HTTP requests with retry and timeout capabilities.
+
+    Behaves like `wreq`, but sends requests through the active `awreqs_session` (or a
+    fresh `AsyncSession`) without blocking the event loop. `check_retry` and
+    `retry_callback` may be plain functions or coroutines.
+
+    Args:
+        req (Union[Request, PreparedRequest]): The request to be made, e.g. from a
+            `RequestTemplate`.
+        max_retries (int, optional): The maximum number of retry attempts. Defaults to 3.
+        check_retry (optional): Returns (or resolves to) True if a retry should be
+            attempted. If None, no retries will be attempted. Defaults to None.
+        retry_callback (optional): Called, and awaited if needed, before each retry.
+            Defaults to None.
+        session (Optional[AsyncSession], optional): The async session to use. If None, the
+            active `awreqs_session` is used, or a new one is created and closed on exit.
+            Defaults to None.
+        timeout (TimeoutType, optional): Per-attempt timeout in seconds, or a
+            (connect, read) tuple. Defaults to None.
+        proxies (Optional[Union[List[str], ProxyPool]], optional): Proxies rotated
+            round-robin across attempts, or a shared `ProxyPool`. Defaults to None.
+        backoff (Optional[Backoff], optional): Backoff policy awaited before each retry.
+            Defaults to None.
+        rate_limiter (Optional[RateLimiter], optional): Limiter awaited before each attempt;
+            may be shared with threaded `wreq` calls. Defaults to None.
+        total_timeout (Optional[float], optional): Seconds the whole request may take,
+            retries and backoff included. Defaults to None.
+        deadline (Optional[float], optional): Absolute `time.monotonic()` deadline; the
+            earliest of it, `total_timeout` and an enclosing `wreqs_deadline` applies.
+            Defaults to None.
+
+    Yields:
+        Response: The Response object from the successful request.
+
+    Raises:
+        RetryRequestError: If the maximum number of retries is reached without a successful response.
+        Timeout: If the request times out (`ConnectTimeout` or `ReadTimeout`).
+        DeadlineExceededError: If the deadline passes before the request completes.
+
+    Example:
+        ```python
+        import asyncio
+        from requests import Request
+        from wreqs import awreq, awreqs_session
+
+        async def main():
+            async with awreqs_session():
+                reqs = [Request("GET", f"https://api.example.com/items/{i}") for i in range(1000)]
+
+                async def fetch(req):
+                    async with awreq(req, timeout=10) as response:
+                        return response.json()
+
+                return await asyncio.gather(*(fetch(r) for r in reqs))
+
+        asyncio.run(main())
+        ```
+    """
+    if session is None:
+        session = _awreqs_session.get()
+
+    context = AsyncRequestContext(
+        req,
+        max_retries,
+        check_retry,
+        retry_callback=retry_callback,
+        session=session,
+        timeout=timeout,
+        proxies=proxies,
+        backoff=backoff,
+        rate_limiter=rate_limiter,
+        total_timeout=total_timeout,
+        deadline=deadline,
+    )
+    token: Token = _wreqs_deadline.set(context.deadline)
+    try:
+        yield await context.__aenter__()
+    finally:
+        await context.__aexit__(None, None, None)
+        _wreqs_deadline.reset(token)
+
+
+@asynccontextmanager
+async def awreqs_session(
+    transport: Optional[AsyncTransport] = None,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager that creates an `AsyncSession` shared by `awreq` calls.
+
+    Args:
+        transport (Optional[AsyncTransport], optional): Transport to send requests with.
+            If None, a `StreamTransport` is created. A transport passed in is not
+            closed on exit. Defaults to None.
+
+    Yields:
+        AsyncSession: The session used by every `awreq` inside the context.
+
+    Example:
+        ```python
+        async with awreqs_session() as session:
+            async with awreq(Request("POST", "https://api.example.com/login")) as response:
+                ...
+            async with awreq(Request("GET", "https://api.example.com/me")) as response:
+                print(response.json())  # login cookies were reused
+        ```
+    """
+    session = AsyncSession(transport=transport)
+    token: Token = _awreqs_session.set(session)
+    try:
+        yield session
+    finally:
+        _awreqs_session.reset(token)
+        await session.aclose()
@@ -0,0 +1,196 @@
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Collection, Optional
+
+from requests import Response
+
+# Values above this are treated as epoch timestamps rather than delta-seconds
+# (some APIs send `X-RateLimit-Reset: 1700000000`).
+_EPOCH_THRESHOLD = 10**9
+
+
+def parse_retry_after(
+    response: Response, now: Optional[Callable[[], float]] = None
+) -> Optional[float]:
+    """
+    Extract the server-requested wait, in seconds, from a response.
+
+    `Retry-After` is read first (delta-seconds or an HTTP-date), then
+    `RateLimit-Reset` and `X-RateLimit-Reset` (delta-seconds or epoch seconds).
+
+    Args:
+        response (Response): The response to inspect.
+        now (Optional[Callable[[], float]], optional): Wall clock returning epoch
+            seconds, used to turn absolute values into delays. Defaults to time.time.
+
+    Returns:
+        Optional[float]: The non-negative delay in seconds, or None if no usable header is present.
+    """
+    clock = now or time.time
+    headers = response.headers
+
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        value = retry_after.strip()
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - clock(), 0.0)
+        except (TypeError, ValueError, IndexError):
+            pass
+
+    for name in ("RateLimit-Reset", "X-RateLimit-Reset"):
+        reset = headers.get(name)
+        if reset is None:
+            continue
+        try:
+            seconds = float(reset.strip())
+        except ValueError:
+            continue
+        if seconds > _EPOCH_THRESHOLD:
+            seconds -= clock()
+        return max(seconds, 0.0)
+
+    return None
+
+
+class Backoff:
+    """
+    Base class for retry backoff policies used by `wreq(backoff=...)`.
+
+    Subclasses implement `compute`; this class adds capping, server hints
+    (`Retry-After`, `RateLimit-Reset`) and pluggable clock/sleep functions so
+    tests can run without real waits.
+
+    Args:
+        base (float, optional): Base delay in seconds. Defaults to 0.1.
+        cap (float, optional): Maximum computed delay in seconds. Defaults to 30.
+        respect_retry_after (bool, optional): Honor server wait hints on responses whose
+            status is in `retry_after_statuses`. Defaults to True.
+        retry_after_statuses (Collection[int], optional): Statuses whose hints are
+            honored. Defaults to (429, 503).
+        max_retry_after (Optional[float], optional): Upper bound applied to server hints.
+            None honors hints as sent. Defaults to None.
+        sleep (Callable[[float], None], optional): Blocking sleep. Defaults to time.sleep.
+        async_sleep (Callable[[float], Awaitable[None]], optional): Sleep used by `awreq`.
+            Defaults to asyncio.sleep.
+        clock (Callable[[], float], optional): Wall clock in epoch seconds, used for
+            HTTP-date and epoch hints. Defaults to time.time.
+        rng (Optional[random.Random], optional): Random source for jittered policies.
+            Defaults to a new, randomly seeded generator.
+    """
+
+    def __init__(
+        self,
+        base: float = 0.1,
+        cap: float = 30.0,
+        respect_retry_after: bool = True,
+        retry_after_statuses: Collection[int] = (429, 503),
+        max_retry_after: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.time,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if base < 0 or cap < 0:
+            raise ValueError("base and cap must be non-negative")
+        self.base = base
+        self.cap = cap
+        self.respect_retry_after = respect_retry_after
+        self.retry_after_statuses = retry_after_statuses
+        self.max_retry_after = max_retry_after
+        self.sleep = sleep
+        self.async_sleep = async_sleep
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+    def compute(self, attempt: int, previous: float) -> float:
+        """
+        Compute the raw delay before retry number `attempt`.
+
+        Args:
+            attempt (int): 1-based retry number.
+            previous (float): The delay used before the previous retry (0 for the first).
+
+        Returns:
+            float: Delay in seconds, before capping and server hints.
+        """
+        raise NotImplementedError
+
+    def delay(
+        self, attempt: int, previous: float = 0.0, response: Optional[Response] = None
+    ) -> float:
+        """
+        Delay before retry number `attempt`, taking server hints into account.
+
+        Args:
+            attempt (int): 1-based retry number.
+            previous (float, optional): The delay used before the previous retry.
+                Defaults to 0.
+            response (Optional[Response], optional): The response that triggered the retry.
+                Defaults to None.
+
+        Returns:
+            float: Delay in seconds.
+        """
+        delay = min(self.compute(attempt, previous), self.cap)
+
+        if (
+            self.respect_retry_after
+            and response is not None
+            and response.status_code in self.retry_after_statuses
+        ):
+            hint = parse_retry_after(response, self.clock)
+            if hint is not None:
+                if self.max_retry_after is not None:
+                    hint = min(hint, self.max_retry_after)
+                delay = max(delay, hint)
+
+        return delay
+
+
+class ExponentialBackoff(Backoff):
+    """
+    Deterministic exponential backoff: `base * factor ** (attempt - 1)`, capped.
+
+    Args:
+        factor (float, optional): Growth factor between attempts. Defaults to 2.
+        **kwargs: See `Backoff`.
+    """
+
+    def __init__(self, factor: float = 2.0, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.factor = factor
+
+    def compute(self, attempt: int, previous: float) -> float:
+        # bound the exponent so large attempt numbers cannot overflow a float
+        return self.base * self.factor ** min(attempt - 1, 64)
+
+
+class FullJitterBackoff(ExponentialBackoff):
+    """
+    "Full jitter": a uniform random delay between 0 and the capped exponential delay.
+
+    Spreads retries from many clients evenly, which is what breaks lockstep retry
+    storms against a struggling upstream.
+    """
+
+    def compute(self, attempt: int, previous: float) -> float:
+        return self.rng.uniform(0, min(self.cap, super().compute(attempt, previous)))
+
+
+class DecorrelatedJitterBackoff(Backoff):
+    """
+    "Decorrelated jitter": `uniform(base, previous * 3)`, capped.
+
+    Each delay depends on the previous one rather than on the attempt number,
+    which keeps retries spread out while still growing.
+    """
+
+    def compute(self, attempt: int, previous: float) -> float:
+        previous = max(previous, self.base)
+        return self.rng.uniform(self.base, previous * 3)
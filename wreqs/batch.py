@@ -0,0 +1,157 @@
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Iterable, Iterator, NamedTuple, Optional, Set, Union
+
+from requests import PreparedRequest, Request, Response, Session
+
+from wreqs.body import detach_body
+from wreqs.context import _wreqs_session, wreq
+from wreqs.metrics import _enqueued_at
+from wreqs.pool import configure_pool
+from wreqs.sessionpool import SessionPool
+
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of a single request executed by `wreq_many`.
+
+    Attributes:
+        index (int): Position of the request in the input iterable.
+        request (Union[Request, PreparedRequest]): The request that was executed.
+        response (Optional[Response]): The response, if the request succeeded.
+        exception (Optional[BaseException]): The error raised for this request, if any
+            (e.g. RetryRequestError, Timeout, ConnectionError).
+    """
+
+    index: int
+    request: Union[Request, PreparedRequest]
+    response: Optional[Response]
+    exception: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+
+def _run_one(
+    index: int,
+    req: Union[Request, PreparedRequest],
+    session: Union[Session, SessionPool],
+    owned: bool,
+    kwargs: Any,
+) -> BatchResult:
+    if owned:
+        # visible to nested wreq calls (e.g. from check_retry) in this task only
+        _wreqs_session.set(session)
+    try:
+        with wreq(req, session=session, **kwargs) as response:
+            # results outlive the context; a spilled body now belongs to the caller
+            return BatchResult(index, req, detach_body(response), None)
+    except Exception as e:
+        return BatchResult(index, req, None, e)
+
+
+def wreq_many(
+    requests: Iterable[Union[Request, PreparedRequest]],
+    max_workers: int = 8,
+    ordered: bool = True,
+    session: Optional[Union[Session, SessionPool]] = None,
+    **kwargs: Any,
+) -> Iterator[BatchResult]:
+    """
+    Execute many requests concurrently over a bounded thread pool.
+
+    Every request goes through `wreq`, so retries, timeouts and proxies behave exactly
+    as for a single call. Failures are reported per request instead of aborting the
+    batch, and at most `2 * max_workers` requests are pulled from `requests` ahead of
+    the results being consumed, so lazy iterables of any size are fine.
+
+    Args:
+        requests (Iterable[Union[Request, PreparedRequest]]): The requests to execute,
+            e.g. built by a `RequestTemplate`.
+        max_workers (int, optional): Number of worker threads. Defaults to 8.
+        ordered (bool, optional): If True, results are yielded in input order; otherwise
+            as soon as they complete. Defaults to True.
+        session (Optional[Union[Session, SessionPool]], optional): Session shared by all
+            workers, or a `SessionPool` each request checks a session out of. If None, the
+            active `wreqs_session` is used, or a session whose pool holds `max_workers`
+            connections per host is created and closed when the batch is done.
+            Defaults to None.
+        **kwargs: Options forwarded to `wreq` for every request (max_retries,
+            check_retry, retry_callback, timeout, proxies, backoff, ...).
+
+    Yields:
+        BatchResult: One result per request, holding either a response or an exception.
+
+    Example:
+        ```python
+        from requests import Request
+        from wreqs import wreq_many
+
+        reqs = (Request("GET", f"https://api.example.com/items/{i}") for i in range(500))
+        for result in wreq_many(reqs, max_workers=16, ordered=False):
+            if result.ok:
+                print(result.index, result.response.status_code)
+            else:
+                print(result.index, "failed:", result.exception)
+        ```
+
+    Notes:
+        - The caller's context (including `wreqs_session`) is copied into every task.
+        - When providing your own session, size its pool with `wreqs_session(pool_maxsize=...)`
+          to at least `max_workers`, or connections will be opened and discarded.
+        - With `spill_threshold`, responses keep their spilled bodies open (see
+          `detach_body`); close them when done, or leave them to the garbage collector.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    if session is None:
+        session = _wreqs_session.get()
+    owned = session is None
+    if session is None:
+        session = Session()
+        configure_pool(session, pool_maxsize=max_workers, pool_block=True)
+
+    window = 2 * max_workers
+    items = enumerate(requests)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: Deque[Future] = deque()
+    running: Set[Future] = set()
+
+    def submit_next() -> bool:
+        try:
+            index, req = next(items)
+        except StopIteration:
+            return False
+        ctx = contextvars.copy_context()
+        ctx.run(_enqueued_at.set, time.perf_counter())
+        future = executor.submit(ctx.run, _run_one, index, req, session, owned, kwargs)
+        pending.append(future)
+        running.add(future)
+        return True
+
+    try:
+        while len(pending) < window and submit_next():
+            pass
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+                result = future.result()
+            else:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+                result = future.result()
+            running.discard(future)
+            submit_next()
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if owned:
+            session.close()
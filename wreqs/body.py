@@ -0,0 +1,227 @@
+import io
+import mmap
+import tempfile
+from typing import IO, Any, Iterator, List, Optional, Union
+
+from requests import Response
+
+from wreqs.codec import JSONResponse
+from wreqs.error import BodyTooLargeError
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ResponseBody(io.RawIOBase):
+    """
+    Read-only, file-like access to a response body read by `wreq` with
+    `max_body_size` or `spill_threshold`, available as `response.body`.
+
+    Small bodies are held in memory; bodies above the spill threshold live in an
+    anonymous temporary file mapped with `mmap`. Either way `getbuffer()` exposes the
+    body as a `memoryview` and `readinto` copies straight into a caller's buffer, so
+    the body is never copied as a whole.
+
+    Notes:
+        - A spilled body is only valid until the `wreq` context exits, like a stream.
+        - Release memoryviews from `getbuffer()` before the context exits; a mapping
+          with live views is unmapped only once they are garbage collected.
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap], file: Optional[IO[bytes]] = None) -> None:
+        super().__init__()
+        self._data = data
+        self._file = file
+        self._view = memoryview(data)
+        self._pos = 0
+
+    @property
+    def spilled(self) -> bool:
+        """True if the body lives in a temporary file rather than in memory."""
+        return self._file is not None
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def getbuffer(self) -> memoryview:
+        """Return a read-only `memoryview` of the whole body, without copying it."""
+        self._check_open()
+        return self._view[:]
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        self._check_open()
+        target = memoryview(buffer).cast("B")
+        n = max(min(len(target), len(self._view) - self._pos), 0)
+        target[:n] = self._view[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._check_open()
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._pos
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self._view.release()
+        if isinstance(self._data, mmap.mmap):
+            try:
+                self._data.close()
+            except BufferError:
+                pass  # the caller still holds views; unmapped when they are collected
+        if self._file is not None:
+            self._file.close()  # already unlinked; the space is freed with the mapping
+        super().close()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed response body")
+
+
+class SpilledResponse(JSONResponse):
+    """
+    A response whose body was spilled to disk by `wreq`.
+
+    `response.body` gives zero-copy access and `iter_content()` streams from the
+    mapping. `content`, `text` and `json()` still work, but load the whole body into
+    memory on every access.
+    """
+
+    body: ResponseBody
+    # set by `detach_body`; the owner, not the `wreq` context, then closes the body
+    _detached = False
+
+    @property
+    def content(self) -> bytes:  # type: ignore[override]
+        return self.body.getbuffer().tobytes()
+
+    def close(self) -> None:
+        super().close()
+        self.body.close()
+
+
+def detach_body(response: Response) -> Response:
+    """
+    Keep a spilled response body open after its `wreq` context exits.
+
+    Call it inside the `with` block for responses that outlive it, e.g. results
+    collected for later. The caller then owns the temporary file: close the response
+    when done, or leave it to the garbage collector. Other responses are returned as is.
+
+    Args:
+        response (Response): The response yielded by `wreq`.
+
+    Returns:
+        Response: The same response.
+    """
+    if isinstance(response, SpilledResponse):
+        response._detached = True
+    return response
+
+
+def _too_large(response: Response, limit: int, size: Optional[int]) -> BodyTooLargeError:
+    response.close()
+    shown = f"{size} bytes" if size is not None else "more"
+    return BodyTooLargeError(
+        f"Response body of {response.url} is {shown}; the limit is {limit} bytes.",
+        limit=limit,
+        size=size,
+    )
+
+
+def read_body(
+    response: Response,
+    max_body_size: Optional[int] = None,
+    spill_threshold: Optional[int] = None,
+) -> Response:
+    """
+    Read a streamed response's body, enforcing a size limit and spilling large bodies.
+
+    Args:
+        response (Response): A response sent with `stream=True` (fully read responses
+            are checked against the limit only).
+        max_body_size (Optional[int], optional): Maximum decoded body size in bytes.
+            Defaults to None (unlimited).
+        spill_threshold (Optional[int], optional): Bodies larger than this many bytes
+            are written to a temporary file and memory-mapped. Defaults to None.
+
+    Returns:
+        Response: The same response with its body loaded and `response.body` set; a
+            `SpilledResponse` if the body was spilled.
+
+    Raises:
+        BodyTooLargeError: If the body exceeds `max_body_size`. A `Content-Length` over
+            the limit aborts before anything is read.
+    """
+    announced = response.headers.get("Content-Length", "")
+    length = int(announced) if announced.isdigit() else None
+    if max_body_size is not None and length is not None and length > max_body_size:
+        raise _too_large(response, max_body_size, length)
+
+    if response._content is not False:  # already read (e.g. by a mock adapter)
+        content = response.content or b""
+        if max_body_size is not None and len(content) > max_body_size:
+            raise _too_large(response, max_body_size, len(content))
+        response.body = ResponseBody(content)  # type: ignore[attr-defined]
+        return response
+
+    chunks: List[bytes] = []
+    size = 0
+    spill: Optional[IO[bytes]] = None
+    if spill_threshold is not None and length is not None and length > spill_threshold:
+        spill = tempfile.TemporaryFile()
+    try:
+        chunk_iter: Iterator[bytes] = response.iter_content(CHUNK_SIZE)
+        for chunk in chunk_iter:
+            size += len(chunk)
+            if max_body_size is not None and size > max_body_size:
+                # also stops compressed bodies that inflate past the limit
+                raise _too_large(response, max_body_size, None)
+            if spill is None and spill_threshold is not None and size > spill_threshold:
+                spill = tempfile.TemporaryFile()
+                spill.writelines(chunks)
+                chunks = []
+            if spill is not None:
+                spill.write(chunk)
+            else:
+                chunks.append(chunk)
+    except BaseException:
+        response.close()
+        if spill is not None:
+            spill.close()
+        raise
+
+    release = getattr(response.raw, "release_conn", None)
+    if release is not None:
+        release()
+    response._content_consumed = True
+    if spill is None or size == 0:
+        if spill is not None:
+            spill.close()
+        response._content = b"".join(chunks)
+        response.body = ResponseBody(response._content)  # type: ignore[attr-defined]
+        return response
+
+    spill.flush()
+    mapping = mmap.mmap(spill.fileno(), 0, access=mmap.ACCESS_READ)
+    # `iter_content` on a consumed response slices `_content`, which reads the mapping
+    response._content = mapping  # type: ignore[assignment]
+    response.__class__ = SpilledResponse
+    response.body = ResponseBody(mapping, spill)  # type: ignore[attr-defined]
+    return response
@@ -0,0 +1,286 @@
+"""
+Failure isolation for wreqs: per-host circuit breakers and retry budgets.
+
+Both are process-wide objects meant to be shared by every request to a
+dependency, typically by attaching them to `wreqs_session`.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from requests import Request, RequestException, Response
+
+from wreqs.error import CircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _SlidingWindow:
+    """
+    Event counters over the last `window` seconds, kept in fixed time buckets.
+
+    Not thread-safe on its own; callers hold their own lock.
+    """
+
+    def __init__(self, window: float, counters: int, buckets: int = 10) -> None:
+        self.width = window / buckets
+        self.counters = counters
+        self._buckets: List[List[int]] = [[-1] + [0] * counters for _ in range(buckets)]
+
+    def add(self, counter: int, now: float, amount: int = 1) -> None:
+        epoch = int(now / self.width)
+        bucket = self._buckets[epoch % len(self._buckets)]
+        if bucket[0] != epoch:
+            bucket[0] = epoch
+            for i in range(1, self.counters + 1):
+                bucket[i] = 0
+        bucket[counter + 1] += amount
+
+    def totals(self, now: float) -> List[int]:
+        epoch = int(now / self.width)
+        oldest = epoch - len(self._buckets)
+        totals = [0] * self.counters
+        for bucket in self._buckets:
+            if oldest < bucket[0] <= epoch:
+                for i in range(self.counters):
+                    totals[i] += bucket[i + 1]
+        return totals
+
+    def reset(self) -> None:
+        for bucket in self._buckets:
+            bucket[0] = -1
+
+
+def host_key(request: Request) -> str:
+    """Default circuit key: the `host[:port]` of the request URL."""
+    return urlsplit(request.url).netloc.lower()
+
+
+def default_is_failure(
+    response: Optional[Response], exception: Optional[BaseException]
+) -> bool:
+    """Connection errors, timeouts and 5xx responses count as failures."""
+    if exception is not None:
+        return isinstance(exception, RequestException)
+    return response is not None and response.status_code >= 500
+
+
+class _Circuit:
+    __slots__ = ("state", "opened_at", "trials", "window")
+
+    def __init__(self, window: _SlidingWindow) -> None:
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.trials = 0
+        self.window = window
+
+
+class CircuitBreaker:
+    """
+    Process-wide circuit breaker with one closed/open/half-open circuit per key.
+
+    A circuit opens when, over the last `window` seconds, at least `minimum_requests`
+    attempts were made and the share of failures reached `failure_rate_threshold`.
+    While open, attempts fail immediately with `CircuitOpenError`. After
+    `reset_timeout` seconds it lets up to `half_open_max_calls` trial attempts
+    through: a successful trial closes the circuit, a failed one re-opens it.
+
+    Args:
+        failure_rate_threshold (float, optional): Failure ratio (0-1] that opens the
+            circuit. Defaults to 0.5.
+        minimum_requests (int, optional): Attempts required in the window before the
+            failure ratio is evaluated. Defaults to 10.
+        window (float, optional): Length of the sliding window in seconds. Defaults to 30.
+        reset_timeout (float, optional): Seconds to stay open before probing.
+            Defaults to 30.
+        half_open_max_calls (int, optional): Concurrent trial attempts allowed while
+            half-open. Defaults to 1.
+        key (Callable[[Request], str], optional): Maps a request to its circuit.
+            Defaults to the URL's host.
+        is_failure (Callable[[Optional[Response], Optional[BaseException]], bool], optional):
+            Classifies an attempt. Defaults to connection errors, timeouts and 5xx.
+        clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, CircuitBreaker, CircuitOpenError
+
+        breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_requests=20)
+
+        with wreqs_session(circuit_breaker=breaker):
+            try:
+                with wreq(Request("GET", "https://flaky.example.com/data")) as response:
+                    ...
+            except CircuitOpenError:
+                ...  # serve a fallback without touching the network
+        ```
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        minimum_requests: int = 10,
+        window: float = 30.0,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        key: Callable[[Request], str] = host_key,
+        is_failure: Callable[
+            [Optional[Response], Optional[BaseException]], bool
+        ] = default_is_failure,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.key = key
+        self.is_failure = is_failure
+        self.clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit(_SlidingWindow(self.window, 2))
+        return circuit
+
+    def state(self, key: str) -> str:
+        """
+        Current state of a circuit: "closed", "open" or "half_open".
+
+        An open circuit whose reset timeout elapsed is reported as "half_open".
+        """
+        with self._lock:
+            circuit = self._circuit(key)
+            if (
+                circuit.state == OPEN
+                and self.clock() - circuit.opened_at >= self.reset_timeout
+            ):
+                return HALF_OPEN
+            return circuit.state
+
+    def acquire(self, key: str) -> None:
+        """
+        Ask permission for an attempt against `key`.
+
+        Every successful call must be followed by exactly one `record`, or by `release`
+        if the attempt is not made.
+
+        Raises:
+            CircuitOpenError: If the circuit is open or has no free half-open trial slots.
+        """
+        with self._lock:
+            circuit = self._circuit(key)
+            now = self.clock()
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.reset_timeout - now
+                if retry_in > 0:
+                    raise CircuitOpenError(
+                        f"Circuit for {key} is open; retry in {retry_in:.1f}s",
+                        key=key,
+                        retry_in=retry_in,
+                    )
+                circuit.state = HALF_OPEN
+                circuit.trials = 0
+            if circuit.state == HALF_OPEN:
+                if circuit.trials >= self.half_open_max_calls:
+                    raise CircuitOpenError(
+                        f"Circuit for {key} is half-open and already probing",
+                        key=key,
+                        retry_in=0.0,
+                    )
+                circuit.trials += 1
+
+    def release(self, key: str) -> None:
+        """Give back a permission from `acquire` for an attempt that was never sent."""
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == HALF_OPEN:
+                circuit.trials = max(circuit.trials - 1, 0)
+
+    def record(self, key: str, success: bool) -> None:
+        """Record the outcome of an attempt previously allowed by `acquire`."""
+        with self._lock:
+            circuit = self._circuit(key)
+            now = self.clock()
+            if circuit.state == HALF_OPEN:
+                circuit.trials = max(circuit.trials - 1, 0)
+                if success:
+                    circuit.state = CLOSED
+                    circuit.window.reset()
+                else:
+                    circuit.state = OPEN
+                    circuit.opened_at = now
+                return
+            if circuit.state == OPEN:
+                return  # late result from an attempt started before opening
+
+            circuit.window.add(0 if success else 1, now)
+            successes, failures = circuit.window.totals(now)
+            total = successes + failures
+            if (
+                total >= self.minimum_requests
+                and failures / total >= self.failure_rate_threshold
+            ):
+                circuit.state = OPEN
+                circuit.opened_at = now
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of total traffic over a sliding window.
+
+    Each logical request deposits into the budget; each retry withdraws from it.
+    A retry is allowed while `retries < min_retries + ratio * requests` over the last
+    `window` seconds, so retries cannot multiply the load on a failing dependency.
+
+    Args:
+        ratio (float, optional): Retries allowed per request. Defaults to 0.1 (10%).
+        min_retries (int, optional): Retries always allowed per window, so low-traffic
+            callers can still retry. Defaults to 10.
+        window (float, optional): Length of the sliding window in seconds. Defaults to 10.
+        clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        min_retries: int = 10,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.clock = clock
+        self._window = _SlidingWindow(window, 2)
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Record a new logical request (not a retry)."""
+        with self._lock:
+            self._window.add(0, self.clock())
+
+    def try_retry(self) -> bool:
+        """
+        Withdraw one retry from the budget.
+
+        Returns:
+            bool: True if the retry may proceed, False if the budget is exhausted.
+        """
+        with self._lock:
+            now = self.clock()
+            requests, retries = self._window.totals(now)
+            if retries >= self.min_retries + self.ratio * requests:
+                return False
+            self._window.add(1, now)
+            return True
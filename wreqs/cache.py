@@ -0,0 +1,399 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+from wreqs.response import build_response
+
+# statuses that may be stored (RFC 9111 heuristically cacheable set)
+_CACHEABLE_STATUSES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+
+_CacheKey = Tuple[str, str, Optional[str]]
+
+
+class CacheStats(NamedTuple):
+    """
+    Counters exposed by `ResponseCache.stats`.
+
+    Attributes:
+        hits (int): Requests served from a fresh entry without touching the network.
+        misses (int): Requests with no usable entry.
+        revalidations (int): Stale entries confirmed by a 304 response.
+        evictions (int): Entries removed because of size limits or expiry.
+        entries (int): Entries currently stored.
+        bytes (int): Approximate memory held by stored entries.
+    """
+
+    hits: int
+    misses: int
+    revalidations: int
+    evictions: int
+    entries: int
+    bytes: int
+
+
+def _parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') if arg else None
+    return directives
+
+
+def _parse_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _forces_revalidation(request: PreparedRequest) -> bool:
+    directives = _parse_cache_control(request.headers.get("Cache-Control"))
+    return "no-cache" in directives or directives.get("max-age") == "0"
+
+
+class CacheEntry:
+    """A stored response plus the metadata needed to serve or revalidate it."""
+
+    __slots__ = (
+        "status_code",
+        "reason",
+        "headers",
+        "content",
+        "url",
+        "encoding",
+        "vary",
+        "expires_at",
+        "size",
+    )
+
+    def __init__(
+        self,
+        response: Response,
+        vary: Dict[str, Optional[str]],
+        expires_at: float,
+    ) -> None:
+        self.status_code = response.status_code
+        self.reason = response.reason
+        self.headers = CaseInsensitiveDict(response.headers)
+        self.content: bytes = response.content or b""
+        self.url = response.url
+        self.encoding = response.encoding
+        self.vary = vary
+        self.expires_at = expires_at
+        self.size = self._measure()
+
+    def _measure(self) -> int:
+        return len(self.content) + sum(len(k) + len(v) for k, v in self.headers.items())
+
+    def refreshed(self, headers: CaseInsensitiveDict) -> "CacheEntry":
+        """
+        Copy the entry with the headers of a 304 response merged in.
+
+        Stored entries are never modified, since other threads may be reading them.
+        """
+        entry = copy.copy(self)
+        entry.headers = CaseInsensitiveDict(self.headers)
+        for name, value in headers.items():
+            if name.lower() not in ("content-length", "content-encoding"):
+                entry.headers[name] = value
+        entry.size = entry._measure()
+        return entry
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("Last-Modified")
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def can_revalidate(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+
+class ResponseCache:
+    """
+    Thread-safe in-memory HTTP cache for GET and HEAD responses.
+
+    Freshness follows `Cache-Control` (`max-age`, `no-cache`, `no-store`) and
+    `Expires`, honoring `Age` and request-side `no-cache`/`no-store`/`max-age=0`.
+    Fresh entries are served without touching the network. Stale entries with an
+    `ETag` or `Last-Modified` are revalidated with `If-None-Match` /
+    `If-Modified-Since`, and a 304 refreshes the stored entry. Memory is bounded by
+    a byte-size LRU; expired entries are evicted on lookup or by `purge_expired`.
+
+    Responses are keyed by method, URL and `Authorization` header, and matched
+    against the request headers named in the response's `Vary`.
+
+    Args:
+        max_bytes (int, optional): Upper bound on stored bodies and headers.
+            Defaults to 64 MiB.
+        default_ttl (float, optional): Freshness lifetime for responses that carry
+            validators but no explicit lifetime. Defaults to 0 (always revalidate).
+        max_stale (float, optional): Seconds an expired entry is kept around for
+            revalidation. Defaults to 3600.
+        clock (Callable[[], float], optional): Wall clock in epoch seconds.
+            Defaults to time.time.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, ResponseCache
+
+        cache = ResponseCache(max_bytes=16 * 1024 * 1024)
+
+        with wreqs_session(cache=cache):
+            for _ in range(1000):
+                with wreq(Request("GET", "https://config.example.com/flags")) as response:
+                    flags = response.json()
+
+        print(cache.stats())
+        ```
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: float = 0.0,
+        max_stale: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.max_stale = max_stale
+        self.clock = clock
+        self._entries: "OrderedDict[_CacheKey, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(request: PreparedRequest) -> _CacheKey:
+        return (
+            (request.method or "GET").upper(),
+            request.url or "",
+            request.headers.get("Authorization"),
+        )
+
+    def is_cacheable_request(self, request: PreparedRequest) -> bool:
+        """Whether the cache may serve or store responses for `request`."""
+        if (request.method or "GET").upper() not in ("GET", "HEAD"):
+            return False
+        directives = _parse_cache_control(request.headers.get("Cache-Control"))
+        return "no-store" not in directives
+
+    def lookup(self, request: PreparedRequest) -> Optional[CacheEntry]:
+        """
+        Find the stored entry matching `request`.
+
+        Returns:
+            Optional[CacheEntry]: The entry, fresh or stale, or None on a miss. Callers
+                serve fresh entries with `to_response` and revalidate stale ones.
+        """
+        if not self.is_cacheable_request(request):
+            return None
+        key = self._key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self.clock()
+            if entry is not None and (
+                now >= entry.expires_at + self.max_stale
+                or (not entry.is_fresh(now) and not entry.can_revalidate())
+            ):
+                self._remove(key)
+                self._evictions += 1
+                entry = None
+            if entry is not None and any(
+                request.headers.get(name) != value for name, value in entry.vary.items()
+            ):
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            if entry.is_fresh(now) and not _forces_revalidation(request):
+                self._hits += 1
+            return entry
+
+    def is_fresh(self, request: PreparedRequest, entry: CacheEntry) -> bool:
+        """Whether `entry` may be served for `request` without revalidation."""
+        return entry.is_fresh(self.clock()) and not _forces_revalidation(request)
+
+    def add_validators(self, request: PreparedRequest, entry: CacheEntry) -> None:
+        """Turn `request` into a conditional request for a stale `entry`."""
+        if entry.etag is not None:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            request.headers["If-Modified-Since"] = entry.last_modified
+
+    def to_response(self, entry: CacheEntry, request: PreparedRequest) -> Response:
+        """Build an independent Response for a stored entry."""
+        return build_response(
+            entry.status_code,
+            entry.content,
+            entry.headers,
+            entry.url,
+            reason=entry.reason,
+            encoding=entry.encoding,
+            request=request,
+        )
+
+    def update(
+        self,
+        request: PreparedRequest,
+        response: Response,
+        entry: Optional[CacheEntry] = None,
+    ) -> Response:
+        """
+        Store a network response, or merge a 304 into the entry being revalidated.
+
+        Args:
+            request (PreparedRequest): The request that was sent.
+            response (Response): The response received.
+            entry (Optional[CacheEntry], optional): The stale entry that was revalidated.
+
+        Returns:
+            Response: The response to hand to the caller: the refreshed cached response
+                for a 304 on a revalidation, otherwise `response` itself.
+        """
+        if not self.is_cacheable_request(request):
+            return response
+
+        if entry is not None and response.status_code == 304:
+            refreshed = entry.refreshed(response.headers)
+            refreshed.expires_at = self._expires_at(refreshed.headers)
+            key = self._key(request)
+            with self._lock:
+                self._revalidations += 1
+                # unless another thread replaced or evicted it in the meantime
+                if self._entries.get(key) is entry:
+                    self._remove(key)
+                    if refreshed.size <= self.max_bytes:
+                        self._insert(key, refreshed)
+            return self.to_response(refreshed, request)
+
+        self.store(request, response)
+        return response
+
+    def _expires_at(self, headers: CaseInsensitiveDict) -> float:
+        now = self.clock()
+        directives = _parse_cache_control(headers.get("Cache-Control"))
+        if "no-cache" in directives:
+            return now
+        age = 0.0
+        try:
+            age = float(headers.get("Age", 0))
+        except ValueError:
+            pass
+        if directives.get("max-age") is not None:
+            try:
+                return now + float(directives["max-age"] or 0) - age
+            except ValueError:
+                return now
+        expires = _parse_date(headers.get("Expires"))
+        if expires is not None:
+            date = _parse_date(headers.get("Date")) or now
+            return now + (expires - date) - age
+        return now + self.default_ttl
+
+    def store(self, request: PreparedRequest, response: Response) -> bool:
+        """
+        Store `response` if its status and headers allow it.
+
+        Returns:
+            bool: True if the response was stored.
+        """
+        if response.status_code not in _CACHEABLE_STATUSES:
+            return False
+        directives = _parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-store" in directives:
+            return False
+        vary_header = response.headers.get("Vary", "")
+        if "*" in vary_header:
+            return False
+
+        expires_at = self._expires_at(response.headers)
+        has_validators = "ETag" in response.headers or "Last-Modified" in response.headers
+        if expires_at <= self.clock() and not has_validators:
+            return False  # would never be served
+
+        vary = {
+            name.strip(): request.headers.get(name.strip())
+            for name in vary_header.split(",")
+            if name.strip()
+        }
+        entry = CacheEntry(response, vary, expires_at)
+        if entry.size > self.max_bytes:
+            return False
+
+        key = self._key(request)
+        with self._lock:
+            self._remove(key)
+            self._insert(key, entry)
+        return True
+
+    def _insert(self, key: _CacheKey, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes and self._entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+
+    def _remove(self, key: _CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def purge_expired(self) -> int:
+        """
+        Evict every entry past its stale retention window.
+
+        Returns:
+            int: Number of entries evicted.
+        """
+        with self._lock:
+            now = self.clock()
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if now >= entry.expires_at + self.max_stale
+                or (now >= entry.expires_at and not entry.can_revalidate())
+            ]
+            for key in expired:
+                self._remove(key)
+            self._evictions += len(expired)
+            return len(expired)
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._revalidations,
+                self._evictions,
+                len(self._entries),
+                self._bytes,
+            )
@@ -0,0 +1,180 @@
+import json
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+from requests import Response
+from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
+
+
+class JSONCodec(NamedTuple):
+    """
+    A JSON implementation used by wreqs.
+
+    Attributes:
+        name (str): Name of the implementation, e.g. "orjson".
+        loads (Callable[[Union[str, bytes]], Any]): Decodes a document (str or UTF-8 bytes).
+        dumps (Callable[[Any], str]): Encodes an object as compact JSON text.
+    """
+
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any], str]
+
+
+def _stdlib_codec() -> JSONCodec:
+    return JSONCodec("json", json.loads, lambda obj: json.dumps(obj, separators=(",", ":")))
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+
+    return JSONCodec("orjson", orjson.loads, lambda obj: orjson.dumps(obj).decode())
+
+
+def _ujson_codec() -> JSONCodec:
+    import ujson
+
+    return JSONCodec("ujson", ujson.loads, ujson.dumps)
+
+
+_CODECS = {"json": _stdlib_codec, "orjson": _orjson_codec, "ujson": _ujson_codec}
+
+
+def _auto_codec() -> JSONCodec:
+    for name in ("orjson", "ujson"):
+        try:
+            return _CODECS[name]()
+        except ImportError:
+            continue
+    return _stdlib_codec()
+
+
+_codec: JSONCodec = _stdlib_codec()
+
+
+def get_json_codec() -> JSONCodec:
+    """Return the JSON codec wreqs currently decodes with."""
+    return _codec
+
+
+def set_json_codec(codec: Union[str, JSONCodec] = "json") -> JSONCodec:
+    """
+    Choose the JSON implementation wreqs uses to decode response bodies.
+
+    The standard library is used by default. "auto" picks the fastest installed
+    library: orjson, then ujson, then the standard library. Documents another
+    codec rejects, such as ones containing NaN, are decoded again with the standard
+    library. Note that orjson decodes integers beyond 64 bits as floats, losing
+    precision.
+
+    Args:
+        codec (Union[str, JSONCodec], optional): "auto", "json", "orjson", "ujson", or a
+            custom `JSONCodec`. Defaults to "json".
+
+    Returns:
+        JSONCodec: The codec now in use.
+
+    Raises:
+        ImportError: If the named library is not installed.
+        ValueError: If the name is unknown.
+
+    Example:
+        ```python
+        import wreqs
+
+        wreqs.set_json_codec("orjson")
+        ```
+    """
+    global _codec
+    if isinstance(codec, JSONCodec):
+        _codec = codec
+    elif codec == "auto":
+        _codec = _auto_codec()
+    elif codec in _CODECS:
+        _codec = _CODECS[codec]()
+    else:
+        raise ValueError(f"Unknown JSON codec {codec!r}; expected one of {sorted(_CODECS)}")
+    return _codec
+
+
+_UTF8 = ("utf-8", "utf8")
+
+
+def loads_json(doc: Union[str, bytes]) -> Any:
+    """Decode `doc` with the configured codec, falling back to the standard library."""
+    codec = _codec
+    try:
+        return codec.loads(doc)
+    except ValueError:
+        if codec.loads is json.loads:
+            raise
+    # other libraries reject some documents the standard library accepts (NaN,
+    # Infinity, integers too large for them); its result is the reference
+    return json.loads(doc)
+
+
+def decode_json(response: Response) -> Any:
+    """
+    Decode a response body as JSON once, and return the cached result afterwards.
+
+    Log formatting, `check_retry` predicates and `response.json()` on responses
+    returned by `wreq` all go through this function, so a body is parsed at most once.
+    Failures are cached as well.
+
+    Args:
+        response (Response): A response whose body has been (or may be) read.
+
+    Returns:
+        Any: The decoded document. The same object is returned on every call, so
+            modifying it is visible to later callers.
+
+    Raises:
+        requests.JSONDecodeError: If the body is not valid JSON.
+    """
+    cached = response.__dict__.get("_wreqs_json")
+    if cached is not None:
+        value, error = cached
+        if error is not None:
+            raise error
+        return value
+
+    encoding = response.encoding
+    if encoding is None or encoding.lower() in _UTF8:
+        # every codec reads UTF-8 bytes directly, skipping the str decode
+        doc: Union[str, bytes] = response.content or b""
+    else:
+        doc = response.text
+    error: Optional[RequestsJSONDecodeError] = None
+    value = None
+    try:
+        value = loads_json(doc)
+    except ValueError as e:
+        text = doc.decode("utf-8", "replace") if isinstance(doc, bytes) else doc
+        if isinstance(e, json.JSONDecodeError):
+            error = RequestsJSONDecodeError(e.msg, e.doc if isinstance(e.doc, str) else text, e.pos)
+        else:
+            error = RequestsJSONDecodeError(str(e), text, 0)
+    response.__dict__["_wreqs_json"] = (value, error)
+    if error is not None:
+        raise error
+    return value
+
+
+class JSONResponse(Response):
+    """
+    A `requests.Response` whose `json()` uses the wreqs codec and caches its result.
+
+    `wreq` and `awreq` return responses of this class. `json()` with keyword
+    arguments falls back to `requests`' own, uncached decoding.
+    """
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+        return decode_json(self)
+
+
+def cache_json(response: Response) -> Response:
+    """Make `response.json()` decode through `decode_json`. Subclasses are left alone."""
+    if type(response) is Response:
+        response.__class__ = JSONResponse
+    return response
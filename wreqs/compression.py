@@ -0,0 +1,133 @@
+import gzip
+import threading
+import zlib
+from typing import Any, Callable, Collection, Optional, Set, Union
+
+from requests import PreparedRequest, Request
+
+from wreqs.breaker import host_key
+
+SUPPORTED_ENCODINGS = ("gzip", "deflate")
+
+
+class CompressionPolicy:
+    """
+    Compresses large request bodies with gzip or deflate (stdlib only).
+
+    A body is compressed when the request method is in `methods`, the body is
+    already in memory (bytes or str, not a file or generator), it is at least
+    `min_size` bytes, it has no `Content-Encoding` yet, and compressing actually makes
+    it smaller. The compressed request gets `Content-Encoding` and a new
+    `Content-Length`.
+
+    Not every server accepts compressed bodies. When one answers 415 Unsupported Media
+    Type, `wreq` resends the request uncompressed right away, and with `fallback=True`
+    bodies for that key (host) are not compressed again.
+
+    Args:
+        encoding (str, optional): "gzip" or "deflate". Defaults to "gzip".
+        min_size (int, optional): Smallest body, in bytes, worth compressing.
+            Defaults to 1024.
+        level (int, optional): zlib compression level (1-9); lower is faster.
+            Defaults to 6.
+        methods (Collection[str], optional): Methods whose bodies are compressed.
+            Defaults to POST, PUT and PATCH.
+        fallback (bool, optional): Remember keys that answered 415 and stop compressing
+            for them. Defaults to True.
+        key (Callable[[Union[Request, PreparedRequest]], str], optional): Maps a request
+            to the key remembered on 415. Defaults to the URL's host.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, CompressionPolicy
+
+        with wreqs_session(compress=CompressionPolicy(min_size=4096, level=5)):
+            with wreq(Request("POST", "https://ingest.example.com/batch", json=events)) as response:
+                ...
+        ```
+    """
+
+    def __init__(
+        self,
+        encoding: str = "gzip",
+        min_size: int = 1024,
+        level: int = 6,
+        methods: Collection[str] = ("POST", "PUT", "PATCH"),
+        fallback: bool = True,
+        key: Callable[[Union[Request, PreparedRequest]], str] = host_key,
+    ) -> None:
+        if encoding not in SUPPORTED_ENCODINGS:
+            raise ValueError(f"encoding must be one of {SUPPORTED_ENCODINGS}")
+        self.encoding = encoding
+        self.min_size = min_size
+        self.level = level
+        self.methods = frozenset(m.upper() for m in methods)
+        self.fallback = fallback
+        self.key = key
+        self._rejected: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def compress_body(self, body: bytes) -> bytes:
+        """Compress `body` with the configured encoding and level."""
+        if self.encoding == "gzip":
+            # a fixed mtime keeps the output (and any request signature) deterministic
+            return gzip.compress(body, compresslevel=self.level, mtime=0)
+        return zlib.compress(body, self.level)
+
+    def apply(self, prepared: PreparedRequest) -> Optional[PreparedRequest]:
+        """
+        Compress the body of `prepared` if the policy allows it.
+
+        Args:
+            prepared (PreparedRequest): The request; it is not modified.
+
+        Returns:
+            Optional[PreparedRequest]: A compressed copy, or None if the body is left as is.
+        """
+        if (prepared.method or "").upper() not in self.methods:
+            return None
+        if "Content-Encoding" in prepared.headers:
+            return None
+        body = _body_bytes(prepared.body)
+        if body is None or len(body) < self.min_size:
+            return None
+        if self._rejected and self.key(prepared) in self._rejected:
+            return None
+
+        compressed = self.compress_body(body)
+        if len(compressed) >= len(body):
+            return None
+        result = prepared.copy()
+        result.body = compressed
+        result.headers["Content-Encoding"] = self.encoding
+        result.headers["Content-Length"] = str(len(compressed))
+        return result
+
+    def reject(self, prepared: PreparedRequest) -> None:
+        """Record that the server behind `prepared` refused a compressed body."""
+        if self.fallback:
+            with self._lock:
+                self._rejected.add(self.key(prepared))
+
+
+# used by `compress=True`, so 415 fallbacks are remembered across calls
+_default_policy = CompressionPolicy()
+
+
+def policy_for(compress: Union[bool, CompressionPolicy, None]) -> Optional[CompressionPolicy]:
+    """Turn a `compress` argument (bool or a policy) into a `CompressionPolicy` or None."""
+    if isinstance(compress, CompressionPolicy):
+        return compress
+    return _default_policy if compress else None
+
+
+def _body_bytes(body: Any) -> Optional[bytes]:
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        try:
+            # what http.client would send for a str body
+            return body.encode("iso-8859-1")
+        except UnicodeEncodeError:
+            return None
+    return None  # no body, or a file/generator that is streamed
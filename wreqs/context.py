@@ -1,11 +1,41 @@
 import logging
+import time
 
-from requests import Request, Response, Session, Timeout
-from typing import Callable, Dict, Generator, List, Optional
+from requests import PreparedRequest, Request, Response, Session, Timeout
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+from typing import Any, Callable, Dict, Generator, List, Mapping, Optional, Union
 from contextlib import contextmanager
 from contextvars import ContextVar, Token
-from wreqs.error import RetryRequestError
-from wreqs.fmt import prettify_request_str, prettify_response_str
+from wreqs.backoff import Backoff
+from wreqs.body import SpilledResponse, read_body
+from wreqs.breaker import CircuitBreaker, RetryBudget, default_is_failure, host_key
+from wreqs.cache import ResponseCache
+from wreqs.codec import cache_json
+from wreqs.compression import CompressionPolicy, policy_for as compression_policy_for
+from wreqs.deadline import TimeoutType, _wreqs_deadline, attempt_timeout, resolve_deadline
+from wreqs.dns import DNSCache
+from wreqs.error import (
+    DeadlineExceededError,
+    RetryBudgetExhaustedError,
+    RetryRequestError,
+    SessionPoolExhaustedError,
+)
+from wreqs.fmt import LazyRequestStr, LazyResponseStr
+from wreqs.hedge import HEDGEABLE_METHODS, HedgePolicy, hedged_send, policy_for
+from wreqs.logs import (
+    LogSettings,
+    RequestLog,
+    StructuredFormatter,
+    queued_handler,
+    set_log_settings,
+    stop_async_logging,
+)
+from wreqs.metrics import AttemptInfo, MetricsHook, RequestInfo, _enqueued_at
+from wreqs.pool import configure_pool
+from wreqs.proxy import ProxyPool
+from wreqs.ratelimit import RateLimiter
+from wreqs.sessionpool import SessionPool
+from wreqs.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -13,17 +43,36 @@ _wreqs_session: ContextVar[Optional[Session]] = ContextVar(
     "_wreqs_session", default=None
 )
 
+# request defaults attached to the active `wreqs_session` (circuit breaker, ...)
+_wreqs_options: ContextVar[Mapping[str, Any]] = ContextVar(
+    "_wreqs_options", default={}
+)
+
 
 class RequestContext:
     def __init__(
         self,
-        request: Request,
+        request: Union[Request, PreparedRequest],
         max_retries: int = 3,
         check_retry: Optional[Callable[[Response], bool]] = None,
         retry_callback: Optional[Callable[[Response], None]] = None,
-        session: Optional[Session] = None,
-        timeout: Optional[float] = None,
-        proxies: Optional[List[str]] = None,
+        session: Optional[Union[Session, SessionPool]] = None,
+        timeout: TimeoutType = None,
+        proxies: Optional[Union[List[str], ProxyPool]] = None,
+        backoff: Optional[Backoff] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        stream: bool = False,
+        metrics: Optional[MetricsHook] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        hedge_after: Optional[Union[float, HedgePolicy]] = None,
+        total_timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        compress: Optional[Union[bool, CompressionPolicy]] = None,
+        max_body_size: Optional[int] = None,
+        spill_threshold: Optional[int] = None,
     ) -> None:
         """
         A context manager for making HTTP requests with retry and timeout capabilities.
@@ -32,7 +81,9 @@ class RequestContext:
         retry logic, timeout handling, session management, and proxy rotation.
 
         Args:
-            request (Request): The Request object representing the HTTP request to be made.
+            request (Union[Request, PreparedRequest]): The request to be made. A Request is
+                prepared with the session once and reused for every attempt; a PreparedRequest
+                (e.g. from a `RequestTemplate`) is sent as is.
             max_retries (int, optional): The maximum number of retry attempts. Defaults to 3.
             check_retry (Optional[Callable[[Response], bool]], optional): A function that takes
                 a Response object and returns True if a retry should be attempted, False otherwise.
@@ -40,13 +91,62 @@ class RequestContext:
             retry_callback (Optional[Callable[[Response], None]], optional): A function to be
                 called before each retry attempt. It takes a Response object and returns None.
                 Defaults to None.
-            session (Optional[Session], optional): A requests Session object to be used for
-                making the request. If None, a new Session will be created. Defaults to None.
-            timeout (Optional[float], optional): The timeout in seconds for the request.
+            session (Optional[Union[Session, SessionPool]], optional): A requests Session
+                object to be used for making the request, or a `SessionPool` to check one out
+                from for the duration of the call. If None, a new Session will be created and
+                closed on exit. A session passed in is never closed by wreqs. Defaults to None.
+            timeout (TimeoutType, optional): The timeout in seconds for each attempt, or a
+                (connect, read) tuple. Shrunk to the time left when there is a deadline.
+                Defaults to None.
+            proxies (Optional[Union[List[str], ProxyPool]], optional): A list of proxy servers
+                to use for the request, rotated round-robin for each request or retry attempt, or
+                a shared `ProxyPool` that picks proxies by health and learns from every attempt.
+                Defaults to None.
+            backoff (Optional[Backoff], optional): A backoff policy (e.g. `FullJitterBackoff()`)
+                deciding how long to wait before each retry. It honors `Retry-After` and
+                `RateLimit-Reset` on 429/503 responses. If None, retries happen immediately.
                 Defaults to None.
-            proxies (Optional[List[str]], optional): A list of proxy servers to use for the request.
-                If provided, wreqs will rotate through these proxies for each request or retry attempt.
+            circuit_breaker (Optional[CircuitBreaker], optional): Breaker consulted before every
+                attempt; raises `CircuitOpenError` without sending while the host's circuit is open.
                 Defaults to None.
+            retry_budget (Optional[RetryBudget], optional): Budget every retry must withdraw from;
+                raises `RetryBudgetExhaustedError` when it is empty. Defaults to None.
+            cache (Optional[ResponseCache], optional): HTTP cache consulted for GET/HEAD
+                requests. Fresh entries are served without a network call and stale ones
+                are revalidated. Defaults to None.
+            single_flight (Optional[SingleFlight], optional): Coalesces this request with
+                identical idempotent requests already in flight, sharing their final
+                (post-retry) outcome. Defaults to None.
+            stream (bool, optional): Yield the response before its body is downloaded.
+                wreqs never reads a streamed body itself, not even for logging, and closes
+                the response on exit. Streamed requests bypass `cache` and `single_flight`.
+                Defaults to False.
+            metrics (Optional[MetricsHook], optional): Receives timings, sizes and outcomes of
+                every attempt and of the request as a whole (e.g. a `MetricsRegistry`).
+                Defaults to None.
+            rate_limiter (Optional[RateLimiter], optional): Limiter every attempt waits on
+                before sending; raises `RateLimitExceededError` if the wait would exceed its
+                `max_wait`. Defaults to None.
+            hedge_after (Optional[Union[float, HedgePolicy]], optional): For GET, HEAD and
+                OPTIONS requests without a body, send a duplicate attempt (through the next
+                proxy, if rotating) when the first has not answered after this many seconds,
+                and use whichever answers first. A `HedgePolicy` learns the delay per host
+                from a latency percentile. Hedges are capped at 10% of requests by default.
+                Defaults to None.
+            total_timeout (Optional[float], optional): Seconds the whole request may take,
+                retries and backoff included. Defaults to None.
+            deadline (Optional[float], optional): Absolute `time.monotonic()` time by which
+                the request must finish. The earliest of `deadline`, `total_timeout` and the
+                deadline of an enclosing `wreqs_deadline` or `wreq` applies. Defaults to None.
+            compress (Optional[Union[bool, CompressionPolicy]], optional): Compress large
+                request bodies (see `CompressionPolicy`); True uses the default gzip policy.
+                A 415 response makes wreqs resend the body uncompressed. Defaults to None.
+            max_body_size (Optional[int], optional): Largest response body, in decoded bytes,
+                that is read; larger ones raise `BodyTooLargeError`, before reading anything
+                if `Content-Length` announces it. Defaults to None.
+            spill_threshold (Optional[int], optional): Response bodies larger than this are
+                written to a temporary file and memory-mapped instead of held in memory; see
+                `response.body`. Defaults to None.
 
         Yields:
             Response: The Response object from the successful request.
@@ -54,6 +154,10 @@ class RequestContext:
         Raises:
             RetryRequestError: If the maximum number of retries is reached without a successful response.
             Timeout: If the request times out.
+            CircuitOpenError: If a circuit breaker rejects an attempt.
+            RetryBudgetExhaustedError: If a retry budget has no retries left.
+            RateLimitExceededError: If a rate limiter cannot admit an attempt within its `max_wait`.
+            DeadlineExceededError: If the deadline passes before the request completes.
 
         Example:
             Making a request with proxy rotation:
@@ -73,24 +177,96 @@ class RequestContext:
             ```
 
         Notes:
-            - The context manager automatically closes the session when exiting the context.
+            - The context manager only closes sessions it created itself; caller-provided and
+              `wreqs_session` sessions stay open so their connection pools are reused.
             - If a custom session is provided, it will be used for all requests, including retries.
-            - The retry_callback can be useful for implementing backoff strategies or logging.
-            - Proxy rotation is done in a round-robin fashion if multiple proxies are provided.
+            - Retries resend the request prepared for the first attempt, so cookies the session
+              receives in between are not added to them.
+            - The retry_callback can be useful for logging; waits between retries are best left to `backoff`.
+            - Proxy lists are rotated round-robin starting from the first proxy on every call;
+              use a `ProxyPool` to keep proxy health across calls and threads.
+            - With `stream=True` the body must be consumed inside the `with` block; use
+              `wreq_download` for large transfers that should resume after a dropped connection.
+            - A running attempt cannot be cancelled, so the slower of two hedged attempts
+              finishes (or times out) in the background and its response is discarded.
+            - A deadline caps the connect and read timeouts of each attempt, but a read timeout
+              applies per socket read, so reading a large streamed body can outlast it.
         """
         self.logger = logger
         self.request = request
         self.response: Optional[Response] = None
-        self.session = session or Session()
+        self.owns_session = session is None
+        self.session_pool = session if isinstance(session, SessionPool) else None
         self.max_retries = max_retries
         self.check_retry = check_retry
         self.retry_callback = retry_callback
         self.timeout = timeout
         self.proxies = proxies
+        self.backoff = backoff
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self.cache = cache
+        self.single_flight = single_flight
+        self.stream = stream
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.hedge = policy_for(hedge_after) if hedge_after is not None else None
+        self.deadline = resolve_deadline(deadline, total_timeout)
+        self.compress = compression_policy_for(compress)
+        self.max_body_size = max_body_size
+        self.spill_threshold = spill_threshold
+        # bodies are read by wreqs, chunk by chunk, only when a limit applies
+        self._read_bounded = not stream and (
+            max_body_size is not None or spill_threshold is not None
+        )
         self.current_proxy_index: int = 0
+        self._current_proxy: Optional[str] = None
+        self._prepared: Optional[PreparedRequest] = None
+        # the body as given, kept while a compressed one is sent, for a 415 fallback
+        self._uncompressed: Optional[PreparedRequest] = None
+        self._request_str = LazyRequestStr(request)
+        self._response_str: Optional[LazyResponseStr] = None
+        self._log = RequestLog(logger, request)
+        self._attempts = 0
+        self._retry_reason: Optional[str] = None
+        self._source = "network"
+        self._started = time.perf_counter()
+        self._first_attempt_at: Optional[float] = None
+        self._bytes_in = 0
+        self._wire_bytes_in: Optional[int] = None
+        queued_at = _enqueued_at.get()
+        if queued_at is not None:
+            # consumed here so nested requests made by callbacks start their own clock
+            _enqueued_at.set(None)
+            self._started = queued_at
+
+        # last, so invalid options above cannot leak a checked-out session
+        if self.session_pool is not None:
+            self.session = self._checkout(self.session_pool)
+        else:
+            self.session = session or Session()
+
+        self._log.step("RequestContext initialized: %s", self._request_str)
+        self.logger.debug("Max retries: %d", max_retries)
+
+    def _checkout(self, pool: SessionPool) -> Session:
+        """
+        Take a session from `pool`, waiting no longer than the deadline allows.
 
-        self.logger.info(f"RequestContext initialized: {prettify_request_str(request)}")
-        self.logger.debug(f"Max retries: {max_retries}")
+        Raises:
+            DeadlineExceededError: If the deadline passes before a session is free.
+            SessionPoolExhaustedError: If the pool is closed.
+        """
+        if self.deadline is None:
+            return pool.checkout()
+        try:
+            return pool.checkout(timeout=max(self.deadline - time.monotonic(), 0.0))
+        except SessionPoolExhaustedError as e:
+            if time.monotonic() < self.deadline:
+                raise
+            raise DeadlineExceededError(
+                "Deadline exceeded while waiting for a pooled session"
+            ) from e
 
     def _get_next_proxy(self) -> Optional[Dict[str, str]]:
         """
@@ -101,10 +277,34 @@ class RequestContext:
         """
         if not self.proxies:
             return None
-        proxy = self.proxies[self.current_proxy_index]
-        self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxies)
+        if isinstance(self.proxies, ProxyPool):
+            proxy = self.proxies.select()
+        else:
+            proxy = self.proxies[self.current_proxy_index]
+            self.current_proxy_index = (self.current_proxy_index + 1) % len(self.proxies)
+        self._current_proxy = proxy
         return {"http": proxy, "https": proxy}
 
+    def _prepare(self) -> PreparedRequest:
+        """
+        Prepare the request on first use and hand out a copy for each attempt.
+
+        Returns:
+            PreparedRequest: A copy safe to modify (e.g. with cache validators) and send.
+        """
+        if self._prepared is None:
+            self._log.step("Preparing request")
+            if isinstance(self.request, PreparedRequest):
+                self._prepared = self.request
+            else:
+                self._prepared = self.session.prepare_request(self.request)
+            if self.compress:
+                compressed = self.compress.apply(self._prepared)
+                if compressed is not None:
+                    self.logger.debug("Compressed request body with %s", self.compress.encoding)
+                    self._uncompressed, self._prepared = self._prepared, compressed
+        return self._prepared.copy()
+
     def _fetch(self) -> Response:
         """
         Prepare and send the HTTP request.
@@ -114,25 +314,230 @@ class RequestContext:
         Returns:
             Response: The response received from the server.
         """
-        self.logger.info(f"Preparing request")
-        prepared_request = self.session.prepare_request(self.request)
+        prepared_request = self._prepare()
+
+        cache_entry = None
+        if self.cache and not self.stream:
+            cache_entry = self.cache.lookup(prepared_request)
+            if cache_entry is not None:
+                if self.cache.is_fresh(prepared_request, cache_entry):
+                    self._log.step("Serving response from cache")
+                    self._source = "cache"
+                    return cache_json(self.cache.to_response(cache_entry, prepared_request))
+                self._log.step("Revalidating stale cache entry")
+                self.cache.add_validators(prepared_request, cache_entry)
+
+        # an open circuit fails fast, before a rate limit slot is taken or waited for
+        circuit_key = None
+        if self.circuit_breaker:
+            circuit_key = self.circuit_breaker.key(self.request)
+            self.circuit_breaker.acquire(circuit_key)
+
+        rate_key = None
+        if self.rate_limiter:
+            rate_key = self.rate_limiter.key(self.request)
+            # never wait for a slot past the deadline
+            left = None if self.deadline is None else self.deadline - time.monotonic()
+            try:
+                waited = self.rate_limiter.acquire(rate_key, left)
+            except BaseException:
+                if circuit_key is not None:
+                    self.circuit_breaker.release(circuit_key)
+                raise
+            if waited:
+                self._log.step("Rate limited, waited %.3fs", waited)
+
+        timeout = attempt_timeout(self.timeout, self.deadline)
 
         proxy = self._get_next_proxy()
         if proxy:
-            self.logger.info(f"Using proxy: {proxy}")
+            self._log.step("Using proxy: %s", proxy)
+
+        send_kwargs: Dict[str, Any] = {
+            "timeout": timeout,
+            "stream": self.stream or self._read_bounded,
+        }
+        if proxy:
+            # only override when rotating, so env proxies (HTTP_PROXY...) still apply
+            send_kwargs["proxies"] = proxy
 
+        self._attempts += 1
+        started = time.perf_counter()
+        if self._first_attempt_at is None:
+            self._first_attempt_at = started
         try:
-            response = self.session.send(
-                prepared_request,
-                timeout=self.timeout,
+            if (
+                self.hedge is not None
+                and prepared_request.method in HEDGEABLE_METHODS
+                and prepared_request.body is None
+            ):
+                response = self._send_hedged(prepared_request, send_kwargs)
+            else:
+                response = self.session.send(prepared_request, **send_kwargs)
+            if self._read_bounded:
+                response = read_body(response, self.max_body_size, self.spill_threshold)
+        except Exception as e:
+            if isinstance(e, Timeout):
+                self.logger.error("Request timed out after %ss", timeout)
+            self._record_attempt(
+                circuit_key, prepared_request, time.perf_counter() - started, None, e
             )
-            self.logger.info(f"Received response: {prettify_response_str(response)}")
-        except Timeout:
-            self.logger.error(f"Request timed out after {self.timeout}s")
+            if (
+                isinstance(e, Timeout)
+                and self.deadline is not None
+                and time.monotonic() >= self.deadline
+            ):
+                raise DeadlineExceededError(
+                    f"Deadline exceeded for request {self._request_str}."
+                ) from e
             raise
 
+        self._record_attempt(
+            circuit_key, prepared_request, time.perf_counter() - started, response, None
+        )
+        if response.status_code == 415 and self._uncompressed is not None:
+            self.logger.warning("Compressed body rejected with 415, resending uncompressed")
+            self.compress.reject(prepared_request)
+            self._prepared, self._uncompressed = self._uncompressed, None
+            response.close()
+            return self._fetch()
+        if rate_key is not None:
+            self.rate_limiter.update(rate_key, response)
+        if self.cache and not self.stream and not isinstance(response, SpilledResponse):
+            response = self.cache.update(prepared_request, response, cache_entry)
+        # the body is parsed at most once, by whichever of logging, check_retry or
+        # the caller asks for it first
+        response = cache_json(response)
+        if self._log.enabled():
+            self._response_str = LazyResponseStr(response)
+            self._log.step("Received response: %s", self._response_str)
+
         return response
 
+    def _send_hedged(
+        self, prepared_request: PreparedRequest, send_kwargs: Dict[str, Any]
+    ) -> Response:
+        """
+        Send an attempt, hedging it with a duplicate if it is slower than `hedge` allows.
+
+        Args:
+            prepared_request (PreparedRequest): The request to send.
+            send_kwargs (Dict[str, Any]): Keyword arguments for `Session.send`.
+
+        Returns:
+            Response: The first successful response; the other one is closed when it arrives.
+        """
+        primary_proxy = self._current_proxy
+
+        def hedge_kwargs() -> Dict[str, Any]:
+            kwargs = dict(send_kwargs)
+            proxy = self._get_next_proxy()
+            if proxy:
+                kwargs["proxies"] = proxy
+            self._log.step("Sending hedged request")
+            return kwargs
+
+        response, hedged = hedged_send(
+            self.hedge,
+            host_key(prepared_request),
+            lambda request, kwargs: self.session.send(request, **kwargs),
+            prepared_request,
+            send_kwargs,
+            hedge_kwargs,
+        )
+        if hedged:
+            self._log.step("Hedged request answered first")
+        else:
+            # the proxy pool learns about the attempt whose response is used
+            self._current_proxy = primary_proxy
+        return response
+
+    def _record_attempt(
+        self,
+        circuit_key: Optional[str],
+        prepared_request: PreparedRequest,
+        elapsed: float,
+        response: Optional[Response],
+        exception: Optional[BaseException],
+    ) -> None:
+        """
+        Report the outcome of a single attempt to the circuit breaker, proxy pool and
+        metrics hook, if any.
+
+        Args:
+            circuit_key (Optional[str]): The circuit the attempt was admitted to.
+            prepared_request (PreparedRequest): The request that was sent.
+            elapsed (float): Seconds spent sending the attempt.
+            response (Optional[Response]): The response, if one was received.
+            exception (Optional[BaseException]): The error raised while sending, if any.
+        """
+        if self.circuit_breaker and circuit_key is not None:
+            failed = self.circuit_breaker.is_failure(response, exception)
+            self.circuit_breaker.record(circuit_key, not failed)
+
+        if isinstance(self.proxies, ProxyPool) and self._current_proxy is not None:
+            failed = default_is_failure(response, exception)
+            self.proxies.report(self._current_proxy, elapsed, not failed)
+
+        if self.metrics:
+            body = prepared_request.body
+            bytes_in, wire_bytes_in = _body_size(response), _wire_size(response)
+            self._bytes_in += bytes_in
+            if wire_bytes_in is not None:
+                self._wire_bytes_in = (self._wire_bytes_in or 0) + wire_bytes_in
+            info = AttemptInfo(
+                method=prepared_request.method or "GET",
+                host=host_key(prepared_request),
+                status=response.status_code if response is not None else None,
+                error=type(exception).__name__ if exception is not None else None,
+                attempt=self._attempts,
+                retry_reason=self._retry_reason,
+                bytes_out=len(body) if isinstance(body, (bytes, str)) else 0,
+                bytes_in=bytes_in,
+                wire_bytes_in=wire_bytes_in,
+                send_time=elapsed,
+                ttfb=(
+                    response.elapsed.total_seconds()
+                    if response is not None and response.elapsed is not None
+                    else None
+                ),
+            )
+            self._emit_metrics(self.metrics.on_attempt, info)
+
+    def _record_request(
+        self, response: Optional[Response], exception: Optional[BaseException]
+    ) -> None:
+        """
+        Report the outcome of the whole request to the metrics hook.
+
+        Args:
+            response (Optional[Response]): The final response, if any.
+            exception (Optional[BaseException]): The error the request failed with, if any.
+        """
+        if not self.metrics:
+            return
+        finished = time.perf_counter()
+        first_attempt_at = self._first_attempt_at or finished
+        info = RequestInfo(
+            method=(self.request.method or "GET").upper(),
+            host=host_key(self.request),
+            status=response.status_code if response is not None else None,
+            error=type(exception).__name__ if exception is not None else None,
+            attempts=self._attempts,
+            source=self._source,
+            queue_wait=max(first_attempt_at - self._started, 0.0),
+            duration=finished - self._started,
+            bytes_in=self._bytes_in,
+            wire_bytes_in=self._wire_bytes_in,
+        )
+        self._emit_metrics(self.metrics.on_request, info)
+
+    def _emit_metrics(self, hook: Callable[[Any], None], info: Any) -> None:
+        try:
+            hook(info)
+        except Exception:
+            self.logger.warning("Metrics hook failed", exc_info=True)
+
     def _handle_retry(self) -> Response:
         """
         Handle the retry logic for the request.
@@ -148,70 +553,162 @@ class RequestContext:
                 successful response.
         """
         retries = 0
+        delay = 0.0
         while retries < self.max_retries:
-            self.logger.info(f"Attempt {retries + 1}/{self.max_retries}")
+            self._log.step("Attempt %d/%d", retries + 1, self.max_retries)
             self.response = self._fetch()
             if not self.check_retry or not self.check_retry(self.response):
-                self.logger.info("Request successful, no retry needed")
+                self._log.step("Request successful, no retry needed")
                 return self.response
             retries += 1
 
-            self.logger.warning(
-                f"Retry attempt {retries}/{self.max_retries}: {prettify_request_str(self.request)}"
-            )
+            self._log.retry(retries, self.max_retries, self.response, self._request_str)
+            self._retry_reason = f"status_{self.response.status_code}"
+
+            if (
+                self.retry_budget
+                and retries < self.max_retries
+                and not self.retry_budget.try_retry()
+            ):
+                self.logger.error("Retry budget exhausted, giving up")
+                raise RetryBudgetExhaustedError(
+                    f"Retry budget exhausted for request {self._request_str}."
+                )
 
             if self.retry_callback:
-                self.logger.info(f"Calling `retry_callback` before retry.")
+                self._log.step("Calling `retry_callback` before retry.")
                 self.retry_callback(self.response)
 
-        self.logger.error(f"Max retries ({self.max_retries}) reached without success")
+            if self.stream or isinstance(self.response, SpilledResponse):
+                # hand the connection (or temporary file) back before the next attempt
+                self.response.close()
+
+            if self.backoff and retries < self.max_retries:
+                delay = self.backoff.delay(retries, delay, self.response)
+                if self.deadline is not None and time.monotonic() + delay >= self.deadline:
+                    self.logger.error("Backing off %.3fs would pass the deadline", delay)
+                    raise DeadlineExceededError(
+                        f"Deadline exceeded for request {self._request_str}."
+                    )
+                self._log.step("Backing off %.3fs before retry", delay)
+                self.backoff.sleep(delay)
+
+        self.logger.error("Max retries (%d) reached without success", self.max_retries)
         raise RetryRequestError(
-            f"Failed after {self.max_retries} retries for request {prettify_request_str(self.request)}."
+            f"Failed after {self.max_retries} retries for request {self._request_str}."
         )
 
+    def _execute(self) -> Response:
+        """
+        Perform the request, with retries if a retry check is configured.
+
+        Returns:
+            Response: The final response.
+        """
+        if self.retry_budget:
+            self.retry_budget.record_request()
+        if self.check_retry:
+            self._log.step("Retry check function provided, handling potential retries")
+            return self._handle_retry()
+        else:
+            self._log.step("No retry check function, performing single fetch")
+            self.response = self._fetch()
+            return self.response
+
     def __enter__(self) -> Response:
-        self.logger.info(
-            f"Entering RequestContext: {prettify_request_str(self.request)}"
-        )
+        self._log.step("Entering RequestContext: %s", self._request_str)
         try:
-            if self.check_retry:
-                self.logger.info(
-                    "Retry check function provided, handling potential retries"
-                )
-                return self._handle_retry()
-            else:
-                self.logger.info("No retry check function, performing single fetch")
-                return self._fetch()
+            response = None
+            if self.single_flight and not self.stream and self.spill_threshold is None:
+                key = self.single_flight.key(self._prepare())
+                if key is not None:
+                    # a waiter gives up at its own deadline, not the leader's
+                    left = None if self.deadline is None else self.deadline - time.monotonic()
+                    response, shared = self.single_flight.do(
+                        key, self._execute, timeout=None if left is None else max(left, 0.0)
+                    )
+                    response = cache_json(response)
+                    if shared:
+                        self._log.step("Shared response of an identical in-flight request")
+                        self._source = "shared"
+                    self.response = response
+            if response is None:
+                response = self._execute()
         except Exception as e:
-            self.logger.error(f"Error during request: {str(e)}")
+            self.logger.error("Error during request: %s", e)
+            self._record_request(self.response, e)
+            self._log.finished(self._attempts, self.response, e)
             raise
+        self._record_request(response, None)
+        self._log.finished(self._attempts, response, None)
+        return response
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self.logger.info("Exiting RequestContext")
+        self._log.step("Exiting RequestContext")
 
-        if self.response:
-            self.logger.info(
-                f"Exiting RequestContext: {prettify_response_str(self.response)}"
-            )
+        if self._response_str is not None:
+            self._log.step("Exiting RequestContext: %s", self._response_str)
+
+        if self.stream and self.response is not None:
+            self.logger.debug("Closing streamed response")
+            self.response.close()
+        elif isinstance(self.response, SpilledResponse) and not self.response._detached:
+            self.logger.debug("Closing spilled response body")
+            self.response.close()
 
-        self.logger.debug("Closing session")
-        self.session.close()
+        if self.owns_session:
+            self.logger.debug("Closing session")
+            self.session.close()
+        elif self.session_pool is not None:
+            self.session_pool.checkin(self.session)
 
         if exc_type:
-            self.logger.error(
-                f"Exception occurred: {exc_type.__name__}: {str(exc_val)}"
-            )
+            self.logger.error("Exception occurred: %s: %s", exc_type.__name__, exc_val)
+
+
+def _body_size(response: Optional[Response]) -> int:
+    if response is None:
+        return 0
+    if response._content is False:  # unread stream: only the announced size is known
+        length = response.headers.get("Content-Length", "")
+        return int(length) if length.isdigit() else 0
+    # `_content` rather than `content`, which copies a spilled body
+    return len(response._content or b"")
+
+
+def _wire_size(response: Optional[Response]) -> Optional[int]:
+    if response is None or response._content is False or response.raw is None:
+        return None
+    try:
+        # urllib3 counts the bytes read from the socket, i.e. before decompression
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return None
 
 
 @contextmanager
 def wreq(
-    req: Request,
+    req: Union[Request, PreparedRequest],
     max_retries: int = 3,
     check_retry: Optional[Callable[[Response], bool]] = None,
     retry_callback: Optional[Callable[[Response], None]] = None,
-    session: Optional[Session] = None,
-    timeout: Optional[float] = None,
-    proxies: Optional[List[str]] = None,
+    session: Optional[Union[Session, SessionPool]] = None,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[List[str], ProxyPool]] = None,
+    backoff: Optional[Backoff] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    cache: Optional[ResponseCache] = None,
+    single_flight: Optional[SingleFlight] = None,
+    stream: bool = False,
+    metrics: Optional[MetricsHook] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    hedge_after: Optional[Union[float, HedgePolicy]] = None,
+    total_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    compress: Optional[Union[bool, CompressionPolicy]] = None,
+    max_body_size: Optional[int] = None,
+    spill_threshold: Optional[int] = None,
 ) -> Generator[Response, None, None]:
     """
     A context manager for making HTTP requests with retry and timeout capabilities.
@@ -220,7 +717,9 @@ def wreq(
     retry logic, timeout handling, session management, and proxy rotation.
 
     Args:
-        request (Request): The Request object representing the HTTP request to be made.
+        request (Union[Request, PreparedRequest]): The request to be made. A Request is
+            prepared with the session once and reused for every attempt; a PreparedRequest
+            (e.g. from a `RequestTemplate`) is sent as is.
         max_retries (int, optional): The maximum number of retry attempts. Defaults to 3.
         check_retry (Optional[Callable[[Response], bool]], optional): A function that takes
             a Response object and returns True if a retry should be attempted, False otherwise.
@@ -228,13 +727,71 @@ def wreq(
         retry_callback (Optional[Callable[[Response], None]], optional): A function to be
             called before each retry attempt. It takes a Response object and returns None.
             Defaults to None.
-        session (Optional[Session], optional): A requests Session object to be used for
-            making the request. If None, a new Session will be created. Defaults to None.
-        timeout (Optional[float], optional): The timeout in seconds for the request.
+        session (Optional[Union[Session, SessionPool]], optional): A requests Session
+            object to be used for making the request, or a `SessionPool` to check one out
+            from for the duration of the call. If None, the active `wreqs_session` is used,
+            or a new Session is created and closed on exit. A session passed in is never
+            closed by wreqs. Defaults to None.
+        timeout (TimeoutType, optional): The timeout in seconds for each attempt, or a
+            (connect, read) tuple. Shrunk to the time left when there is a deadline.
+            Defaults to None.
+        proxies (Optional[Union[List[str], ProxyPool]], optional): A list of proxy servers
+            to use for the request, rotated round-robin for each request or retry attempt, or
+            a shared `ProxyPool` that picks proxies by health and learns from every attempt.
+            If None, the pool attached to the active `wreqs_session` is used. Defaults to None.
+        backoff (Optional[Backoff], optional): A backoff policy (e.g. `FullJitterBackoff()`)
+            deciding how long to wait before each retry. It honors `Retry-After` and
+            `RateLimit-Reset` on 429/503 responses. If None, retries happen immediately.
             Defaults to None.
-        proxies (Optional[List[str]], optional): A list of proxy servers to use for the request.
-            If provided, wreqs will rotate through these proxies for each request or retry attempt.
+        circuit_breaker (Optional[CircuitBreaker], optional): Breaker consulted before every
+            attempt; raises `CircuitOpenError` without sending while the host's circuit is open.
+            If None, the one attached to the active `wreqs_session` is used. Defaults to None.
+        retry_budget (Optional[RetryBudget], optional): Budget every retry must withdraw from;
+            raises `RetryBudgetExhaustedError` when it is empty. If None, the one attached to
+            the active `wreqs_session` is used. Defaults to None.
+        cache (Optional[ResponseCache], optional): HTTP cache consulted for GET/HEAD
+            requests. Fresh entries are served without a network call and stale ones are
+            revalidated. If None, the cache attached to the active `wreqs_session` is used.
             Defaults to None.
+        single_flight (Optional[SingleFlight], optional): Coalesces this request with
+            identical idempotent requests already in flight, sharing their final
+            (post-retry) outcome. If None, the one attached to the active `wreqs_session`
+            is used. Defaults to None.
+        stream (bool, optional): Yield the response before its body is downloaded.
+            wreqs never reads a streamed body itself, not even for logging, and closes the
+            response on exit. Streamed requests bypass `cache` and `single_flight`.
+            Defaults to False.
+        metrics (Optional[MetricsHook], optional): Receives timings, sizes and outcomes of
+            every attempt and of the request as a whole (e.g. a `MetricsRegistry`). If None,
+            the hook attached to the active `wreqs_session` is used. Defaults to None.
+        rate_limiter (Optional[RateLimiter], optional): Limiter every attempt waits on
+            before sending; raises `RateLimitExceededError` if the wait would exceed its
+            `max_wait`. If None, the one attached to the active `wreqs_session` is used.
+            Defaults to None.
+        hedge_after (Optional[Union[float, HedgePolicy]], optional): For GET, HEAD and
+            OPTIONS requests without a body, send a duplicate attempt (through the next
+            proxy, if rotating) when the first has not answered after this many seconds,
+            and use whichever answers first. A `HedgePolicy` learns the delay per host from
+            a latency percentile. Hedges are capped at 10% of requests by default. If None,
+            the policy attached to the active `wreqs_session` is used. Defaults to None.
+        total_timeout (Optional[float], optional): Seconds the whole request may take,
+            retries and backoff included. Defaults to None.
+        deadline (Optional[float], optional): Absolute `time.monotonic()` time by which the
+            request must finish. The earliest of `deadline`, `total_timeout` and the
+            deadline of an enclosing `wreqs_deadline` or `wreq` applies. Defaults to None.
+        compress (Optional[Union[bool, CompressionPolicy]], optional): Compress large
+            request bodies (see `CompressionPolicy`); True uses the default gzip policy and
+            False disables compression. A 415 response makes wreqs resend the body
+            uncompressed. If None, the policy attached to the active `wreqs_session` is
+            used. Defaults to None.
+        max_body_size (Optional[int], optional): Largest response body, in decoded bytes,
+            that is read; larger ones raise `BodyTooLargeError`, before reading anything if
+            `Content-Length` announces it. Ignored with `stream=True`. If None, the limit of
+            the active `wreqs_session` is used. Defaults to None.
+        spill_threshold (Optional[int], optional): Response bodies larger than this are
+            written to a temporary file and memory-mapped; `response.body` then reads them
+            without copying, until the `with` block exits. Ignored with `stream=True`. If
+            None, the threshold of the active `wreqs_session` is used. Defaults to None.
 
     Yields:
         Response: The Response object from the successful request.
@@ -242,6 +799,10 @@ def wreq(
     Raises:
         RetryRequestError: If the maximum number of retries is reached without a successful response.
         Timeout: If the request times out.
+        CircuitOpenError: If a circuit breaker rejects an attempt.
+        RetryBudgetExhaustedError: If a retry budget has no retries left.
+        RateLimitExceededError: If a rate limiter cannot admit an attempt within its `max_wait`.
+        DeadlineExceededError: If the deadline passes before the request completes.
 
     Example:
         Making a request with proxy rotation:
@@ -261,13 +822,46 @@ def wreq(
         ```
 
     Notes:
-        - The context manager automatically closes the session when exiting the context.
+        - The context manager only closes sessions it created itself; caller-provided and
+          `wreqs_session` sessions stay open so their connection pools are reused.
         - If a custom session is provided, it will be used for all requests, including retries.
-        - The retry_callback can be useful for implementing backoff strategies or logging.
-        - Proxy rotation is done in a round-robin fashion if multiple proxies are provided.
+        - Retries resend the request prepared for the first attempt, so cookies the session
+          receives in between are not added to them.
+        - The retry_callback can be useful for logging; waits between retries are best left to `backoff`.
+        - Proxy lists are rotated round-robin starting from the first proxy on every call;
+          use a `ProxyPool` to keep proxy health across calls and threads.
+        - With `stream=True` the body must be consumed inside the `with` block; use
+          `wreq_download` for large transfers that should resume after a dropped connection.
+        - A running attempt cannot be cancelled, so the slower of two hedged attempts
+          finishes (or times out) in the background and its response is discarded.
+        - A deadline caps the connect and read timeouts of each attempt, but a read timeout
+          applies per socket read, so reading a large streamed body can outlast it.
     """
     if session is None:
         session = _wreqs_session.get()
+    options = _wreqs_options.get()
+    if circuit_breaker is None:
+        circuit_breaker = options.get("circuit_breaker")
+    if retry_budget is None:
+        retry_budget = options.get("retry_budget")
+    if proxies is None:
+        proxies = options.get("proxies")
+    if cache is None:
+        cache = options.get("cache")
+    if single_flight is None:
+        single_flight = options.get("single_flight")
+    if metrics is None:
+        metrics = options.get("metrics")
+    if rate_limiter is None:
+        rate_limiter = options.get("rate_limiter")
+    if hedge_after is None:
+        hedge_after = options.get("hedge_after")
+    if compress is None:
+        compress = options.get("compress")
+    if max_body_size is None:
+        max_body_size = options.get("max_body_size")
+    if spill_threshold is None:
+        spill_threshold = options.get("spill_threshold")
 
     context = RequestContext(
         req,
@@ -277,21 +871,93 @@ def wreq(
         session=session,
         timeout=timeout,
         proxies=proxies,
+        backoff=backoff,
+        circuit_breaker=circuit_breaker,
+        retry_budget=retry_budget,
+        cache=cache,
+        single_flight=single_flight,
+        stream=stream,
+        metrics=metrics,
+        rate_limiter=rate_limiter,
+        hedge_after=hedge_after,
+        total_timeout=total_timeout,
+        deadline=deadline,
+        compress=compress,
+        max_body_size=max_body_size,
+        spill_threshold=spill_threshold,
     )
+    # wreq calls made by callbacks or inside the `with` block inherit the deadline
+    token: Token = _wreqs_deadline.set(context.deadline)
     try:
         yield context.__enter__()
     finally:
         context.__exit__(None, None, None)
+        _wreqs_deadline.reset(token)
 
 
 @contextmanager
-def wreqs_session() -> Generator[Session, None, None]:
+def wreqs_session(
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    retry_budget: Optional[RetryBudget] = None,
+    proxies: Optional[ProxyPool] = None,
+    cache: Optional[ResponseCache] = None,
+    single_flight: Union[bool, SingleFlight] = False,
+    metrics: Optional[MetricsHook] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    hedge_after: Optional[Union[float, HedgePolicy]] = None,
+    compress: Union[bool, CompressionPolicy] = False,
+    dns_cache: Optional[DNSCache] = None,
+    max_body_size: Optional[int] = None,
+    spill_threshold: Optional[int] = None,
+) -> Generator[Session, None, None]:
     """
     A context manager that creates and manages a requests.Session object for use with wreq functions.
 
     This context manager creates a new Session object, sets it as the active session for the current context,
     yields the session for use within the context, and ensures proper cleanup when the context is exited.
 
+    Args:
+        pool_connections (int, optional): Number of per-host connection pools to cache.
+            Defaults to requests' DEFAULT_POOLSIZE.
+        pool_maxsize (int, optional): Maximum number of keep-alive connections kept per host.
+            Defaults to requests' DEFAULT_POOLSIZE.
+        pool_block (bool, optional): If True, wait for a free connection once a host's pool
+            is exhausted instead of opening throwaway connections. Defaults to requests'
+            DEFAULT_POOLBLOCK.
+        circuit_breaker (Optional[CircuitBreaker], optional): Circuit breaker applied to every
+            `wreq` inside the context that does not pass its own. Defaults to None.
+        retry_budget (Optional[RetryBudget], optional): Retry budget applied to every `wreq`
+            inside the context that does not pass its own. Defaults to None.
+        proxies (Optional[ProxyPool], optional): Proxy pool used by every `wreq` inside the
+            context that does not pass its own proxies. Defaults to None.
+        cache (Optional[ResponseCache], optional): HTTP cache used by every `wreq` inside the
+            context that does not pass its own. Defaults to None.
+        single_flight (Union[bool, SingleFlight], optional): Coalesce identical idempotent
+            requests made concurrently inside the context into one network call. True
+            creates a `SingleFlight` for this session; pass an instance to share it wider.
+            Defaults to False.
+        metrics (Optional[MetricsHook], optional): Metrics hook (e.g. a `MetricsRegistry`)
+            used by every `wreq` inside the context that does not pass its own.
+            Defaults to None.
+        rate_limiter (Optional[RateLimiter], optional): Rate limiter applied to every `wreq`
+            inside the context that does not pass its own. Defaults to None.
+        hedge_after (Optional[Union[float, HedgePolicy]], optional): Hedge delay or policy
+            used by every `wreq` inside the context that does not pass its own.
+            Defaults to None.
+        compress (Union[bool, CompressionPolicy], optional): Request body compression for
+            every `wreq` inside the context that does not pass its own; True uses the
+            default gzip policy. Defaults to False.
+        dns_cache (Optional[DNSCache], optional): Resolve host names for the session's new
+            connections through this cache, which may be shared with other sessions.
+            Defaults to None.
+        max_body_size (Optional[int], optional): Response body size limit for every `wreq`
+            inside the context that does not pass its own. Defaults to None.
+        spill_threshold (Optional[int], optional): Spill-to-disk threshold for every `wreq`
+            inside the context that does not pass its own. Defaults to None.
+
     Usage:
         with wreqs_session() as session:
             # Use wreq functions without explicitly passing the session
@@ -322,15 +988,36 @@ def wreqs_session() -> Generator[Session, None, None]:
         - It sets the created session as the active session for all wreq calls within its context.
         - The session is automatically closed when exiting the context, ensuring proper resource management.
         - This function is particularly useful when making multiple requests that should share a session.
+        - `wreq` calls inside the context never close the session, so keep-alive connections are reused
+          across calls. Use `pool_stats(session)` to inspect the pools.
 
     See Also:
         wreq: The main function for making HTTP requests within the wreqs framework.
     """
     session = Session()
+    configure_pool(session, pool_connections, pool_maxsize, pool_block, dns_cache)
+    if single_flight is True:
+        single_flight = SingleFlight()
     token: Token = _wreqs_session.set(session)
+    options_token: Token = _wreqs_options.set(
+        {
+            "circuit_breaker": circuit_breaker,
+            "retry_budget": retry_budget,
+            "proxies": proxies,
+            "cache": cache,
+            "single_flight": single_flight or None,
+            "metrics": metrics,
+            "rate_limiter": rate_limiter,
+            "hedge_after": hedge_after,
+            "compress": compress or None,
+            "max_body_size": max_body_size,
+            "spill_threshold": spill_threshold,
+        }
+    )
     try:
         yield session
     finally:
+        _wreqs_options.reset(options_token)
         _wreqs_session.reset(token)
         session.close()
 
@@ -340,6 +1027,10 @@ def configure_logger(
     level: int = logging.INFO,
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     filename: Optional[str] = None,
+    structured: bool = False,
+    sample_successes: int = 1,
+    async_handler: bool = False,
+    queue_size: int = 10000,
 ) -> None:
     """
     Configure the logger for the wreqs module.
@@ -358,6 +1049,18 @@ def configure_logger(
             Defaults to "%(asctime)s - %(name)s - %(levelname)s - %(message)s".
         filename (Optional[str], optional): If provided, logs will be written to this file.
             If None, logs will be written to the console. Defaults to None.
+        structured (bool, optional): Log each request as one summary record carrying
+            `request_id`, `method`, `host`, `status`, `attempt`, `elapsed` and `error`
+            as `extra` fields, written as JSON lines by `StructuredFormatter`; the
+            step-by-step messages move to DEBUG. Defaults to False.
+        sample_successes (int, optional): Log the step messages and summary of only 1
+            in this many requests. Retries and failures are always logged. Defaults to 1
+            (log every request).
+        async_handler (bool, optional): Hand records to a queue written by a background
+            thread, so file or console I/O never blocks the requesting thread.
+            Defaults to False.
+        queue_size (int, optional): With `async_handler`, records buffered before new
+            ones are dropped. Defaults to 10000.
 
     Returns:
         None
@@ -385,6 +1088,13 @@ def configure_logger(
         configure_logger(filename="wreqs.log")
         ```
 
+        High-volume structured logging, 1 in 100 successes, written in the background:
+        ```python
+        from wreqs import configure_logger
+
+        configure_logger(structured=True, sample_successes=100, async_handler=True)
+        ```
+
         Using a custom logger:
         ```python
         import logging
@@ -401,18 +1111,26 @@ def configure_logger(
 
     Notes:
         - This function modifies the global `logger` variable used throughout the wreqs module.
-        - If a custom logger is provided, it will be used as-is, and all other parameters will be ignored.
+        - If a custom logger is provided, it will be used as-is; `structured` and
+          `sample_successes` still apply, the handler parameters are ignored.
         - When not using a custom logger, this function removes all existing handlers before adding the new one.
-        - The default format includes timestamp, logger name, log level, and message.
+        - The default format includes timestamp, logger name, log level, and message;
+          `format` is ignored when `structured` is set.
+        - The background writer is flushed at interpreter exit; records that do not fit
+          in the queue are dropped rather than slowing requests down.
     """
     global logger
+    set_log_settings(LogSettings(structured, sample_successes))
     if custom_logger:
         logger = custom_logger
     else:
         logger.setLevel(level)
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
+        stop_async_logging()
         handler = logging.FileHandler(filename) if filename else logging.StreamHandler()
-        formatter = logging.Formatter(format)
+        formatter = StructuredFormatter() if structured else logging.Formatter(format)
         handler.setFormatter(formatter)
+        if async_handler:
+            handler = queued_handler(handler, queue_size)
         logger.addHandler(handler)
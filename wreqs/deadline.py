@@ -0,0 +1,121 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Generator, Optional, Tuple, Union
+
+from wreqs.error import DeadlineExceededError
+
+# a single float applies to both phases; a tuple sets (connect, read) separately
+TimeoutType = Optional[Union[float, Tuple[Optional[float], Optional[float]]]]
+
+# absolute `time.monotonic()` deadline inherited by every `wreq` in the current context
+_wreqs_deadline: ContextVar[Optional[float]] = ContextVar(
+    "_wreqs_deadline", default=None
+)
+
+
+def resolve_deadline(
+    deadline: Optional[float] = None, total_timeout: Optional[float] = None
+) -> Optional[float]:
+    """
+    Combine an explicit deadline, a relative timeout and the inherited deadline.
+
+    Args:
+        deadline (Optional[float], optional): Absolute `time.monotonic()` deadline.
+            Defaults to None.
+        total_timeout (Optional[float], optional): Seconds from now. Defaults to None.
+
+    Returns:
+        Optional[float]: The earliest of the given and inherited deadlines, or None if
+            there is none.
+    """
+    candidates = [d for d in (_wreqs_deadline.get(), deadline) if d is not None]
+    if total_timeout is not None:
+        candidates.append(time.monotonic() + total_timeout)
+    return min(candidates) if candidates else None
+
+
+def time_left() -> Optional[float]:
+    """
+    Seconds left before the deadline of the current context.
+
+    Useful for passing the remaining budget on to a downstream service, e.g. in a
+    request header.
+
+    Returns:
+        Optional[float]: Remaining seconds (0 once passed), or None without a deadline.
+    """
+    deadline = _wreqs_deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def attempt_timeout(timeout: TimeoutType, deadline: Optional[float]) -> TimeoutType:
+    """
+    Shrink a per-attempt timeout so the attempt cannot outlive `deadline`.
+
+    Args:
+        timeout (TimeoutType): Configured timeout: seconds, a (connect, read) tuple or None.
+        deadline (Optional[float]): Absolute `time.monotonic()` deadline, if any.
+
+    Returns:
+        TimeoutType: The timeout to send the attempt with, in the same shape as `timeout`
+            (a float if it was None).
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed.
+    """
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError("Deadline exceeded before the attempt could be sent")
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return (
+            remaining if connect is None else min(connect, remaining),
+            remaining if read is None else min(read, remaining),
+        )
+    return min(timeout, remaining)
+
+
+@contextmanager
+def wreqs_deadline(
+    total_timeout: Optional[float] = None, deadline: Optional[float] = None
+) -> Generator[Optional[float], None, None]:
+    """
+    A context manager that bounds every `wreq` and `awreq` call made inside it.
+
+    Calls inside the scope, including ones made deep in a call stack, by `wreq_many`
+    workers, or by nested scopes, inherit the deadline. Nested scopes and per-call
+    `total_timeout`s can only shorten it, never extend it.
+
+    Args:
+        total_timeout (Optional[float], optional): Seconds from now. Defaults to None.
+        deadline (Optional[float], optional): Absolute `time.monotonic()` deadline, e.g.
+            derived from an incoming request's own deadline. Defaults to None.
+
+    Yields:
+        Optional[float]: The effective absolute deadline.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_deadline
+
+        def handle(order_id):
+            with wreqs_deadline(2.0):
+                with wreq(Request("GET", f"https://orders.example.com/{order_id}")) as order:
+                    ...
+                with wreq(Request("GET", "https://stock.example.com/levels")) as stock:
+                    ...  # gets whatever is left of the 2 seconds
+        ```
+    """
+    effective = resolve_deadline(deadline, total_timeout)
+    token: Token = _wreqs_deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _wreqs_deadline.reset(token)
@@ -0,0 +1,321 @@
+import ipaddress
+import socket
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+try:
+    from urllib3.exceptions import NameResolutionError
+except ImportError:  # urllib3 < 2
+    NameResolutionError = None  # type: ignore[assignment,misc]
+
+AddrInfo = Tuple[Any, Any, int, str, Tuple[Any, ...]]
+ResolverType = Callable[..., List[AddrInfo]]
+_Key = Tuple[str, Optional[int], int, int, int, int]
+
+
+class DNSCacheStats(NamedTuple):
+    """
+    Snapshot of a `DNSCache`'s counters.
+
+    Attributes:
+        hits (int): Lookups answered from a cached address list.
+        misses (int): Lookups that had to wait for the resolver.
+        negative_hits (int): Lookups answered from a cached resolution failure.
+        refreshes (int): Background refreshes completed successfully.
+        refresh_errors (int): Background refreshes that failed; the old entry is kept.
+        size (int): Entries currently cached.
+    """
+
+    hits: int
+    misses: int
+    negative_hits: int
+    refreshes: int
+    refresh_errors: int
+    size: int
+
+
+class _Entry(NamedTuple):
+    addresses: Optional[List[AddrInfo]]
+    error: Optional[socket.gaierror]
+    expires: float
+    refresh_at: float
+
+
+class DNSCache:
+    """
+    Thread-safe, TTL-bounded cache of `getaddrinfo` results.
+
+    Successful lookups are kept for `ttl` seconds, failed ones for `negative_ttl`.
+    Once an entry is older than `refresh_ahead` of its TTL, the next lookup still
+    gets the cached addresses while a background thread resolves the host again,
+    so busy hosts never wait on the resolver after their first lookup.
+
+    Args:
+        ttl (float, optional): Seconds a successful lookup is cached. Defaults to 60.
+        negative_ttl (float, optional): Seconds a failed lookup (`socket.gaierror`) is
+            cached; 0 disables negative caching. Defaults to 5.
+        refresh_ahead (Optional[float], optional): Fraction of `ttl` after which hits
+            trigger a background refresh; None disables refreshing. Defaults to 0.8.
+        max_size (int, optional): Maximum number of entries; the least recently used is
+            dropped first. Defaults to 1024.
+        resolver (ResolverType, optional): Function with the signature of
+            `socket.getaddrinfo`. Defaults to `socket.getaddrinfo`.
+        clock (Callable[[], float], optional): Monotonic clock. Defaults to
+            `time.monotonic`.
+
+    Example:
+        ```python
+        from wreqs import DNSCache, wreq, wreqs_session
+
+        dns = DNSCache(ttl=30)
+        with wreqs_session(dns_cache=dns):
+            with wreq(Request("GET", "https://api.example.com/data")) as response:
+                ...
+        print(dns.stats())
+        ```
+
+    Notes:
+        - `getaddrinfo` does not report record TTLs, so `ttl` applies to every host;
+          keep it below the TTLs of hosts whose addresses change (e.g. failovers).
+        - A cache can be shared by several sessions and session pools.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        refresh_ahead: Optional[float] = 0.8,
+        max_size: int = 1024,
+        resolver: ResolverType = socket.getaddrinfo,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if refresh_ahead is not None and not 0 < refresh_ahead < 1:
+            raise ValueError("refresh_ahead must be between 0 and 1")
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.refresh_ahead = refresh_ahead
+        self.max_size = max_size
+        self.resolver = resolver
+        self.clock = clock
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+        self._refreshing: Set[_Key] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._negative_hits = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+
+    def resolve(
+        self,
+        host: str,
+        port: Optional[int],
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> List[AddrInfo]:
+        """
+        Look up `host` like `socket.getaddrinfo`, using the cache.
+
+        Args:
+            host (str): Host name to resolve.
+            port (Optional[int]): Port placed in the returned socket addresses.
+            family (int, optional): Address family. Defaults to 0 (any).
+            type (int, optional): Socket type. Defaults to 0 (any).
+            proto (int, optional): Protocol. Defaults to 0 (any).
+            flags (int, optional): `getaddrinfo` flags. Defaults to 0.
+
+        Returns:
+            List[AddrInfo]: `(family, type, proto, canonname, sockaddr)` tuples.
+
+        Raises:
+            socket.gaierror: If the host does not resolve (possibly cached).
+        """
+        key: _Key = (host.lower(), port, family, type, proto, flags)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now < entry.expires:
+                self._entries.move_to_end(key)
+                if entry.error is not None:
+                    self._negative_hits += 1
+                    raise socket.gaierror(*entry.error.args)
+                self._hits += 1
+                refresh = now >= entry.refresh_at and key not in self._refreshing
+                if refresh:
+                    self._refreshing.add(key)
+            else:
+                self._misses += 1
+                entry = None
+                refresh = False
+
+        if entry is None:
+            return self._lookup(key)
+        if refresh:
+            threading.Thread(
+                target=self._refresh, args=(key,), daemon=True, name="wreqs-dns-refresh"
+            ).start()
+        return list(entry.addresses or ())
+
+    def _query(self, key: _Key) -> List[AddrInfo]:
+        host, port, family, type_, proto, flags = key
+        return list(self.resolver(host, port, family, type_, proto, flags))
+
+    def _lookup(self, key: _Key) -> List[AddrInfo]:
+        try:
+            addresses = self._query(key)
+        except socket.gaierror as e:
+            if self.negative_ttl > 0:
+                now = self.clock()
+                expires = now + self.negative_ttl
+                # a fresh copy, so the cache does not keep the traceback's frames alive
+                self._store(key, _Entry(None, socket.gaierror(*e.args), expires, expires))
+            raise
+        self._store(key, self._positive(addresses))
+        return list(addresses)
+
+    def _refresh(self, key: _Key) -> None:
+        try:
+            addresses = self._query(key)
+        except OSError:
+            # keep serving the old addresses until they expire
+            with self._lock:
+                self._refresh_errors += 1
+                self._refreshing.discard(key)
+            return
+        entry = self._positive(addresses)
+        with self._lock:
+            self._put(key, entry)
+            self._refreshes += 1
+            self._refreshing.discard(key)
+
+    def _positive(self, addresses: List[AddrInfo]) -> _Entry:
+        now = self.clock()
+        expires = now + self.ttl
+        if self.refresh_ahead is None:
+            return _Entry(addresses, None, expires, expires)
+        return _Entry(addresses, None, expires, now + self.ttl * self.refresh_ahead)
+
+    def _store(self, key: _Key, entry: _Entry) -> None:
+        with self._lock:
+            self._put(key, entry)
+
+    def _put(self, key: _Key, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, host: Optional[str] = None) -> None:
+        """Drop the cached entries for `host`, or all entries if None."""
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == host.lower()]:
+                del self._entries[key]
+
+    def stats(self) -> DNSCacheStats:
+        """Return the current counters."""
+        with self._lock:
+            return DNSCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                negative_hits=self._negative_hits,
+                refreshes=self._refreshes,
+                refresh_errors=self._refresh_errors,
+                size=len(self._entries),
+            )
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+def _cached_connection(base: type, cache: DNSCache) -> type:
+    """Subclass a urllib3 connection class to resolve its host through `cache`."""
+
+    def _new_conn(self: Any) -> socket.socket:
+        host = self._dns_host
+        if _is_ip(host):
+            return super(connection_cls, self)._new_conn()
+        try:
+            addresses = cache.resolve(host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            if NameResolutionError is not None:
+                raise NameResolutionError(self.host, self, e) from e
+            raise NewConnectionError(self, f"Failed to resolve {self.host}: {e}") from e
+
+        # like urllib3, try each address in turn; urllib3 itself only gets IPs now
+        error: Optional[Exception] = None
+        try:
+            for address in addresses:
+                self._dns_host = address[4][0]
+                try:
+                    return super(connection_cls, self)._new_conn()
+                except ConnectTimeoutError as e:  # NewConnectionError included
+                    error = e
+        finally:
+            self._dns_host = host
+        if error is None:
+            raise NewConnectionError(self, f"Failed to resolve {self.host}: no addresses")
+        raise error
+
+    connection_cls = type(base.__name__, (base,), {"_new_conn": _new_conn})
+    return connection_cls
+
+
+class DNSCachingAdapter(HTTPAdapter):
+    """
+    `HTTPAdapter` whose connections resolve host names through a `DNSCache`.
+
+    Only new connections resolve names, so the cache complements keep-alive
+    connection reuse. HTTP(S) proxies are resolved through the cache too; SOCKS
+    proxies are left alone.
+
+    Args:
+        dns_cache (DNSCache): The cache to resolve through.
+        *args: Passed to `HTTPAdapter`.
+        **kwargs: Passed to `HTTPAdapter` (pool_connections, pool_maxsize, ...).
+    """
+
+    def __init__(self, dns_cache: DNSCache, *args: Any, **kwargs: Any) -> None:
+        self.dns_cache = dns_cache
+        self._pool_classes: Dict[str, type] = {
+            "http": type(
+                "HTTPConnectionPool",
+                (HTTPConnectionPool,),
+                {"ConnectionCls": _cached_connection(HTTPConnection, dns_cache)},
+            ),
+            "https": type(
+                "HTTPSConnectionPool",
+                (HTTPSConnectionPool,),
+                {"ConnectionCls": _cached_connection(HTTPSConnection, dns_cache)},
+            ),
+        }
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if not proxy.lower().startswith("socks"):
+            manager.pool_classes_by_scheme = self._pool_classes
+        return manager
@@ -0,0 +1,283 @@
+import copy
+import os
+import re
+import time
+from typing import IO, Any, Callable, NamedTuple, Optional, Union
+
+from requests import ConnectionError, HTTPError, Request, Response, Session, Timeout
+from requests.exceptions import ChunkedEncodingError
+
+from wreqs.backoff import Backoff
+from wreqs.context import _wreqs_session, logger, wreq
+from wreqs.deadline import resolve_deadline
+from wreqs.error import DeadlineExceededError, DownloadError
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-\d+/(\d+|\*)")
+
+# errors after which the transfer is resumed instead of failing; a passed deadline
+# (`DeadlineExceededError`, also a Timeout) is not one of them
+_TRANSIENT_ERRORS = (ConnectionError, ChunkedEncodingError, Timeout)
+
+Destination = Union[str, "os.PathLike[str]", IO[bytes], Callable[[bytes], Any]]
+
+
+class DownloadResult(NamedTuple):
+    """
+    Outcome of `wreq_download`.
+
+    Attributes:
+        size (int): Size of the downloaded body, including bytes already on disk when
+            resuming a file.
+        total (Optional[int]): Size announced by the server, if any.
+        resumes (int): Times the transfer continued with a `Range` request.
+        restarts (int): Times the transfer started over because the server could not resume.
+    """
+
+    size: int
+    total: Optional[int]
+    resumes: int
+    restarts: int
+
+
+class _Sink:
+    """Writes chunks to a path, a binary file object or a callback."""
+
+    def __init__(self, dest: Destination, resume: bool) -> None:
+        self.owned: Optional[IO[bytes]] = None
+        self.file: Optional[IO[bytes]] = None
+        # bytes already present (resumed file) and where our data starts in the file
+        self.offset = 0
+        self.start = 0
+        if isinstance(dest, (str, os.PathLike)):
+            self.file = self.owned = open(dest, "ab" if resume else "wb")
+            self.offset = self.owned.tell()
+        elif callable(getattr(dest, "write", None)):
+            self.file = dest  # type: ignore[assignment]
+            if self.file.seekable():
+                self.start = self.file.tell()
+        elif callable(dest):
+            self.callback = dest
+        else:
+            raise TypeError("dest must be a path, a binary file object or a callable")
+
+    def write(self, chunk: bytes) -> None:
+        if self.file is not None:
+            self.file.write(chunk)
+        else:
+            self.callback(chunk)
+
+    def rewind(self) -> bool:
+        if self.file is None or not self.file.seekable():
+            return False
+        self.file.seek(self.start)
+        self.file.truncate()
+        return True
+
+    def close(self) -> None:
+        if self.owned is not None:
+            self.owned.close()
+
+
+def _range_request(request: Request, start: int, validator: Optional[str]) -> Request:
+    ranged = copy.copy(request)
+    ranged.headers = dict(request.headers or {})
+    ranged.headers["Range"] = f"bytes={start}-"
+    if validator:
+        ranged.headers["If-Range"] = validator
+    return ranged
+
+
+def _validator(response: Response) -> Optional[str]:
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):  # If-Range needs a strong validator
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def _total_size(response: Response) -> Optional[int]:
+    match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+    if match:
+        return None if match.group(2) == "*" else int(match.group(2))
+    length = response.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+def wreq_download(
+    request: Request,
+    dest: Destination,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = 3,
+    backoff: Optional[Backoff] = None,
+    timeout: Optional[float] = None,
+    session: Optional[Session] = None,
+    resume: bool = False,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    **kwargs: Any,
+) -> DownloadResult:
+    """
+    Stream a response body to a file or callback, resuming after dropped connections.
+
+    The body is written in `chunk_size` pieces, so memory stays constant whatever the
+    size. When the connection drops or times out mid-transfer, the download continues
+    with a `Range: bytes=<received>-` request guarded by `If-Range`, so a resource
+    that changed in the meantime is never spliced. If the server answers with a full
+    200 instead of a 206, a path or seekable file is truncated and the download starts
+    over; a callback destination cannot be rewound and raises `DownloadError`.
+
+    Args:
+        request (Request): The GET request for the resource.
+        dest (Union[str, PathLike, IO[bytes], Callable[[bytes], Any]]): A path to write
+            to, a binary file object, or a callable receiving each chunk.
+        chunk_size (int, optional): Bytes read and written at a time. Defaults to 1 MiB.
+        max_retries (int, optional): Consecutive failed attempts, without any new bytes
+            received, before giving up. Defaults to 3.
+        backoff (Optional[Backoff], optional): Policy for waiting between attempts. If None,
+            attempts are resumed immediately. Defaults to None.
+        timeout (Optional[float], optional): Connect and per-read timeout in seconds.
+            Defaults to None.
+        session (Optional[Session], optional): Session used for every attempt. If None, the
+            active `wreqs_session` is used, or one is created for the whole download.
+            Defaults to None.
+        resume (bool, optional): If `dest` is a path that already exists, append to it and
+            request only the missing bytes. Defaults to False.
+        progress (Optional[Callable[[int, Optional[int]], None]], optional): Called after
+            each chunk with the bytes written so far and the total size, if known.
+            Defaults to None.
+        **kwargs: Options forwarded to `wreq` for every attempt (proxies, circuit_breaker, ...).
+            `total_timeout` and `deadline` bound the whole download, not each attempt.
+
+    Returns:
+        DownloadResult: Bytes written, announced size, and the number of resumes/restarts.
+
+    Raises:
+        DownloadError: If the transfer cannot be resumed into a callback destination, or
+            the server's byte range does not line up with the bytes already written.
+        HTTPError: For 4xx responses, and 5xx responses once retries are exhausted.
+        ConnectionError: If the connection keeps failing past `max_retries`.
+        DeadlineExceededError: If the deadline passes; it is never retried.
+
+    Example:
+        ```python
+        from requests import Request
+        from wreqs import wreq_download, ExponentialBackoff
+
+        result = wreq_download(
+            Request("GET", "https://exports.example.com/2024.csv.gz"),
+            "/data/2024.csv.gz",
+            max_retries=5,
+            backoff=ExponentialBackoff(base=1),
+            timeout=30,
+        )
+        print(f"{result.size} bytes, resumed {result.resumes} times")
+        ```
+
+    Notes:
+        - `Accept-Encoding: identity` is sent unless the request sets it, so byte offsets
+          refer to the stored bytes.
+    """
+    if session is None:
+        session = _wreqs_session.get()
+    owned = session is None
+    if session is None:
+        session = Session()
+
+    request = copy.copy(request)
+    request.headers = dict(request.headers or {})
+    request.headers.setdefault("Accept-Encoding", "identity")
+
+    deadline = resolve_deadline(kwargs.pop("deadline", None), kwargs.pop("total_timeout", None))
+    sink = _Sink(dest, resume)
+    received = sink.offset
+    total: Optional[int] = None
+    validator: Optional[str] = None
+    resumes = restarts = failures = 0
+    delay = 0.0
+
+    try:
+        while True:
+            attempt = (
+                _range_request(request, received, validator) if received else request
+            )
+            received_before = received
+            try:
+                with wreq(
+                    attempt,
+                    stream=True,
+                    timeout=timeout,
+                    session=session,
+                    deadline=deadline,
+                    **kwargs,
+                ) as response:
+                    if received and response.status_code == 416:
+                        # resumed a file that is already complete
+                        total = received
+                        break
+                    response.raise_for_status()
+
+                    if received:
+                        match = _CONTENT_RANGE.match(
+                            response.headers.get("Content-Range", "")
+                        )
+                        if response.status_code == 206 and match:
+                            if int(match.group(1)) != received:
+                                raise DownloadError(
+                                    f"Server resumed at byte {match.group(1)}, expected {received}"
+                                )
+                            resumes += 1
+                        else:
+                            if not sink.rewind():
+                                raise DownloadError(
+                                    "Server cannot resume the download and the destination "
+                                    "cannot be rewound"
+                                )
+                            logger.warning("Server ignored Range, restarting download")
+                            received = received_before = 0
+                            total = None
+                            restarts += 1
+
+                    if received:
+                        # some servers leave validators off partial responses
+                        validator = _validator(response) or validator
+                    else:
+                        validator = _validator(response)
+                    total = _total_size(response) if total is None else total
+
+                    for chunk in response.iter_content(chunk_size):
+                        sink.write(chunk)
+                        received += len(chunk)
+                        if progress:
+                            progress(received, total)
+                break
+            except DeadlineExceededError:
+                raise
+            except (HTTPError, *_TRANSIENT_ERRORS) as e:
+                if isinstance(e, HTTPError) and (
+                    e.response is None or e.response.status_code < 500
+                ):
+                    raise
+                failures = 1 if received > received_before else failures + 1
+                if failures > max_retries:
+                    logger.error("Download failed after %d attempts: %s", failures, e)
+                    raise
+                logger.warning(
+                    "Download interrupted at byte %d (%s), resuming", received, e
+                )
+                if backoff:
+                    delay = backoff.delay(failures, delay)
+                    wait = delay
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise DeadlineExceededError(
+                                "Deadline exceeded while resuming the download"
+                            ) from e
+                        wait = min(wait, remaining)
+                    backoff.sleep(wait)
+    finally:
+        sink.close()
+        if owned:
+            session.close()
+
+    return DownloadResult(received, total, resumes, restarts)
@@ -1,6 +1,54 @@
+from typing import Optional
+
+from requests import Timeout
+
+
 class WrappedRequestError(Exception):
     pass
 
 
 class RetryRequestError(WrappedRequestError):
     pass
+
+
+class RetryBudgetExhaustedError(RetryRequestError):
+    pass
+
+
+class DownloadError(WrappedRequestError):
+    pass
+
+
+class SessionPoolExhaustedError(WrappedRequestError):
+    pass
+
+
+class CircuitOpenError(WrappedRequestError):
+    def __init__(
+        self, message: str, key: Optional[str] = None, retry_in: float = 0.0
+    ) -> None:
+        super().__init__(message)
+        self.key = key
+        self.retry_in = retry_in
+
+
+class RateLimitExceededError(WrappedRequestError):
+    def __init__(
+        self, message: str, key: Optional[str] = None, retry_in: float = 0.0
+    ) -> None:
+        super().__init__(message)
+        self.key = key
+        self.retry_in = retry_in
+
+
+class DeadlineExceededError(WrappedRequestError, Timeout):
+    pass
+
+
+class BodyTooLargeError(WrappedRequestError):
+    def __init__(
+        self, message: str, limit: int = 0, size: Optional[int] = None
+    ) -> None:
+        super().__init__(message)
+        self.limit = limit
+        self.size = size
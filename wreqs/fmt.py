@@ -1,15 +1,19 @@
 import json
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
-from requests import Request, Response
+from requests import PreparedRequest, Request, Response
+from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
+
+from wreqs.body import SpilledResponse
+from wreqs.codec import decode_json, loads_json
 
 
 def _format_content(content: Any) -> Any:
     """
     Formats the given content for consistent representation.
 
-    This method attempts to parse strings as JSON, leaves dictionaries and
-    iterables unchanged, and converts other types to strings.
+    This method attempts to parse strings as JSON (with the configured codec), leaves
+    dictionaries and iterables unchanged, and converts other types to strings.
 
     Args:
         content (Any): The content to be formatted.
@@ -24,15 +28,24 @@ def _format_content(content: Any) -> Any:
         return content
     elif isinstance(content, str):
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return loads_json(content)
+        except ValueError:
             return content
     else:
         return str(content)
 
 
+def _format_body(response: Response) -> Any:
+    """Parsed JSON body of `response` (shared with `response.json()`), else its text."""
+    try:
+        return decode_json(response)
+    except RequestsJSONDecodeError:
+        return response.text
+
+
 def prettify_request_str(
-    request: Request, verbose: Union[bool, Dict[str, bool]] = False
+    request: Union[Request, PreparedRequest],
+    verbose: Union[bool, Dict[str, bool]] = False,
 ) -> str:
     """
     Formats a Request object into a human-readable string representation.
@@ -41,7 +54,7 @@ def prettify_request_str(
     The level of detail in the output is controlled by the 'verbose' parameter.
 
     Args:
-        request (Request): The Request object to be formatted.
+        request (Union[Request, PreparedRequest]): The request to be formatted.
         verbose (bool, Dict[str, bool], optional): Controls the verbosity of the output.
             - If False (default), returns a compact single-line summary.
             - If True, returns a detailed multi-line representation.
@@ -62,6 +75,9 @@ def prettify_request_str(
     - json: JSON payload
     - auth: Authentication information
 
+    A PreparedRequest only carries its headers and encoded body, reported as `headers`
+    and `body` (its size in bytes, or "stream" for file-like bodies).
+
     For non-verbose output, the JSON object contains the length of each field (or "present" for non-length fields).
     For verbose output, it contains the full content of each field.
 
@@ -97,14 +113,21 @@ def prettify_request_str(
     """
     basic_info = f"[{request.method}] {request.url}"
 
-    request_dict = {
-        "headers": _format_content(request.headers) if request.headers else {},
-        "cookies": _format_content(request.cookies) if request.cookies else {},
-        "params": _format_content(request.params) if request.params else {},
-        "data": _format_content(request.data) if request.data else {},
-        "json": _format_content(request.json) if request.json else {},
-        "auth": str(request.auth) if request.auth else None,
-    }
+    if isinstance(request, PreparedRequest):
+        body = request.body
+        request_dict: Dict[str, Any] = {
+            "headers": dict(request.headers) if request.headers else {},
+            "body": len(body) if isinstance(body, (bytes, str)) else body and "stream",
+        }
+    else:
+        request_dict = {
+            "headers": _format_content(request.headers) if request.headers else {},
+            "cookies": _format_content(request.cookies) if request.cookies else {},
+            "params": _format_content(request.params) if request.params else {},
+            "data": _format_content(request.data) if request.data else {},
+            "json": _format_content(request.json) if request.json else {},
+            "auth": str(request.auth) if request.auth else None,
+        }
 
     request_dict = {k: v for k, v in request_dict.items() if v}
 
@@ -113,7 +136,7 @@ def prettify_request_str(
         json_dict = {
             k: (
                 v
-                if verbose.get(k, default_verbose)
+                if verbose.get(k, default_verbose) or k == "body"
                 else len(v) if isinstance(v, (dict, list, str)) else "present"
             )
             for k, v in request_dict.items()
@@ -125,7 +148,11 @@ def prettify_request_str(
         return f"{basic_info}\n{json_str}"
     else:
         summary_dict = {
-            key: (len(value) if isinstance(value, (dict, list, str)) else "present")
+            key: (
+                value
+                if key == "body"
+                else (len(value) if isinstance(value, (dict, list, str)) else "present")
+            )
             for key, value in request_dict.items()
         }
         json_str = json.dumps(summary_dict, separators=(",", ":"))
@@ -162,8 +189,12 @@ def prettify_response_str(
     - encoding: Response encoding
     - reason: Reason phrase for the status code
     - content: Response body content
+    - stream: Content-Length of a streamed response whose body has not been read yet;
+      such bodies are never read here, so `content` is left out
+    - spilled: Size of a body that `wreq` spilled to disk; it is not read here either
 
-    For non-verbose output, the JSON object contains the length of each field (or the actual value for 'elapsed').
+    For non-verbose output, the JSON object contains the length of each field (or the actual
+    value for 'elapsed' and 'stream').
     For verbose output, it contains the full content of each field.
 
     Examples:
@@ -203,6 +234,10 @@ def prettify_response_str(
         # }
     """
     basic_info = f"[{response.status_code}] {response.url}"
+    # `stream=True` responses are left unread until the caller consumes them
+    streaming = response._content is False
+    # bodies spilled to disk are not loaded back into memory just to be logged
+    spilled = len(response.body) if isinstance(response, SpilledResponse) else None
 
     response_dict = {
         "headers": dict(response.headers),
@@ -210,7 +245,11 @@ def prettify_response_str(
         "elapsed": str(response.elapsed),
         "encoding": response.encoding,
         "reason": response.reason,
-        "content": _format_content(response.text),
+        "content": None if streaming or spilled is not None else _format_body(response),
+        "stream": (
+            response.headers.get("Content-Length", "unknown") if streaming else None
+        ),
+        "spilled": spilled,
     }
 
     response_dict = {k: v for k, v in response_dict.items() if v}
@@ -220,7 +259,7 @@ def prettify_response_str(
         json_dict = {
             k: (
                 v
-                if verbose.get(k, default_verbose) or k == "elapsed"
+                if verbose.get(k, default_verbose) or k in ("elapsed", "stream", "spilled")
                 else len(v) if isinstance(v, (dict, list, str)) else "present"
             )
             for k, v in response_dict.items()
@@ -234,10 +273,64 @@ def prettify_response_str(
         summary_dict = {
             key: (
                 value
-                if key == "elapsed"
+                if key in ("elapsed", "stream", "spilled")
                 else (len(value) if isinstance(value, (dict, list, str)) else "present")
             )
             for key, value in response_dict.items()
         }
         json_str = json.dumps(summary_dict, separators=(",", ":"))
         return f"{basic_info} {json_str}"
+
+
+class LazyRequestStr:
+    """
+    Deferred, memoized string form of a Request for use as a logging argument.
+
+    The summary is only built when a log record is actually emitted, and at most
+    once per instance, so passing it to a disabled logger costs nothing.
+
+    Example:
+        logger.info("Sending: %s", LazyRequestStr(request))
+    """
+
+    __slots__ = ("_request", "_verbose", "_value")
+
+    def __init__(
+        self,
+        request: Union[Request, PreparedRequest],
+        verbose: Union[bool, Dict[str, bool]] = False,
+    ) -> None:
+        self._request = request
+        self._verbose = verbose
+        self._value: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = prettify_request_str(self._request, self._verbose)
+        return self._value
+
+
+class LazyResponseStr:
+    """
+    Deferred, memoized string form of a Response for use as a logging argument.
+
+    Formatting a response reads and decodes its body, so this wrapper makes sure
+    that happens only when a record is emitted, and only once per response.
+
+    Example:
+        logger.info("Received: %s", LazyResponseStr(response))
+    """
+
+    __slots__ = ("_response", "_verbose", "_value")
+
+    def __init__(
+        self, response: Response, verbose: Union[bool, Dict[str, bool]] = False
+    ) -> None:
+        self._response = response
+        self._verbose = verbose
+        self._value: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = prettify_response_str(self._response, self._verbose)
+        return self._value
@@ -0,0 +1,243 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    as_completed,
+)
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from requests import PreparedRequest, Response
+
+from wreqs.breaker import RetryBudget, default_is_failure
+
+HEDGEABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class _Workers:
+    """A lazily started thread pool that refuses work instead of queueing it."""
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def try_spawn(self, fn: Callable[[], Response]) -> "Optional[Future[Response]]":
+        if not self._slots.acquire(blocking=False):
+            return None
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        self.max_workers, thread_name_prefix="wreqs-hedge"
+                    )
+
+        def run() -> Response:
+            try:
+                return fn()
+            finally:
+                self._slots.release()
+
+        try:
+            return self._executor.submit(run)
+        except BaseException:
+            self._slots.release()
+            raise
+
+
+class HedgePolicy:
+    """
+    Decides when to send a duplicate ("hedged") attempt for a slow idempotent request.
+
+    With a fixed `delay`, a hedge is sent whenever the first attempt has not answered
+    after that many seconds. Without one, the delay is learned per key (host) as the
+    `percentile` of recent attempt latencies, so only the slowest few percent of
+    requests are hedged. Hedges withdraw from a budget capped at `max_hedge_ratio` of
+    requests, so hedging cannot double the load while a backend is struggling.
+
+    Args:
+        delay (Optional[float], optional): Fixed hedge delay in seconds. If None, the
+            delay is learned from observed latencies. Defaults to None.
+        percentile (float, optional): Latency percentile (0-1) used as the learned delay.
+            Defaults to 0.95.
+        min_samples (int, optional): Latencies needed for a key before hedging starts.
+            Defaults to 20.
+        max_samples (int, optional): Recent latencies kept per key. Defaults to 200.
+        max_hedge_ratio (float, optional): Hedges allowed per request over the budget
+            window. Defaults to 0.1 (10%).
+        min_hedges (int, optional): Hedges always allowed per window. Defaults to 10.
+        budget (Optional[RetryBudget], optional): Budget to withdraw hedges from instead
+            of one built from `max_hedge_ratio` and `min_hedges`. Defaults to None.
+        max_workers (int, optional): Threads shared by every hedged send using this
+            policy. While all are busy, requests are sent without hedging. Defaults to 32.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, HedgePolicy
+
+        with wreqs_session(hedge_after=HedgePolicy(percentile=0.95)):
+            with wreq(Request("GET", "https://replicated.example.com/item/1")) as response:
+                ...
+        ```
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        max_samples: int = 200,
+        max_hedge_ratio: float = 0.1,
+        min_hedges: int = 10,
+        budget: Optional[RetryBudget] = None,
+        max_workers: int = 32,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if max_workers < 2:
+            raise ValueError("max_workers must be at least 2")
+        self.fixed_delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.budget = budget or RetryBudget(ratio=max_hedge_ratio, min_retries=min_hedges)
+        self._samples: Dict[str, Deque[float]] = {}
+        self._delays: Dict[str, Optional[float]] = {}
+        self._lock = threading.Lock()
+        self.max_workers = max_workers
+        self._workers = _Workers(max_workers)
+
+    def delay(self, key: str) -> Optional[float]:
+        """
+        Seconds to wait before hedging a request for `key`.
+
+        Returns:
+            Optional[float]: The delay, or None while too few latencies are known.
+        """
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        with self._lock:
+            return self._delays.get(key)
+
+    def record_latency(self, key: str, seconds: float) -> None:
+        """Record how long a successful attempt for `key` took."""
+        if self.fixed_delay is not None:
+            return
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.max_samples)
+            samples.append(seconds)
+            # re-sorting a few hundred floats is cheap, but not on every sample
+            if len(samples) >= self.min_samples and (
+                key not in self._delays or len(samples) % 10 == 0
+            ):
+                ordered = sorted(samples)
+                self._delays[key] = ordered[int(self.percentile * (len(ordered) - 1))]
+
+    def try_hedge(self) -> bool:
+        """Withdraw one hedge from the budget; False if it is exhausted."""
+        return self.budget.try_retry()
+
+    def try_spawn(self, fn: Callable[[], Response]) -> "Optional[Future[Response]]":
+        """
+        Run `fn` on the policy's threads.
+
+        Returns:
+            Optional[Future[Response]]: Its future, or None if every thread is busy.
+        """
+        return self._workers.try_spawn(fn)
+
+
+# shared by every `hedge_after=<seconds>` call so fixed delays are capped process-wide,
+# whatever the delay
+_fixed_budget = RetryBudget(ratio=0.1, min_retries=10)
+_fixed_workers = _Workers(32)
+
+
+def policy_for(hedge_after: Any) -> HedgePolicy:
+    """Turn a `hedge_after` argument (seconds or a policy) into a `HedgePolicy`."""
+    if isinstance(hedge_after, HedgePolicy):
+        return hedge_after
+    # fixed-delay policies keep no state of their own, so one is built per call
+    policy = HedgePolicy(delay=float(hedge_after), budget=_fixed_budget)
+    policy._workers = _fixed_workers
+    return policy
+
+
+def _discard(future: "Future[Response]") -> None:
+    if future.exception() is None:
+        future.result().close()
+
+
+def hedged_send(
+    policy: HedgePolicy,
+    key: str,
+    send: Callable[[PreparedRequest, Dict[str, Any]], Response],
+    request: PreparedRequest,
+    send_kwargs: Dict[str, Any],
+    hedge_kwargs: Callable[[], Dict[str, Any]],
+) -> Tuple[Response, bool]:
+    """
+    Send `request`, and a duplicate if the first attempt is slower than the policy allows.
+
+    The first successful answer wins; the other attempt is left to finish in the
+    background and its response is closed. If both fail, the first attempt's error is
+    raised.
+
+    Args:
+        policy (HedgePolicy): Decides the delay and caps the hedge rate.
+        key (str): Latency key, usually the host.
+        send (Callable[[PreparedRequest, Dict[str, Any]], Response]): Sends one attempt.
+        request (PreparedRequest): The request to send.
+        send_kwargs (Dict[str, Any]): Keyword arguments for the first attempt.
+        hedge_kwargs (Callable[[], Dict[str, Any]]): Builds keyword arguments for the
+            hedge, e.g. with another proxy.
+
+    Returns:
+        Tuple[Response, bool]: The winning response and whether it came from the hedge.
+    """
+    policy.budget.record_request()
+
+    def primary_send() -> Response:
+        started = time.perf_counter()
+        response = send(request, send_kwargs)
+        # fast errors would drag the learned delay down
+        if not default_is_failure(response, None):
+            policy.record_latency(key, time.perf_counter() - started)
+        return response
+
+    delay = policy.delay(key)
+    if delay is None:
+        return primary_send(), False
+
+    primary = policy.try_spawn(primary_send)
+    if primary is None:
+        return primary_send(), False  # no thread free: not worth queueing behind others
+    try:
+        return primary.result(timeout=delay), False
+    except FutureTimeoutError:
+        pass
+    if not policy.try_hedge():
+        return primary.result(), False
+
+    hedge_request = request.copy()
+    kwargs = hedge_kwargs()
+    hedge = policy.try_spawn(lambda: send(hedge_request, kwargs))
+    if hedge is None:
+        return primary.result(), False
+
+    winner: Optional["Future[Response]"] = None
+    for future in as_completed([primary, hedge]):
+        if future.exception() is None:
+            winner = future
+            break
+    if winner is None:
+        return primary.result(), False  # both failed: raises the first attempt's error
+
+    loser = hedge if winner is primary else primary
+    loser.add_done_callback(_discard)
+    return winner.result(), winner is hedge
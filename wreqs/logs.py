@@ -0,0 +1,255 @@
+import atexit
+import copy
+import itertools
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+from requests import PreparedRequest, Request, Response
+
+from wreqs.breaker import default_is_failure, host_key
+from wreqs.codec import get_json_codec
+
+
+class LogSettings(NamedTuple):
+    """
+    How requests are logged; set through `configure_logger`.
+
+    Attributes:
+        structured (bool): Log each request as one summary record with `extra` fields;
+            the step-by-step messages move to DEBUG.
+        sample_successes (int): Log the step messages and summary of 1 in this many
+            requests. Failures and retries are always logged.
+    """
+
+    structured: bool = False
+    sample_successes: int = 1
+
+
+_settings = LogSettings()
+_successes = itertools.count()
+
+
+def set_log_settings(settings: LogSettings) -> None:
+    global _settings
+    if settings.sample_successes < 1:
+        raise ValueError("sample_successes must be at least 1")
+    _settings = settings
+
+
+class RequestLog:
+    """
+    Logging for a single request, shared by `RequestContext` and `AsyncRequestContext`.
+
+    Step messages go out at INFO, or DEBUG with structured logging, and only for
+    requests picked by `sample_successes`. Retries, failures and the summary carry the
+    request fields as `extra` attributes on the record. The summary of a successful
+    request is only written with structured logging, where it replaces the steps.
+
+    Args:
+        logger (logging.Logger): The logger to write to.
+        request (Union[Request, PreparedRequest]): The request being made.
+    """
+
+    __slots__ = (
+        "logger",
+        "request",
+        "method",
+        "step_level",
+        "started",
+        "sampled",
+        "_request_id",
+        "_host",
+    )
+
+    def __init__(self, logger: logging.Logger, request: Union[Request, PreparedRequest]) -> None:
+        self.logger = logger
+        self.request = request
+        self.method = (request.method or "GET").upper()
+        self.step_level = logging.DEBUG if _settings.structured else logging.INFO
+        self.started = time.perf_counter()
+        # decided up front, so a request that is not sampled logs none of its steps
+        rate = _settings.sample_successes
+        self.sampled = rate == 1 or next(_successes) % rate == 0
+        # the id and host are only worked out once something is logged
+        self._request_id: Optional[str] = None
+        self._host: Optional[str] = None
+
+    @property
+    def request_id(self) -> str:
+        if self._request_id is None:
+            self._request_id = os.urandom(6).hex()
+        return self._request_id
+
+    @property
+    def host(self) -> str:
+        if self._host is None:
+            self._host = host_key(self.request)
+        return self._host
+
+    def enabled(self) -> bool:
+        """True if step messages of this request are written."""
+        return self.sampled and self.logger.isEnabledFor(self.step_level)
+
+    def step(self, msg: str, *args: Any) -> None:
+        if self.sampled:
+            self.logger.log(self.step_level, msg, *args)
+
+    def fields(
+        self,
+        attempt: int,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+    ) -> Dict[str, Any]:
+        return {
+            "request_id": self.request_id,
+            "method": self.method,
+            "host": self.host,
+            "status": status,
+            "attempt": attempt,
+            "elapsed": round(time.perf_counter() - self.started, 6),
+            "error": type(error).__name__ if error is not None else None,
+        }
+
+    def retry(self, attempt: int, max_retries: int, response: Response, request_str: Any) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                "Retry attempt %d/%d: %s",
+                attempt,
+                max_retries,
+                request_str,
+                extra=self.fields(attempt, response.status_code),
+            )
+
+    def finished(
+        self,
+        attempts: int,
+        response: Optional[Response],
+        exception: Optional[BaseException],
+    ) -> None:
+        """Log the summary record: always on failure, else with structured logging only."""
+        failed = exception is not None or default_is_failure(response, None)
+        if not failed and not _settings.structured:
+            return  # the step messages already tell the story
+        level = logging.WARNING if failed else logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
+        if not failed and attempts <= 1 and not self.sampled:
+            return
+        status = response.status_code if response is not None else None
+        self.logger.log(
+            level,
+            "%s %s -> %s",
+            self.method,
+            self.host,
+            status if status is not None else type(exception).__name__,
+            extra=self.fields(attempts, status, exception),
+        )
+
+
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+def _json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+
+    Every record has `time`, `level`, `logger` and `message`; any `extra` fields (such
+    as the request fields wreqs adds) are included as top-level keys. Serialized with
+    the configured JSON codec.
+
+    Example:
+        ```python
+        import logging
+        from wreqs import StructuredFormatter
+
+        handler = logging.StreamHandler()
+        handler.setFormatter(StructuredFormatter())
+        ```
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        doc: Dict[str, Any] = {
+            "time": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                doc[key] = _json_safe(value)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            doc["exc_info"] = record.exc_text
+        return get_json_codec().dumps(doc)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """A QueueHandler that drops records, rather than blocking, when the queue is full."""
+
+    def __init__(self, log_queue: "queue.Queue[Any]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # only the message is rendered here, while lazy arguments are still valid;
+        # formatting and I/O happen on the listener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+
+
+def stop_async_logging() -> None:
+    """Flush and stop the background log writer started by `configure_logger`, if any."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def queued_handler(handler: logging.Handler, queue_size: int = 10000) -> logging.Handler:
+    """
+    Wrap `handler` so records are written by a background thread.
+
+    Args:
+        handler (logging.Handler): The handler doing the actual I/O.
+        queue_size (int, optional): Records buffered before new ones are dropped
+            (counted in the returned handler's `dropped`). Defaults to 10000.
+
+    Returns:
+        logging.Handler: A handler that only enqueues records.
+    """
+    global _listener
+    stop_async_logging()
+    log_queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    return _DroppingQueueHandler(log_queue)
+
+
+atexit.register(stop_async_logging)
@@ -0,0 +1,339 @@
+import threading
+import weakref
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Any, DefaultDict, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# set by schedulers such as `wreq_many` when a request is queued, so the next
+# RequestContext created in that context can report how long it waited
+_enqueued_at: ContextVar[Optional[float]] = ContextVar("_enqueued_at", default=None)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class AttemptInfo(NamedTuple):
+    """
+    A single network attempt, reported to `MetricsHook.on_attempt`.
+
+    Attributes:
+        method (str): HTTP method.
+        host (str): `host[:port]` of the request URL.
+        status (Optional[int]): Response status, None if the attempt raised.
+        error (Optional[str]): Exception class name if the attempt raised.
+        attempt (int): 1 for the first attempt, 2 for the first retry, ...
+        retry_reason (Optional[str]): Why this attempt is a retry, e.g. "status_503";
+            None for the first attempt.
+        bytes_out (int): Size of the request body as sent, i.e. after compression.
+        bytes_in (int): Size of the response body (Content-Length for unread streams).
+        send_time (float): Seconds spent in `Session.send`.
+        ttfb (Optional[float]): Seconds until the response headers arrived, from
+            `response.elapsed`.
+        wire_bytes_in (Optional[int]): Bytes of the response body read from the network,
+            before `Content-Encoding` decompression; None if unknown (e.g. unread streams).
+    """
+
+    method: str
+    host: str
+    status: Optional[int]
+    error: Optional[str]
+    attempt: int
+    retry_reason: Optional[str]
+    bytes_out: int
+    bytes_in: int
+    send_time: float
+    ttfb: Optional[float]
+    wire_bytes_in: Optional[int] = None
+
+
+class RequestInfo(NamedTuple):
+    """
+    A logical request, retries included, reported to `MetricsHook.on_request`.
+
+    Attributes:
+        method (str): HTTP method.
+        host (str): `host[:port]` of the request URL.
+        status (Optional[int]): Final response status, None if the request raised.
+        error (Optional[str]): Exception class name if the request raised.
+        attempts (int): Network attempts made; 0 when served from a cache or shared.
+        source (str): "network", "cache" (served by `ResponseCache`) or "shared"
+            (coalesced by `SingleFlight`).
+        queue_wait (float): Seconds from being queued (e.g. by `wreq_many`) or created
+            until the first attempt started.
+        duration (float): Seconds from being queued or created until completion,
+            including backoff sleeps and retries.
+        bytes_in (int): Response body bytes received over all attempts, after
+            decompression; 0 when served from a cache or shared.
+        wire_bytes_in (Optional[int]): Response body bytes read from the network over
+            all attempts, before decompression; None if no attempt could tell.
+    """
+
+    method: str
+    host: str
+    status: Optional[int]
+    error: Optional[str]
+    attempts: int
+    source: str
+    queue_wait: float
+    duration: float
+    bytes_in: int = 0
+    wire_bytes_in: Optional[int] = None
+
+
+class MetricsHook:
+    """
+    Receives per-attempt and per-request measurements from `wreq`.
+
+    Subclass and override either method to forward measurements to your own metrics
+    system. Hooks run synchronously on the request path, so they should be cheap;
+    exceptions they raise are logged and otherwise ignored.
+    """
+
+    def on_attempt(self, info: AttemptInfo) -> None:
+        """Called after every network attempt, successful or not."""
+
+    def on_request(self, info: RequestInfo) -> None:
+        """Called once per `wreq` call, after its last attempt."""
+
+
+class _Metric(NamedTuple):
+    kind: str
+    help: str
+    labels: Tuple[str, ...]
+
+
+_METRICS: Dict[str, _Metric] = {
+    "attempts_total": _Metric(
+        "counter", "Network attempts.", ("method", "host", "status")
+    ),
+    "retries_total": _Metric(
+        "counter", "Retry attempts by reason.", ("method", "host", "reason")
+    ),
+    "requests_total": _Metric(
+        "counter", "Logical requests, retries included.", ("method", "host", "status", "source")
+    ),
+    "sent_bytes_total": _Metric("counter", "Request body bytes sent.", ("method", "host")),
+    "received_bytes_total": _Metric(
+        "counter", "Response body bytes received.", ("method", "host")
+    ),
+    "received_wire_bytes_total": _Metric(
+        "counter", "Response body bytes received before decompression.", ("method", "host")
+    ),
+    "attempt_duration_seconds": _Metric(
+        "histogram", "Time spent sending a single attempt.", ("method", "host")
+    ),
+    "ttfb_seconds": _Metric(
+        "histogram", "Time until response headers arrived.", ("method", "host")
+    ),
+    "queue_wait_seconds": _Metric(
+        "histogram", "Time between queueing a request and its first attempt.", ("method", "host")
+    ),
+    "request_duration_seconds": _Metric(
+        "histogram", "Total request time including retries and backoff.", ("method", "host")
+    ),
+}
+
+_SeriesKey = Tuple[str, Tuple[str, ...]]
+
+
+class _Shard:
+    """Per-thread storage; only its owning thread writes to it."""
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self) -> None:
+        self.counters: DefaultDict[_SeriesKey, float] = defaultdict(float)
+        # bucket counts (non-cumulative), then +Inf count, then sum
+        self.histograms: Dict[_SeriesKey, List[float]] = {}
+
+    def merge(self, other: "_Shard") -> None:
+        """Add `other`'s values to this shard."""
+        for key, value in list(other.counters.items()):
+            self.counters[key] += value
+        for key, values in list(other.histograms.items()):
+            total = self.histograms.setdefault(key, [0.0] * len(values))
+            for i, v in enumerate(list(values)):
+                total[i] += v
+
+
+class _ShardOwner:
+    """Lives in a thread's local storage, so it is dropped when the thread exits."""
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard: _Shard) -> None:
+        self.shard = shard
+
+
+def _retire(registry_ref: "weakref.ref[MetricsRegistry]", shard: _Shard) -> None:
+    registry = registry_ref()
+    if registry is not None:
+        registry._retire(shard)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _status_label(status: Optional[int], error: Optional[str]) -> str:
+    return str(status) if status is not None else (error or "error")
+
+
+class MetricsRegistry(MetricsHook):
+    """
+    In-process metrics store with Prometheus text exposition.
+
+    Keeps counters and fixed-bucket histograms per method and host. Each thread
+    writes to its own shard without locking. Shards are only merged when
+    `to_prometheus` or `snapshot` reads them, so recording adds no contention
+    between worker threads. When a thread exits, its shard is folded into a single
+    shard kept for finished threads, so short-lived threads do not pile up.
+
+    Exposed series, prefixed with `namespace`:
+        attempts_total, retries_total, requests_total, sent_bytes_total,
+        received_bytes_total, received_wire_bytes_total (counters);
+        attempt_duration_seconds, ttfb_seconds, queue_wait_seconds,
+        request_duration_seconds (histograms).
+
+    Args:
+        buckets (Sequence[float], optional): Histogram upper bounds in seconds.
+            Defaults to Prometheus' default buckets (5ms to 10s).
+        namespace (str, optional): Prefix for metric names. Defaults to "wreqs".
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, MetricsRegistry
+
+        metrics = MetricsRegistry()
+
+        with wreqs_session(metrics=metrics):
+            with wreq(Request("GET", "https://api.example.com/data")) as response:
+                ...
+
+        print(metrics.to_prometheus())
+        ```
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "wreqs"
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self._shards: List[_Shard] = []
+        self._retired = _Shard()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            owner = self._local.owner = _ShardOwner(_Shard())
+            with self._lock:
+                self._shards.append(owner.shard)
+            # the thread-local value is released when the thread exits
+            finalizer = weakref.finalize(owner, _retire, weakref.ref(self), owner.shard)
+            finalizer.atexit = False
+        return owner.shard
+
+    def _retire(self, shard: _Shard) -> None:
+        with self._lock:
+            self._shards.remove(shard)
+            self._retired.merge(shard)
+
+    def inc(self, name: str, labels: Tuple[str, ...], amount: float = 1.0) -> None:
+        """Add `amount` to the counter `name` for the given label values."""
+        self._shard().counters[(name, labels)] += amount
+
+    def observe(self, name: str, labels: Tuple[str, ...], value: float) -> None:
+        """Record `value` in the histogram `name` for the given label values."""
+        histograms = self._shard().histograms
+        key = (name, labels)
+        series = histograms.get(key)
+        if series is None:
+            series = histograms[key] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def on_attempt(self, info: AttemptInfo) -> None:
+        labels = (info.method, info.host)
+        self.inc("attempts_total", labels + (_status_label(info.status, info.error),))
+        if info.retry_reason is not None:
+            self.inc("retries_total", labels + (info.retry_reason,))
+        if info.bytes_out:
+            self.inc("sent_bytes_total", labels, info.bytes_out)
+        if info.bytes_in:
+            self.inc("received_bytes_total", labels, info.bytes_in)
+        if info.wire_bytes_in:
+            self.inc("received_wire_bytes_total", labels, info.wire_bytes_in)
+        self.observe("attempt_duration_seconds", labels, info.send_time)
+        if info.ttfb is not None:
+            self.observe("ttfb_seconds", labels, info.ttfb)
+
+    def on_request(self, info: RequestInfo) -> None:
+        labels = (info.method, info.host)
+        status = _status_label(info.status, info.error)
+        self.inc("requests_total", labels + (status, info.source))
+        self.observe("queue_wait_seconds", labels, info.queue_wait)
+        self.observe("request_duration_seconds", labels, info.duration)
+
+    def snapshot(self) -> Dict[str, Dict[Tuple[str, ...], Any]]:
+        """
+        Merge every thread's shard.
+
+        Returns:
+            Dict[str, Dict[Tuple[str, ...], Any]]: For each metric name, its value per
+                label tuple: a float for counters, and for histograms a
+                `(cumulative bucket counts, count, sum)` tuple.
+        """
+        total = _Shard()
+        with self._lock:
+            total.merge(self._retired)
+            for shard in self._shards:
+                total.merge(shard)
+        merged: Dict[str, Dict[Tuple[str, ...], Any]] = defaultdict(dict)
+        for (name, labels), value in total.counters.items():
+            merged[name][labels] = value
+        for (name, labels), values in total.histograms.items():
+            cumulative, running = [], 0.0
+            for count in values[:-1]:
+                running += count
+                cumulative.append(running)
+            merged[name][labels] = (tuple(cumulative), running, values[-1])
+        return dict(merged)
+
+    def to_prometheus(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format (version 0.0.4).
+
+        Returns:
+            str: The exposition, ready to be served from a `/metrics` endpoint.
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        bounds = [repr(float(b)) for b in self.buckets] + ["+Inf"]
+        for name, metric in _METRICS.items():
+            series = snapshot.get(name)
+            if not series:
+                continue
+            full_name = f"{self.namespace}_{name}"
+            lines.append(f"# HELP {full_name} {metric.help}")
+            lines.append(f"# TYPE {full_name} {metric.kind}")
+            for labels, value in sorted(series.items()):
+                label_str = ",".join(
+                    f'{k}="{_escape(v)}"' for k, v in zip(metric.labels, labels)
+                )
+                if metric.kind == "counter":
+                    lines.append(f"{full_name}{{{label_str}}} {_number(value)}")
+                    continue
+                cumulative, count, total = value
+                for bound, bucket in zip(bounds, cumulative):
+                    lines.append(
+                        f'{full_name}_bucket{{{label_str},le="{bound}"}} {_number(bucket)}'
+                    )
+                lines.append(f"{full_name}_sum{{{label_str}}} {_number(total)}")
+                lines.append(f"{full_name}_count{{{label_str}}} {_number(count)}")
+        return "\n".join(lines) + "\n"
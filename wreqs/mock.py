@@ -0,0 +1,436 @@
+import base64
+import http.client
+import json
+import re
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
+
+import requests.exceptions
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from wreqs.codec import get_json_codec
+from wreqs.response import build_response
+
+BodyType = Union[bytes, str, Dict[str, Any], List[Any], None]
+LatencyType = Union[float, Callable[[], float]]
+ErrorType = Union[BaseException, Type[BaseException]]
+
+
+class MockResponse(NamedTuple):
+    """
+    A scripted outcome of one request sent through a `MockAdapter`.
+
+    Attributes:
+        status (int): Status code. Defaults to 200.
+        body (BodyType): Body; dicts and lists are sent as JSON, str as UTF-8 text.
+            Defaults to an empty body.
+        headers (Optional[Mapping[str, str]]): Response headers. Defaults to None.
+        latency (LatencyType): Seconds before the response arrives, or a function
+            returning them (e.g. drawing from a seeded `random.Random`). A latency past
+            the read timeout raises `ReadTimeout` instead. Defaults to 0.
+        error (Optional[ErrorType]): Exception (instance or class) to raise instead of
+            responding, e.g. `requests.ConnectionError`. Defaults to None.
+    """
+
+    status: int = 200
+    body: BodyType = b""
+    headers: Optional[Mapping[str, str]] = None
+    latency: LatencyType = 0.0
+    error: Optional[ErrorType] = None
+
+
+ScriptType = Union[MockResponse, int, ErrorType]
+
+
+def _as_mock(item: ScriptType) -> MockResponse:
+    if isinstance(item, MockResponse):
+        return item
+    if isinstance(item, int):
+        return MockResponse(status=item)
+    if isinstance(item, BaseException) or (
+        isinstance(item, type) and issubclass(item, BaseException)
+    ):
+        return MockResponse(error=item)
+    raise TypeError(f"Cannot script a response from {item!r}")
+
+
+def _encode_body(
+    body: BodyType, headers: Optional[Mapping[str, str]]
+) -> Tuple[bytes, CaseInsensitiveDict]:
+    result: CaseInsensitiveDict = CaseInsensitiveDict(headers or {})
+    if isinstance(body, (dict, list)):
+        content = get_json_codec().dumps(body).encode()
+        result.setdefault("Content-Type", "application/json")
+    elif isinstance(body, str):
+        content = body.encode()
+        result.setdefault("Content-Type", "text/plain; charset=utf-8")
+    else:
+        content = body or b""
+    result.setdefault("Content-Length", str(len(content)))
+    return content, result
+
+
+class _Scripted(NamedTuple):
+    mock: MockResponse
+    content: bytes
+    headers: CaseInsensitiveDict
+    encoding: Optional[str]
+
+
+class _Route:
+    __slots__ = ("method", "url", "script", "cycle", "index", "calls")
+
+    def __init__(
+        self,
+        method: Optional[str],
+        url: Union[str, Pattern[str]],
+        script: List[MockResponse],
+        cycle: bool,
+    ) -> None:
+        self.method = method.upper() if method else None
+        self.url = url
+        self.script: List[_Scripted] = []
+        for mock in script:
+            # bodies are encoded once, however many times they are served
+            content, headers = _encode_body(mock.body, mock.headers)
+            self.script.append(
+                _Scripted(mock, content, headers, get_encoding_from_headers(headers))
+            )
+        self.cycle = cycle
+        self.index = 0
+        self.calls = 0
+
+    def matches(self, method: str, url: str) -> bool:
+        if self.method is not None and self.method != method:
+            return False
+        if isinstance(self.url, str):
+            return self.url == (url if "?" in self.url else url.split("?", 1)[0])
+        return self.url.search(url) is not None
+
+    def next(self) -> _Scripted:
+        scripted = self.script[self.index]
+        self.calls += 1
+        if self.index + 1 < len(self.script):
+            self.index += 1
+        elif self.cycle:
+            self.index = 0
+        return scripted
+
+
+def _read_timeout(timeout: Any) -> Optional[float]:
+    if isinstance(timeout, tuple):
+        return timeout[1]
+    return timeout
+
+
+def _raise(error: ErrorType, request: PreparedRequest) -> None:
+    if isinstance(error, BaseException):
+        raise error
+    if issubclass(error, requests.exceptions.RequestException):
+        raise error(f"Mocked {error.__name__} for {request.url}", request=request)
+    raise error(f"Mocked {error.__name__} for {request.url}")
+
+
+class _Transport(BaseAdapter):
+    def mount(
+        self, session: Session, prefixes: Tuple[str, ...] = ("http://", "https://")
+    ) -> Session:
+        """
+        Route every request of `session` for the given URL prefixes through this adapter.
+
+        Args:
+            session (Session): The session to mount on, e.g. the one yielded by
+                `wreqs_session`.
+            prefixes (Tuple[str, ...], optional): URL prefixes to take over.
+                Defaults to ("http://", "https://").
+
+        Returns:
+            Session: The same session.
+        """
+        for prefix in prefixes:
+            session.mount(prefix, self)
+        return session
+
+
+class MockAdapter(_Transport):
+    """
+    Transport adapter that answers requests in process from scripted responses.
+
+    Routes are matched in the order they were added. Each route serves its script in
+    order and then keeps repeating the last entry (or starts over with `cycle=True`).
+    Nothing touches the network, so retry, hedging and concurrency behavior can be
+    exercised at high volume and with repeatable timing.
+
+    Args:
+        default (Optional[ScriptType], optional): Served when no route matches. If None,
+            unmatched requests raise `requests.ConnectionError`. Defaults to None.
+        sleep (Callable[[float], None], optional): How latency is spent. Pass a no-op,
+            or a function advancing a simulated clock, to skip the waits. Defaults to
+            `time.sleep`.
+        history (int, optional): Number of most recent requests kept in `history`.
+            Defaults to 1000.
+
+    Example:
+        ```python
+        import requests
+        from requests import Request
+        from wreqs import MockAdapter, MockResponse, wreq, wreqs_session
+
+        mock = MockAdapter()
+        mock.add("GET", "https://api.example.com/users/1", 503, 503, MockResponse(200, {"id": 1}))
+        mock.add("POST", "https://api.example.com/events", requests.ConnectionError, 202)
+
+        with wreqs_session() as session:
+            mock.mount(session)
+            req = Request("GET", "https://api.example.com/users/1")
+            with wreq(req, check_retry=lambda r: r.status_code >= 500) as response:
+                assert response.json() == {"id": 1}
+        ```
+    """
+
+    def __init__(
+        self,
+        default: Optional[ScriptType] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        history: int = 1000,
+    ) -> None:
+        super().__init__()
+        self.routes: List[_Route] = []
+        self.default: Optional[_Route] = None
+        if default is not None:
+            self.default = _Route(None, "", [_as_mock(default)], False)
+        self.sleep = sleep
+        self.history: Deque[PreparedRequest] = deque(maxlen=history)
+        self.call_count = 0
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        method: Optional[str],
+        url: Union[str, Pattern[str]],
+        *responses: ScriptType,
+        cycle: bool = False,
+    ) -> "MockAdapter":
+        """
+        Script the responses for matching requests.
+
+        Args:
+            method (Optional[str]): HTTP method to match, or None for any.
+            url (Union[str, Pattern[str]]): URL to match exactly (the query string is
+                ignored unless `url` has one), or a compiled regex searched in the URL.
+            *responses (ScriptType): Responses served in order: `MockResponse`s, bare
+                status codes, or exceptions to raise. Defaults to a single 200.
+            cycle (bool, optional): Start over after the last response instead of
+                repeating it. Defaults to False.
+
+        Returns:
+            MockAdapter: This adapter, for chaining.
+        """
+        script = [_as_mock(item) for item in responses] or [MockResponse()]
+        with self._lock:
+            self.routes.append(_Route(method, url, script, cycle))
+        return self
+
+    def calls(self, method: Optional[str] = None, url: Optional[str] = None) -> int:
+        """Number of requests served by the routes matching `method` and `url` (all if None)."""
+        with self._lock:
+            return sum(
+                route.calls
+                for route in self.routes
+                if (method is None or route.method in (None, method.upper()))
+                and (url is None or route.url == url)
+            )
+
+    def _next(self, request: PreparedRequest) -> _Scripted:
+        method = (request.method or "GET").upper()
+        url = request.url or ""
+        with self._lock:
+            self.call_count += 1
+            self.history.append(request)
+            for route in self.routes:
+                if route.matches(method, url):
+                    return route.next()
+            if self.default is not None:
+                return self.default.next()
+        raise requests.exceptions.ConnectionError(
+            f"No mock response for {method} {url}", request=request
+        )
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> Response:
+        scripted = self._next(request)
+        mock = scripted.mock
+        latency = mock.latency() if callable(mock.latency) else mock.latency
+        read_timeout = _read_timeout(timeout)
+        if read_timeout is not None and latency > read_timeout:
+            self.sleep(read_timeout)
+            raise requests.exceptions.ReadTimeout(
+                f"Mocked read timeout after {read_timeout}s for {request.url}", request=request
+            )
+        if latency > 0:
+            self.sleep(latency)
+        if mock.error is not None:
+            _raise(mock.error, request)
+
+        return build_response(
+            mock.status,
+            scripted.content,
+            scripted.headers,
+            request.url or "",
+            reason=http.client.responses.get(mock.status),
+            encoding=scripted.encoding,
+            request=request,
+        )
+
+    def close(self) -> None:
+        pass
+
+    @classmethod
+    def from_cassette(
+        cls, path: str, replay_latency: bool = False, **kwargs: Any
+    ) -> "MockAdapter":
+        """
+        Build an adapter that replays a cassette written by `RecordingAdapter`.
+
+        Requests with the same method and URL are answered with the recorded
+        responses in the order they were recorded, repeating the last one.
+
+        Args:
+            path (str): Cassette file.
+            replay_latency (bool, optional): Wait as long as the recorded requests took.
+                Defaults to False (answer immediately).
+            **kwargs: Passed to `MockAdapter`.
+
+        Returns:
+            MockAdapter: The replaying adapter.
+        """
+        with open(path, encoding="utf-8") as f:
+            cassette = json.load(f)
+
+        scripts: Dict[Tuple[str, str], List[MockResponse]] = {}
+        for entry in cassette["interactions"]:
+            if "body_base64" in entry:
+                body: bytes = base64.b64decode(entry["body_base64"])
+            else:
+                body = entry.get("body", "").encode()
+            error = None
+            if entry.get("error"):
+                error = getattr(
+                    requests.exceptions, entry["error"], requests.exceptions.ConnectionError
+                )
+            mock = MockResponse(
+                status=entry.get("status") or 0,
+                body=body,
+                headers=entry.get("headers"),
+                latency=entry.get("latency", 0.0) if replay_latency else 0.0,
+                error=error,
+            )
+            scripts.setdefault((entry["method"], entry["url"]), []).append(mock)
+
+        adapter = cls(**kwargs)
+        for (method, url), script in scripts.items():
+            # exact match, so a recorded `/items` does not answer `/items?page=2`
+            adapter.add(method, re.compile("^" + re.escape(url) + r"\Z"), *script)
+        return adapter
+
+
+# describe the decoded body, which is what the cassette stores
+_UNRECORDED_HEADERS = frozenset(["content-encoding", "content-length", "transfer-encoding"])
+
+
+class RecordingAdapter(_Transport):
+    """
+    Transport adapter that passes requests through and records them to a cassette.
+
+    The cassette is a JSON file that `MockAdapter.from_cassette` replays. Bodies are
+    stored decoded: as text when they are UTF-8, base64 otherwise. Connection errors
+    and timeouts are recorded by exception name.
+
+    Args:
+        path (str): Cassette file written by `save` and on `close`.
+        adapter (Optional[BaseAdapter], optional): The adapter doing the real work.
+            Defaults to a new `HTTPAdapter`.
+
+    Example:
+        ```python
+        from wreqs import RecordingAdapter, wreqs_session
+
+        recorder = RecordingAdapter("cassettes/users.json")
+        with wreqs_session() as session:
+            recorder.mount(session)
+            run_workload()
+        recorder.save()
+        ```
+
+    Notes:
+        - Response bodies are read in full while recording, including streamed ones.
+        - Request bodies and headers are not recorded; credentials in URLs are.
+    """
+
+    def __init__(self, path: str, adapter: Optional[BaseAdapter] = None) -> None:
+        super().__init__()
+        self.path = path
+        self.adapter = adapter or HTTPAdapter()
+        self.interactions: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        entry: Dict[str, Any] = {"method": (request.method or "GET").upper(), "url": request.url}
+        started = time.perf_counter()
+        try:
+            response = self.adapter.send(request, **kwargs)
+            content = response.content
+        except requests.exceptions.RequestException as e:
+            entry.update(error=type(e).__name__, latency=round(time.perf_counter() - started, 6))
+            with self._lock:
+                self.interactions.append(entry)
+            raise
+
+        entry["status"] = response.status_code
+        entry["headers"] = {
+            k: v for k, v in response.headers.items() if k.lower() not in _UNRECORDED_HEADERS
+        }
+        entry["latency"] = round(time.perf_counter() - started, 6)
+        try:
+            entry["body"] = (content or b"").decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_base64"] = base64.b64encode(content).decode("ascii")
+        with self._lock:
+            self.interactions.append(entry)
+        return response
+
+    def save(self) -> None:
+        """Write the interactions recorded so far to the cassette file."""
+        with self._lock:
+            cassette = {"version": 1, "interactions": list(self.interactions)}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(cassette, f, indent=2)
+
+    def close(self) -> None:
+        self.save()
+        self.adapter.close()
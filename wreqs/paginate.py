@@ -0,0 +1,380 @@
+import contextvars
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from requests import PreparedRequest, Request, Response, Session
+
+from wreqs.body import SpilledResponse, detach_body
+from wreqs.context import _wreqs_session, wreq
+
+ItemsType = Optional[Union[str, Callable[[Response], Iterable[Any]]]]
+
+
+def _json_path(doc: Any, path: str) -> Any:
+    """Follow a dotted path ("data.items") into a decoded JSON document."""
+    for part in path.split(".") if path else ():
+        if not isinstance(doc, dict):
+            return None
+        doc = doc.get(part)
+    return doc
+
+
+def _page_items(response: Response, items: ItemsType) -> Iterable[Any]:
+    if callable(items):
+        return items(response)
+    found = _json_path(response.json(), items or "")
+    return found if isinstance(found, list) else []
+
+
+def with_params(request: PreparedRequest, **params: Any) -> PreparedRequest:
+    """
+    Copy a prepared request, replacing (or adding) query parameters.
+
+    Args:
+        request (PreparedRequest): The request to copy.
+        **params: Parameters to set; None removes a parameter.
+
+    Returns:
+        PreparedRequest: The new request.
+    """
+    scheme, netloc, path, query, fragment = urlsplit(request.url or "")
+    pairs = []
+    pending = dict(params)
+    for key, value in parse_qsl(query, keep_blank_values=True):
+        if key not in params:
+            pairs.append((key, value))
+        elif key in pending:
+            # replaced in place, so the URL only changes where it has to
+            new = pending.pop(key)
+            if new is not None:
+                pairs.append((key, str(new)))
+    pairs.extend((k, str(v)) for k, v in pending.items() if v is not None)
+    result = request.copy()
+    result.url = urlunsplit((scheme, netloc, path, urlencode(pairs), fragment))
+    return result
+
+
+class Paginator:
+    """
+    Strategy that finds the request for the next page of a paginated API.
+
+    Subclass and override `next_request` (and optionally `start`) for APIs that the
+    built-in strategies do not cover; a plain function with the signature of
+    `next_request` works too.
+    """
+
+    def start(self, request: PreparedRequest) -> PreparedRequest:
+        """Adjust the first request, e.g. to add paging parameters. Defaults to no change."""
+        return request
+
+    def next_request(
+        self, response: Response, request: PreparedRequest
+    ) -> Optional[PreparedRequest]:
+        """
+        Build the request for the page after `response`.
+
+        Args:
+            response (Response): The page just fetched.
+            request (PreparedRequest): The request that fetched it.
+
+        Returns:
+            Optional[PreparedRequest]: The next request, or None on the last page.
+        """
+        raise NotImplementedError
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _crosses_origin(old_url: str, new_url: str) -> bool:
+    """True if credentials for `old_url` must not be sent to `new_url`."""
+    old, new = urlsplit(old_url), urlsplit(new_url)
+    if old.hostname != new.hostname:
+        return True
+    old_port = old.port or _DEFAULT_PORTS.get(old.scheme)
+    new_port = new.port or _DEFAULT_PORTS.get(new.scheme)
+    # like requests on redirects, an upgrade from http to https on default ports is fine
+    if (old.scheme, old_port, new.scheme, new_port) == ("http", 80, "https", 443):
+        return False
+    return old.scheme != new.scheme or old_port != new_port
+
+
+class LinkHeaderPaginator(Paginator):
+    """
+    Follows `Link: <...>; rel="next"` headers (RFC 8288), as used by GitHub and others.
+
+    A link to another host, scheme or port is followed without the `Authorization`
+    and `Cookie` headers, as `requests` does on redirects.
+    """
+
+    def __init__(self, rel: str = "next") -> None:
+        self.rel = rel
+
+    def next_request(
+        self, response: Response, request: PreparedRequest
+    ) -> Optional[PreparedRequest]:
+        link = response.links.get(self.rel, {}).get("url")
+        if not link:
+            return None
+        result = request.copy()
+        result.url = urljoin(response.url or request.url or "", link)
+        if _crosses_origin(request.url or "", result.url):
+            result.headers.pop("Authorization", None)
+            result.headers.pop("Cookie", None)
+        return result
+
+
+class CursorPaginator(Paginator):
+    """
+    Passes a cursor from each page's JSON body as a query parameter of the next.
+
+    Args:
+        cursor (Union[str, Callable[[Response], Optional[str]]]): Dotted path of the
+            cursor in the body (e.g. "meta.next_cursor"), or a function returning it.
+        param (str, optional): Query parameter the cursor is sent in. Defaults to "cursor".
+    """
+
+    def __init__(
+        self,
+        cursor: Union[str, Callable[[Response], Optional[str]]],
+        param: str = "cursor",
+    ) -> None:
+        self.cursor = cursor
+        self.param = param
+
+    def next_request(
+        self, response: Response, request: PreparedRequest
+    ) -> Optional[PreparedRequest]:
+        if callable(self.cursor):
+            value = self.cursor(response)
+        else:
+            value = _json_path(response.json(), self.cursor)
+        if value in (None, ""):
+            return None
+        return with_params(request, **{self.param: value})
+
+
+class OffsetPaginator(Paginator):
+    """
+    Walks `offset`/`limit` pages until one comes back with fewer than `limit` items.
+
+    Args:
+        limit (int): Page size to request.
+        items (ItemsType, optional): Dotted path of the item list in the body, or a
+            function returning the items; used to count them. Defaults to the body itself.
+        offset_param (str, optional): Offset query parameter. Defaults to "offset".
+        limit_param (str, optional): Limit query parameter. Defaults to "limit".
+        start_offset (int, optional): Offset of the first page. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        items: ItemsType = None,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        start_offset: int = 0,
+    ) -> None:
+        self.limit = limit
+        self.items = items
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.start_offset = start_offset
+
+    def start(self, request: PreparedRequest) -> PreparedRequest:
+        return with_params(
+            request, **{self.offset_param: self.start_offset, self.limit_param: self.limit}
+        )
+
+    def next_request(
+        self, response: Response, request: PreparedRequest
+    ) -> Optional[PreparedRequest]:
+        count = len(list(_page_items(response, self.items)))
+        if count < self.limit:
+            return None
+        query = dict(parse_qsl(urlsplit(request.url or "").query))
+        offset = int(query.get(self.offset_param, self.start_offset)) + count
+        return with_params(request, **{self.offset_param: offset})
+
+
+NextPageType = Union[
+    Paginator, Callable[[Response, PreparedRequest], Optional[PreparedRequest]]
+]
+
+
+def _pages(
+    request: PreparedRequest,
+    next_page: Callable[[Response, PreparedRequest], Optional[PreparedRequest]],
+    session: Session,
+    max_pages: Optional[int],
+    kwargs: Any,
+) -> Iterator[Response]:
+    current: Optional[PreparedRequest] = request
+    fetched = 0
+    while current is not None and (max_pages is None or fetched < max_pages):
+        with wreq(current, session=session, **kwargs) as response:
+            # pages are yielded after the context exits, and may be prefetched
+            detach_body(response)
+        fetched += 1
+        following = next_page(response, current)
+        if following is not None and following.url == current.url:
+            following = None  # a server pointing at the same page again would loop forever
+        yield response
+        current = following
+
+
+class _Failed:
+    __slots__ = ("exception",)
+
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+_DONE = object()
+
+
+def _prefetched(pages: Iterator[Response], prefetch: int) -> Iterator[Response]:
+    """Run `pages` on a worker thread, keeping up to `prefetch` pages ready."""
+    ready: "queue.Queue[Any]" = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put(page):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_Failed(e))
+        finally:
+            pages.close()  # type: ignore[attr-defined]
+
+    worker = threading.Thread(
+        target=contextvars.copy_context().run, args=(produce,), daemon=True, name="wreqs-paginate"
+    )
+    worker.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failed):
+                raise item.exception
+            yield item
+    finally:
+        stop.set()
+
+
+def wreq_paginate(
+    request: Union[Request, PreparedRequest],
+    next_page: Optional[NextPageType] = None,
+    items: ItemsType = None,
+    prefetch: int = 1,
+    max_pages: Optional[int] = None,
+    session: Optional[Session] = None,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Walk a paginated API, fetching the next page while the caller handles the current one.
+
+    Every page is fetched through `wreq`, so retries, backoff, timeouts, deadlines and
+    the active `wreqs_session` apply as usual. With `prefetch` > 0, pages are fetched
+    on a worker thread up to `prefetch` pages ahead of the caller, so processing a
+    page overlaps with downloading the next ones. Stopping early (e.g. `break`) stops
+    the worker after its in-flight request.
+
+    Args:
+        request (Union[Request, PreparedRequest]): The request for the first page.
+        next_page (Optional[NextPageType], optional): How to find the next page: a
+            `LinkHeaderPaginator`, `CursorPaginator`, `OffsetPaginator`, or a function
+            `(response, request) -> Optional[PreparedRequest]`. Defaults to following
+            `Link: rel="next"` headers.
+        items (ItemsType, optional): Yield the items of each page instead of the pages:
+            a dotted path to the item list in the JSON body ("" for the body itself),
+            or a function returning the items. Defaults to None (yield responses).
+        prefetch (int, optional): Pages fetched ahead of the caller; 0 fetches each
+            page only when the previous one has been handled. Defaults to 1.
+        max_pages (Optional[int], optional): Stop after this many pages. Defaults to None.
+        session (Optional[Session], optional): Session for every page. If None, the active
+            `wreqs_session` is used, or one is created for the walk and closed at the end.
+            Defaults to None.
+        **kwargs: Options forwarded to `wreq` for every page (max_retries, check_retry,
+            backoff, timeout, ...). `stream` is not supported.
+
+    Yields:
+        Any: Each page's `Response`, or each item if `items` is given.
+
+    Raises:
+        ValueError: If `stream=True` is passed.
+
+    Example:
+        ```python
+        from wreqs import wreq_paginate, CursorPaginator
+
+        req = Request("GET", "https://api.example.com/v1/orders", params={"limit": 500})
+        for order in wreq_paginate(
+            req, next_page=CursorPaginator("meta.next_cursor"), items="data", prefetch=2
+        ):
+            handle(order)
+        ```
+
+    Notes:
+        - Later pages copy the first prepared request, headers and auth included. The
+          `Authorization` and `Cookie` headers are dropped when a `Link` header points
+          at another origin; custom paginators must do the same themselves.
+        - With `spill_threshold`, yielded pages keep their spilled bodies open (see
+          `detach_body`); close them when done, or leave them to the garbage collector.
+        - Exceptions raised while fetching a page are raised from the generator after
+          the pages before it have been yielded.
+    """
+    if kwargs.get("stream"):
+        raise ValueError("wreq_paginate does not support stream=True")
+    if prefetch < 0:
+        raise ValueError("prefetch must not be negative")
+
+    paginator = next_page if next_page is not None else LinkHeaderPaginator()
+    if isinstance(paginator, Paginator):
+        first_request, next_request = paginator.start, paginator.next_request
+    else:
+        first_request, next_request = (lambda r: r), paginator
+
+    if session is None:
+        session = _wreqs_session.get()
+    owned = session is None
+    if session is None:
+        session = Session()
+
+    pages: Optional[Iterator[Response]] = None
+    try:
+        if isinstance(request, PreparedRequest):
+            prepared = request
+        else:
+            prepared = session.prepare_request(request)
+        pages = _pages(first_request(prepared), next_request, session, max_pages, kwargs)
+        if prefetch:
+            pages = _prefetched(pages, prefetch)
+        for page in pages:
+            if items is None:
+                yield page
+            else:
+                yield from _page_items(page, items)
+                if isinstance(page, SpilledResponse):
+                    page.close()  # nothing refers to the page once its items are out
+    finally:
+        if pages is not None:
+            pages.close()  # type: ignore[attr-defined]
+        if owned:
+            # a worker may still be finishing a request on it; closing only drops idle
+            # connections, and the worker stops before sending another
+            session.close()
@@ -0,0 +1,124 @@
+from typing import Dict, NamedTuple, Optional
+
+from requests import Session
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+
+from wreqs.dns import DNSCache, DNSCachingAdapter
+
+
+class PoolStats(NamedTuple):
+    """
+    Snapshot of the connection pool(s) held for a single host.
+
+    Attributes:
+        open (int): Connections currently open (idle + in use).
+        idle (int): Open connections waiting in the pool for reuse.
+        in_use (int): Connections checked out by in-flight requests.
+        maxsize (int): Maximum number of connections kept for the host.
+    """
+
+    open: int
+    idle: int
+    in_use: int
+    maxsize: int
+
+
+def configure_pool(
+    session: Session,
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    dns_cache: Optional[DNSCache] = None,
+) -> HTTPAdapter:
+    """
+    Mount a tuned HTTPAdapter on a session for both http:// and https://.
+
+    Args:
+        session (Session): The session to configure.
+        pool_connections (int, optional): Number of per-host pools to cache.
+            Defaults to requests' DEFAULT_POOLSIZE.
+        pool_maxsize (int, optional): Maximum number of connections kept per host.
+            Defaults to requests' DEFAULT_POOLSIZE.
+        pool_block (bool, optional): If True, requests wait for a free connection
+            instead of opening (and later discarding) extra ones once the pool is full.
+            Defaults to requests' DEFAULT_POOLBLOCK.
+        dns_cache (Optional[DNSCache], optional): Resolve host names for new connections
+            through this cache. Defaults to None.
+
+    Returns:
+        HTTPAdapter: The adapter mounted on the session.
+    """
+    adapter = new_adapter(pool_connections, pool_maxsize, pool_block, dns_cache)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
+
+
+def new_adapter(
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    dns_cache: Optional[DNSCache] = None,
+) -> HTTPAdapter:
+    """Create an HTTPAdapter with the given pool settings, resolving through `dns_cache` if set."""
+    kwargs = dict(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+    )
+    if dns_cache is not None:
+        return DNSCachingAdapter(dns_cache, **kwargs)
+    return HTTPAdapter(**kwargs)
+
+
+def pool_stats(session: Session) -> Dict[str, PoolStats]:
+    """
+    Report connection pool usage for every host a session has talked to.
+
+    Args:
+        session (Session): The session to inspect.
+
+    Returns:
+        Dict[str, PoolStats]: Pool statistics keyed by "scheme://host:port".
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, pool_stats
+
+        with wreqs_session(pool_maxsize=32) as session:
+            with wreq(Request("GET", "https://api.example.com/data")) as response:
+                ...
+            print(pool_stats(session))
+            # {'https://api.example.com:443': PoolStats(open=1, idle=1, in_use=0, maxsize=32)}
+        ```
+    """
+    totals: Dict[str, Dict[str, int]] = {}
+    seen = set()
+
+    for adapter in session.adapters.values():
+        if not isinstance(adapter, HTTPAdapter) or id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+
+        managers = [adapter.poolmanager, *adapter.proxy_manager.values()]
+        for manager in managers:
+            for key in manager.pools.keys():
+                try:
+                    pool = manager.pools[key]
+                except KeyError:
+                    continue  # evicted while iterating
+                queue = pool.pool
+                if queue is None:
+                    continue  # pool has been closed
+
+                idle = sum(conn is not None for conn in list(queue.queue))
+                in_use = max(queue.maxsize - queue.qsize(), 0)
+
+                host = f"{pool.scheme}://{pool.host}:{pool.port}"
+                entry = totals.setdefault(
+                    host, {"open": 0, "idle": 0, "in_use": 0, "maxsize": 0}
+                )
+                entry["open"] += idle + in_use
+                entry["idle"] += idle
+                entry["in_use"] += in_use
+                entry["maxsize"] += queue.maxsize
+
+    return {host: PoolStats(**entry) for host, entry in totals.items()}
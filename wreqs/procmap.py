@@ -0,0 +1,275 @@
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from requests import PreparedRequest, Request, Response, Session
+
+from wreqs.batch import wreq_many
+from wreqs.body import SpilledResponse
+from wreqs.codec import loads_json
+from wreqs.sessionpool import SessionPool
+
+
+class RawResponse(NamedTuple):
+    """
+    The parts of a response handed to a `wreq_map` handler in a worker process.
+
+    Attributes:
+        status_code (int): HTTP status code.
+        headers (Mapping[str, str]): Response headers (a plain dict; keys keep their case).
+        url (str): Final URL of the response.
+        encoding (Optional[str]): Text encoding declared by the response, if any.
+        content (Union[bytes, memoryview]): The body; a `memoryview` over shared memory
+            with `zero_copy=True` for bodies above the shared-memory threshold.
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    url: str
+    encoding: Optional[str]
+    content: Union[bytes, memoryview]
+
+    def json(self) -> Any:
+        """Decode the body as JSON with the configured codec."""
+        content = self.content
+        return loads_json(content.tobytes() if isinstance(content, memoryview) else content)
+
+
+class MapResult(NamedTuple):
+    """
+    Outcome of a single request processed by `wreq_map`.
+
+    Attributes:
+        index (int): Position of the request in the input iterable.
+        request (Union[Request, PreparedRequest]): The request that was executed.
+        value (Any): What the handler returned, if the request and handler succeeded.
+        exception (Optional[BaseException]): The error raised by the request (e.g.
+            RetryRequestError) or by the handler, if any.
+    """
+
+    index: int
+    request: Union[Request, PreparedRequest]
+    value: Any
+    exception: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+
+HandlerType = Callable[[RawResponse], Any]
+
+
+def _handle(handler: HandlerType, raw: RawResponse) -> Any:
+    return handler(raw)
+
+
+def _handle_shared(
+    handler: HandlerType, raw: RawResponse, name: str, size: int, zero_copy: bool
+) -> Any:
+    shm = SharedMemory(name=name)
+    view = shm.buf[:size]
+    try:
+        return handler(raw._replace(content=view if zero_copy else view.tobytes()))
+    finally:
+        try:
+            view.release()
+            shm.close()
+        except BufferError:
+            raise BufferError(
+                "wreq_map handler kept a reference to the zero-copy body; copy what it needs"
+            ) from None
+
+
+def _submit(
+    executor: Executor,
+    handler: HandlerType,
+    response: Response,
+    shm_threshold: Optional[int],
+    zero_copy: bool,
+) -> Tuple[Future, Optional[SharedMemory]]:
+    content: Union[bytes, memoryview]
+    if isinstance(response, SpilledResponse):
+        content = response.body.getbuffer()  # copied from the mapping exactly once below
+    else:
+        content = response.content or b""
+    raw = RawResponse(
+        response.status_code, dict(response.headers), response.url, response.encoding, b""
+    )
+    if shm_threshold is None or len(content) < shm_threshold or not content:
+        if isinstance(content, memoryview):
+            content = content.tobytes()
+        return executor.submit(_handle, handler, raw._replace(content=content)), None
+
+    # one copy into shared memory instead of pickling the body through a pipe
+    shm = SharedMemory(create=True, size=len(content))
+    try:
+        shm.buf[: len(content)] = content
+        future = executor.submit(
+            _handle_shared, handler, raw, shm.name, len(content), zero_copy
+        )
+    except BaseException:
+        _free(shm)
+        raise
+    return future, shm
+
+
+def _free(shm: Optional[SharedMemory]) -> None:
+    if shm is not None:
+        shm.close()
+        shm.unlink()
+
+
+def wreq_map(
+    requests: Iterable[Union[Request, PreparedRequest]],
+    handler: HandlerType,
+    processes: Optional[int] = None,
+    threads: int = 8,
+    ordered: bool = True,
+    shm_threshold: Optional[int] = 1 << 20,
+    zero_copy: bool = False,
+    executor: Optional[Executor] = None,
+    session: Optional[Union[Session, SessionPool]] = None,
+    **kwargs: Any,
+) -> Iterator[MapResult]:
+    """
+    Fetch requests on threads and process their bodies in a process pool.
+
+    Requests run through `wreq_many`, so retries, backoff, timeouts and the active
+    `wreqs_session` apply exactly as for `wreq`. Each successful response is handed to
+    `handler` in a worker process as a `RawResponse`, so CPU-bound parsing runs on all
+    cores while the threads keep downloading. Bodies of `shm_threshold` bytes or more
+    are passed through shared memory rather than pickled.
+
+    Args:
+        requests (Iterable[Union[Request, PreparedRequest]]): The requests to execute.
+        handler (HandlerType): Function called with each `RawResponse` in a worker
+            process. It must be picklable (defined at module level) and its return
+            value too.
+        processes (Optional[int], optional): Worker processes. Defaults to the number
+            of CPUs.
+        threads (int, optional): Threads fetching requests. Defaults to 8.
+        ordered (bool, optional): If True, results are yielded in input order; otherwise
+            as soon as they are ready. Defaults to True.
+        shm_threshold (Optional[int], optional): Body size from which shared memory is
+            used; None always pickles. Defaults to 1 MiB.
+        zero_copy (bool, optional): Give the handler a `memoryview` of the shared memory
+            instead of a `bytes` copy. The handler must not keep it (or views of it)
+            after returning. Defaults to False.
+        executor (Optional[Executor], optional): Process pool to reuse across calls; it
+            is not shut down. If None, a pool using the "spawn" start method is created
+            and shut down when the iteration ends. Defaults to None.
+        session (Optional[Union[Session, SessionPool]], optional): Passed to `wreq_many`.
+            Defaults to None.
+        **kwargs: Options forwarded to `wreq` for every request (max_retries,
+            check_retry, backoff, timeout, ...). `stream` is not supported.
+
+    Yields:
+        MapResult: One result per request, holding the handler's value or an exception.
+
+    Raises:
+        ValueError: If `stream=True` is passed.
+
+    Example:
+        ```python
+        # parsers.py
+        import xml.etree.ElementTree as ET
+
+        def count_items(raw):
+            return len(ET.fromstring(raw.content).findall(".//item"))
+
+        # main.py
+        from parsers import count_items
+        from wreqs import wreq_map
+
+        reqs = (Request("GET", f"https://feeds.example.com/{i}.xml") for i in range(1000))
+        for result in wreq_map(reqs, count_items, processes=8, threads=32):
+            print(result.index, result.value if result.ok else result.exception)
+        ```
+
+    Notes:
+        - At most `2 * processes` bodies wait for or sit in the workers at a time, and
+          fetching pauses while they do, so memory stays bounded for long inputs.
+        - Failed requests are reported without calling the handler; non-2xx responses
+          that pass `check_retry` are handed to it like any other.
+        - With `executor`, pass a pool that does not use "fork" once threads are
+          running; forking a multi-threaded process can deadlock the child.
+    """
+    if kwargs.get("stream"):
+        raise ValueError("wreq_map does not support stream=True")
+    processes = processes or os.cpu_count() or 1
+    if processes < 1:
+        raise ValueError("processes must be at least 1")
+
+    owned = executor is None
+    pool: Executor = executor or ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    )
+    fetched = wreq_many(requests, max_workers=threads, ordered=ordered, session=session, **kwargs)
+    window = 2 * processes
+    # future -> (index, request, shared memory holding the body)
+    running: Dict[Future, Tuple[int, Any, Optional[SharedMemory]]] = {}
+    ready: Dict[int, MapResult] = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(running) + len(ready) < window:
+                try:
+                    item = next(fetched)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if item.response is None:
+                    ready[item.index] = MapResult(item.index, item.request, None, item.exception)
+                    continue
+                try:
+                    future, shm = _submit(pool, handler, item.response, shm_threshold, zero_copy)
+                finally:
+                    # the body was copied out; free a spilled one now rather than at gc
+                    if isinstance(item.response, SpilledResponse):
+                        item.response.close()
+                running[future] = (item.index, item.request, shm)
+
+            if ordered:
+                while next_index in ready:
+                    yield ready.pop(next_index)
+                    next_index += 1
+            else:
+                while ready:
+                    yield ready.pop(next(iter(ready)))
+
+            if not running:
+                if exhausted and not ready:
+                    return
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, request, shm = running.pop(future)
+                _free(shm)
+                try:
+                    ready[index] = MapResult(index, request, future.result(), None)
+                except Exception as e:
+                    ready[index] = MapResult(index, request, None, e)
+    finally:
+        fetched.close()  # type: ignore[attr-defined]
+        for future in running:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True)
+        for _, _, shm in running.values():
+            _free(shm)
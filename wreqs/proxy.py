@@ -0,0 +1,156 @@
+import random
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+
+class ProxyStats(NamedTuple):
+    """
+    Health snapshot of a single proxy in a `ProxyPool`.
+
+    Attributes:
+        latency (Optional[float]): EWMA of request latency in seconds, None until first use.
+        error_rate (float): EWMA of the failure indicator, between 0 and 1.
+        ejected (bool): Whether the proxy is currently cooling down.
+    """
+
+    latency: Optional[float]
+    error_rate: float
+    ejected: bool
+
+
+class _ProxyState:
+    __slots__ = ("latency", "error_rate", "consecutive_failures", "ejected_until")
+
+    def __init__(self) -> None:
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+
+
+class ProxyPool:
+    """
+    Thread-safe pool of proxies with health scoring, shared across `wreq` calls.
+
+    Every attempt reports its latency and outcome. Proxies are picked at random with
+    weights favouring low latency and low error rates. A proxy that fails
+    `max_failures` times in a row, or whose error rate reaches `max_error_rate`, is
+    ejected for `cooldown` seconds. If every proxy is ejected, the one coming back
+    soonest is used rather than failing outright.
+
+    Args:
+        proxies (List[str]): Proxy URLs, e.g. "http://proxy1.example.com:8080".
+        alpha (float, optional): EWMA smoothing factor for latency and error rate.
+            Defaults to 0.3.
+        max_failures (int, optional): Consecutive failures that eject a proxy. Defaults to 3.
+        max_error_rate (float, optional): Error-rate EWMA that ejects a proxy. Defaults to 0.75.
+        cooldown (float, optional): Seconds an ejected proxy sits out. Defaults to 30.
+        clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+        rng (Optional[random.Random], optional): Random source for weighted selection.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, ProxyPool
+
+        pool = ProxyPool(["http://p1.example.com:8080", "http://p2.example.com:8080"])
+
+        with wreqs_session(proxies=pool):
+            with wreq(Request("GET", "https://example.com"), max_retries=3) as response:
+                ...
+        print(pool.stats())
+        ```
+    """
+
+    def __init__(
+        self,
+        proxies: List[str],
+        alpha: float = 0.3,
+        max_failures: int = 3,
+        max_error_rate: float = 0.75,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        if not proxies:
+            raise ValueError("ProxyPool needs at least one proxy")
+        self.alpha = alpha
+        self.max_failures = max_failures
+        self.max_error_rate = max_error_rate
+        self.cooldown = cooldown
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self._states: Dict[str, _ProxyState] = {p: _ProxyState() for p in proxies}
+        self._lock = threading.Lock()
+
+    def _weight(self, state: _ProxyState, default_latency: float) -> float:
+        latency = state.latency if state.latency is not None else default_latency
+        return (1.0 - state.error_rate) / max(latency, 1e-3)
+
+    def select(self) -> str:
+        """
+        Pick a proxy for the next attempt.
+
+        Returns:
+            str: The proxy URL.
+        """
+        with self._lock:
+            now = self.clock()
+            healthy = [(p, s) for p, s in self._states.items() if s.ejected_until <= now]
+            if not healthy:
+                return min(self._states, key=lambda p: self._states[p].ejected_until)
+
+            known = [s.latency for _, s in healthy if s.latency is not None]
+            # untried proxies are scored as the fastest known one so they get explored
+            default_latency = min(known) if known else 1.0
+            weights = [self._weight(s, default_latency) for _, s in healthy]
+            if sum(weights) <= 0:
+                return self.rng.choice(healthy)[0]
+            return self.rng.choices([p for p, _ in healthy], weights=weights)[0]
+
+    def report(self, proxy: str, latency: float, success: bool) -> None:
+        """
+        Record the outcome of an attempt made through `proxy`.
+
+        Args:
+            proxy (str): The proxy URL returned by `select`.
+            latency (float): Seconds the attempt took.
+            success (bool): Whether the attempt succeeded.
+        """
+        with self._lock:
+            state = self._states.get(proxy)
+            if state is None:
+                return
+            if state.latency is None:
+                state.latency = latency
+            else:
+                state.latency += self.alpha * (latency - state.latency)
+            state.error_rate += self.alpha * ((0.0 if success else 1.0) - state.error_rate)
+
+            if success:
+                state.consecutive_failures = 0
+                return
+
+            state.consecutive_failures += 1
+            if (
+                state.consecutive_failures >= self.max_failures
+                or state.error_rate >= self.max_error_rate
+            ):
+                state.ejected_until = self.clock() + self.cooldown
+                # give it a clean slate once the cooldown is over
+                state.consecutive_failures = 0
+                state.error_rate = 0.0
+
+    def stats(self) -> Dict[str, ProxyStats]:
+        """
+        Current health of every proxy in the pool.
+
+        Returns:
+            Dict[str, ProxyStats]: Stats keyed by proxy URL.
+        """
+        with self._lock:
+            now = self.clock()
+            return {
+                p: ProxyStats(s.latency, s.error_rate, s.ejected_until > now)
+                for p, s in self._states.items()
+            }
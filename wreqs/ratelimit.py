@@ -0,0 +1,234 @@
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from requests import PreparedRequest, Request, Response
+
+from wreqs.backoff import _EPOCH_THRESHOLD, parse_retry_after
+from wreqs.breaker import host_key
+from wreqs.error import DeadlineExceededError, RateLimitExceededError
+
+
+def _parse_quota(
+    response: Response, wall_clock: Callable[[], float]
+) -> Tuple[Optional[int], Optional[float]]:
+    """
+    Read the remaining quota and seconds until it resets from rate-limit headers.
+
+    Understands `RateLimit-Remaining`/`RateLimit-Reset`, their `X-` prefixed forms and
+    the combined `RateLimit: limit=100, remaining=40, reset=10` header (`r=`/`t=` too).
+    """
+    headers = response.headers
+    remaining: Optional[str] = None
+    reset: Optional[str] = None
+
+    combined = headers.get("RateLimit")
+    if combined and "=" in combined:
+        for part in combined.replace(";", ",").split(","):
+            name, _, value = part.strip().partition("=")
+            if name in ("remaining", "r"):
+                remaining = value
+            elif name in ("reset", "t"):
+                reset = value
+    for prefix in ("RateLimit-", "X-RateLimit-"):
+        remaining = remaining or headers.get(prefix + "Remaining")
+        reset = reset or headers.get(prefix + "Reset")
+
+    try:
+        remaining_count = int(remaining.strip()) if remaining is not None else None
+    except ValueError:
+        remaining_count = None
+    try:
+        reset_seconds = float(reset.strip()) if reset is not None else None
+    except ValueError:
+        reset_seconds = None
+    if reset_seconds is not None and reset_seconds > _EPOCH_THRESHOLD:
+        reset_seconds -= wall_clock()
+    if reset_seconds is not None:
+        reset_seconds = max(reset_seconds, 0.0)
+    return remaining_count, reset_seconds
+
+
+class _KeyState:
+    __slots__ = ("tat", "interval", "interval_until")
+
+    def __init__(self, now: float) -> None:
+        # theoretical arrival time of the next conforming request
+        self.tat = now
+        # server-imposed spacing, used instead of the configured one until `interval_until`
+        self.interval: Optional[float] = None
+        self.interval_until = 0.0
+
+
+class RateLimiter:
+    """
+    Thread-safe client-side rate limiter using GCRA (a token bucket without a refill timer).
+
+    Each key (the URL's host by default) may send `rate` requests per second on
+    average, with bursts of up to `burst` requests. An attempt that would exceed the
+    limit waits until it conforms. If that wait would be longer than `max_wait`, it
+    fails immediately with `RateLimitExceededError` instead.
+
+    With `adapt=True` the limiter also follows the server's own accounting. A response
+    saying how many requests remain (`RateLimit-Remaining`/`RateLimit-Reset`, the
+    `X-RateLimit-*` forms, or the combined `RateLimit` header) slows the key down to
+    spread those requests over the reset window. A 429 or 503 with `Retry-After`, or a
+    remaining quota of 0, pauses the key until the server says it may continue.
+
+    Args:
+        rate (float): Requests per second allowed per key.
+        burst (int, optional): Requests that may be sent back to back. Defaults to 1.
+        key (Callable[[Union[Request, PreparedRequest]], str], optional): Maps a request to
+            its limit. Defaults to the URL's host.
+        max_wait (Optional[float], optional): Longest wait, in seconds, before failing
+            fast. None waits as long as needed. Defaults to None.
+        adapt (bool, optional): Follow rate-limit headers from responses. Defaults to True.
+        clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+        wall_clock (Callable[[], float], optional): Epoch clock used for absolute reset
+            times. Defaults to time.time.
+        sleep (Callable[[float], None], optional): Blocking sleep. Defaults to time.sleep.
+        async_sleep (Callable[[float], Awaitable[None]], optional): Sleep used by `awreq`.
+            Defaults to asyncio.sleep.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, RateLimiter
+
+        limiter = RateLimiter(rate=10, burst=5, max_wait=2.0)
+
+        with wreqs_session(rate_limiter=limiter):
+            for item_id in item_ids:
+                with wreq(Request("GET", f"https://api.example.com/items/{item_id}")) as response:
+                    ...
+        ```
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        key: Callable[[Union[Request, PreparedRequest]], str] = host_key,
+        max_wait: Optional[float] = None,
+        adapt: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.key = key
+        self.max_wait = max_wait
+        self.adapt = adapt
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.sleep = sleep
+        self.async_sleep = async_sleep
+        self._interval = 1.0 / rate
+        self._states: Dict[str, _KeyState] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, time_left: Optional[float] = None) -> float:
+        """
+        Claim the next slot for `key` without waiting.
+
+        Args:
+            key (str): The limit to claim a slot of.
+            time_left (Optional[float], optional): Seconds before the caller's deadline,
+                if any. Defaults to None.
+
+        Returns:
+            float: Seconds to wait before sending; 0 if the request may go now.
+
+        Raises:
+            RateLimitExceededError: If the wait would exceed `max_wait`. No slot is claimed.
+            DeadlineExceededError: If the wait would reach past `time_left`. No slot is
+                claimed.
+        """
+        with self._lock:
+            now = self.clock()
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _KeyState(now)
+            interval = self._interval
+            if state.interval is not None:
+                if now < state.interval_until:
+                    interval = max(interval, state.interval)
+                else:
+                    state.interval = None
+
+            tat = max(state.tat, now)
+            wait = max(tat - interval * (self.burst - 1) - now, 0.0)
+            if self.max_wait is not None and wait > self.max_wait:
+                raise RateLimitExceededError(
+                    f"Rate limit for {key} exceeded; next slot in {wait:.2f}s",
+                    key=key,
+                    retry_in=wait,
+                )
+            if time_left is not None and wait >= time_left:
+                raise DeadlineExceededError(
+                    f"Deadline exceeded before a rate limit slot for {key} ({wait:.2f}s)"
+                )
+            state.tat = tat + interval
+            return wait
+
+    def acquire(self, key: str, time_left: Optional[float] = None) -> float:
+        """
+        Wait until a request for `key` may be sent.
+
+        Args:
+            key (str): The limit to claim a slot of.
+            time_left (Optional[float], optional): Seconds before the caller's deadline;
+                see `reserve`. Defaults to None.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        wait = self.reserve(key, time_left)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    async def acquire_async(self, key: str, time_left: Optional[float] = None) -> float:
+        """Like `acquire`, but awaits `async_sleep` instead of blocking."""
+        wait = self.reserve(key, time_left)
+        if wait > 0:
+            await self.async_sleep(wait)
+        return wait
+
+    def update(self, key: str, response: Response) -> None:
+        """
+        Adapt the limit for `key` to the rate-limit headers of `response`.
+
+        Does nothing unless `adapt` is set.
+        """
+        if not self.adapt:
+            return
+
+        pause: Optional[float] = None
+        if response.status_code in (429, 503):
+            pause = parse_retry_after(response, self.wall_clock)
+        remaining, reset = _parse_quota(response, self.wall_clock)
+        if remaining is not None and remaining <= 0 and reset is not None:
+            pause = max(pause or 0.0, reset)
+        if pause is None and (remaining is None or reset is None):
+            return
+
+        with self._lock:
+            now = self.clock()
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _KeyState(now)
+            if pause is not None:
+                # no slot before `now + pause`, then continue at the normal pace
+                state.tat = max(
+                    state.tat, now + pause + self._interval * (self.burst - 1)
+                )
+            elif remaining and reset:
+                state.interval = reset / remaining
+                state.interval_until = now + reset
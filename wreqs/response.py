@@ -0,0 +1,79 @@
+from datetime import timedelta
+from typing import Optional
+
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+
+
+def build_response(
+    status_code: int,
+    content: bytes,
+    headers: CaseInsensitiveDict,
+    url: str,
+    reason: Optional[str] = None,
+    encoding: Optional[str] = None,
+    request: Optional[PreparedRequest] = None,
+) -> Response:
+    """
+    Build a fully-read Response that does not depend on any connection.
+
+    Args:
+        status_code (int): HTTP status code.
+        content (bytes): Response body. Bytes are immutable, so the same object can
+            safely back many responses.
+        headers (CaseInsensitiveDict): Response headers; copied.
+        url (str): Final URL of the response.
+        reason (Optional[str], optional): Reason phrase. Defaults to None.
+        encoding (Optional[str], optional): Text encoding. Defaults to None.
+        request (Optional[PreparedRequest], optional): Request to attach. Defaults to None.
+
+    Returns:
+        Response: The new response.
+    """
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response.reason = reason  # type: ignore[assignment]
+    response.encoding = encoding
+    response.request = request  # type: ignore[assignment]
+    response.elapsed = timedelta(0)
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+def copy_response(
+    response: Response, request: Optional[PreparedRequest] = None
+) -> Response:
+    """
+    Create an independent copy of a fully-read response.
+
+    Headers, cookies and history are copied; the body bytes are shared, which is
+    safe because bytes are immutable. A JSON document already decoded by
+    `decode_json` is shared too, so the copy does not parse the body again.
+
+    Args:
+        response (Response): The response to copy. Its content must already be loaded.
+        request (Optional[PreparedRequest], optional): Request to attach to the copy.
+            Defaults to the original response's request.
+
+    Returns:
+        Response: The copy.
+    """
+    copy = build_response(
+        response.status_code,
+        response.content,
+        response.headers,
+        response.url,
+        reason=response.reason,
+        encoding=response.encoding,
+        request=request or response.request,
+    )
+    copy.elapsed = response.elapsed
+    copy.history = list(response.history)
+    copy.cookies.update(response.cookies)
+    decoded = response.__dict__.get("_wreqs_json")
+    if decoded is not None:
+        copy.__dict__["_wreqs_json"] = decoded
+    return copy
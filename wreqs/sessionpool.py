@@ -0,0 +1,243 @@
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Dict, Generator, List, NamedTuple, Optional, Tuple
+
+from requests import Session
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+
+from wreqs.dns import DNSCache
+from wreqs.error import SessionPoolExhaustedError
+from wreqs.pool import new_adapter
+
+
+class SessionPoolStats(NamedTuple):
+    """
+    Snapshot of a `SessionPool`.
+
+    Attributes:
+        size (int): Sessions currently held (idle + in use).
+        idle (int): Sessions waiting to be checked out.
+        in_use (int): Sessions checked out or bound to a live thread.
+        max_size (int): Maximum number of sessions.
+    """
+
+    size: int
+    idle: int
+    in_use: int
+    max_size: int
+
+
+class SessionPool:
+    """
+    A bounded, thread-safe pool of `requests.Session` objects sharing one connection pool.
+
+    A `Session`'s cookie jar is not safe to share between threads, but a session per
+    call throws away keep-alive connections. Sessions in this pool each keep their own
+    cookies and state, while all of them are mounted on one `HTTPAdapter`, whose
+    urllib3 connection pools are thread-safe. A connection opened by one thread is
+    reused by the next, whichever session it goes through.
+
+    Sessions are checked out for a call and checked back in afterwards. With
+    `per_thread=True` each thread keeps the same session (and cookies) for its whole
+    life; it returns to the pool when the thread exits. Sessions idle for longer than
+    `idle_timeout` are dropped.
+
+    Pass the pool as the `session` of `wreq` or `wreq_many` to check out a session for
+    every call.
+
+    Args:
+        max_size (int, optional): Maximum number of sessions. Defaults to 64.
+        idle_timeout (Optional[float], optional): Seconds an idle session is kept. None
+            keeps them until `close`. Defaults to 300.
+        per_thread (bool, optional): Bind one session to each thread instead of handing
+            out any idle one. Defaults to False.
+        pool_connections (int, optional): Number of per-host connection pools to cache.
+            Defaults to requests' DEFAULT_POOLSIZE.
+        pool_maxsize (int, optional): Maximum number of keep-alive connections per host,
+            shared by all sessions; size it to the number of threads. Defaults to
+            requests' DEFAULT_POOLSIZE.
+        pool_block (bool, optional): Wait for a free connection once a host's pool is
+            exhausted. Defaults to requests' DEFAULT_POOLBLOCK.
+        configure (Optional[Callable[[Session], None]], optional): Called with every new
+            session, e.g. to set default headers or auth. Defaults to None.
+        clock (Callable[[], float], optional): Monotonic clock. Defaults to time.monotonic.
+        dns_cache (Optional[DNSCache], optional): Resolve host names for new connections
+            through this cache. Defaults to None.
+
+    Example:
+        ```python
+        from concurrent.futures import ThreadPoolExecutor
+        from wreqs import wreq, SessionPool
+
+        sessions = SessionPool(max_size=64, pool_maxsize=64)
+
+        def crawl(url):
+            with wreq(Request("GET", url), session=sessions) as response:
+                return response.text
+
+        with ThreadPoolExecutor(64) as executor:
+            pages = list(executor.map(crawl, urls))
+        sessions.close()
+        ```
+    """
+
+    def __init__(
+        self,
+        max_size: int = 64,
+        idle_timeout: Optional[float] = 300.0,
+        per_thread: bool = False,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        configure: Optional[Callable[[Session], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        dns_cache: Optional[DNSCache] = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.per_thread = per_thread
+        self.configure = configure
+        self.clock = clock
+        self.adapter = new_adapter(pool_connections, pool_maxsize, pool_block, dns_cache)
+        # most recently checked in last, so checkout reuses the warmest session
+        self._idle: List[Tuple[Session, float]] = []
+        self._size = 0
+        # thread ident -> (thread, its session) for `per_thread` pools
+        self._bound: Dict[int, Tuple[weakref.ref, Session]] = {}
+        self._local = threading.local()
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _new_session(self) -> Session:
+        session = Session()
+        session.mount("http://", self.adapter)
+        session.mount("https://", self.adapter)
+        if self.configure is not None:
+            self.configure(session)
+        return session
+
+    def _reclaim(self) -> None:
+        """Return sessions of exited threads and drop expired idle ones. Holds `_cond`."""
+        now = self.clock()
+        for ident, (thread_ref, session) in list(self._bound.items()):
+            thread = thread_ref()
+            if thread is None or not thread.is_alive():
+                del self._bound[ident]
+                self._idle.append((session, now))
+        if self.idle_timeout is not None:
+            cutoff = now - self.idle_timeout
+            kept = [(s, t) for s, t in self._idle if t > cutoff]
+            self._size -= len(self._idle) - len(kept)
+            self._idle = kept
+
+    def checkout(self, timeout: Optional[float] = None) -> Session:
+        """
+        Take a session from the pool, creating one if there is room.
+
+        With `per_thread=True` the calling thread's own session is returned.
+
+        Args:
+            timeout (Optional[float], optional): Seconds to wait for a session when all
+                `max_size` are in use. None waits indefinitely. Defaults to None.
+
+        Returns:
+            Session: A session for the caller's exclusive use until `checkin`.
+
+        Raises:
+            SessionPoolExhaustedError: If no session became free within `timeout`, or the
+                pool is closed.
+        """
+        if self.per_thread:
+            session = getattr(self._local, "session", None)
+            if session is not None and not self._closed:
+                return session
+
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise SessionPoolExhaustedError("Session pool is closed")
+                self._reclaim()
+                if self._idle:
+                    session = self._idle.pop()[0]
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    session = self._new_session()
+                    break
+                remaining = None if deadline is None else deadline - self.clock()
+                if remaining is not None and remaining <= 0:
+                    raise SessionPoolExhaustedError(
+                        f"No session available within {timeout}s (max_size={self.max_size})"
+                    )
+                # woken by checkin; the timeout also lets exited threads be reclaimed
+                self._cond.wait(1.0 if remaining is None else min(remaining, 1.0))
+
+            if self.per_thread:
+                thread = threading.current_thread()
+                self._bound[thread.ident or 0] = (weakref.ref(thread), session)
+                self._local.session = session
+        return session
+
+    def checkin(self, session: Session) -> None:
+        """
+        Return a session taken with `checkout`.
+
+        Does nothing for a session bound to the calling thread by `per_thread`.
+        """
+        if self.per_thread and getattr(self._local, "session", None) is session:
+            return
+        with self._cond:
+            if self._closed:
+                return
+            self._idle.append((session, self.clock()))
+            self._cond.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Generator[Session, None, None]:
+        """
+        Check out a session for the duration of a `with` block.
+
+        Args:
+            timeout (Optional[float], optional): As for `checkout`. Defaults to None.
+
+        Yields:
+            Session: The checked out session.
+        """
+        session = self.checkout(timeout)
+        try:
+            yield session
+        finally:
+            self.checkin(session)
+
+    def evict_idle(self) -> int:
+        """
+        Drop idle sessions older than `idle_timeout` now instead of on the next checkout.
+
+        Returns:
+            int: Number of sessions dropped.
+        """
+        with self._cond:
+            before = self._size
+            self._reclaim()
+            return before - self._size
+
+    def stats(self) -> SessionPoolStats:
+        """Return a snapshot of the pool."""
+        with self._cond:
+            idle = len(self._idle)
+            return SessionPoolStats(self._size, idle, self._size - idle, self.max_size)
+
+    def close(self) -> None:
+        """Close the shared connection pools and drop every session."""
+        with self._cond:
+            self._closed = True
+            self._idle.clear()
+            self._bound.clear()
+            self._size = 0
+            self._cond.notify_all()
+        self.adapter.close()
@@ -0,0 +1,165 @@
+import copy
+import threading
+from typing import Callable, Dict, Hashable, NamedTuple, Optional, Sequence, Tuple
+
+from requests import PreparedRequest, Response
+
+from wreqs.error import DeadlineExceededError
+from wreqs.response import copy_response
+
+DEFAULT_VARY_HEADERS = (
+    "Accept",
+    "Accept-Encoding",
+    "Accept-Language",
+    "Authorization",
+    "Cookie",
+)
+
+
+class SingleFlightStats(NamedTuple):
+    """
+    Counters exposed by `SingleFlight.stats`.
+
+    Attributes:
+        leaders (int): Calls that went to the network on behalf of a group.
+        shared (int): Calls that waited for a leader instead of sending.
+        in_flight (int): Groups currently waiting on a leader.
+    """
+
+    leaders: int
+    shared: int
+    in_flight: int
+
+
+class _Call:
+    __slots__ = ("done", "response", "exception")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[Response] = None
+        self.exception: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical idempotent requests that are in flight at the same time.
+
+    The first caller for a key (the leader) performs the request, retries included;
+    callers arriving while it runs wait for it and share its final outcome. Every
+    caller, the leader included, gets its own copy of the response, so headers and
+    cookies can be modified freely; the body bytes and the document decoded by
+    `response.json()` are shared, so treat the latter as read-only. The leader's
+    exception is re-raised in the leader; every waiter raises its own copy of it,
+    chained to the original.
+
+    Only GET, HEAD and OPTIONS requests are coalesced. Two requests are identical
+    when their method, full URL (including query parameters) and the values of
+    `vary_headers` match.
+
+    Args:
+        vary_headers (Sequence[str], optional): Request headers that distinguish
+            otherwise identical requests. Defaults to Accept, Accept-Encoding,
+            Accept-Language, Authorization and Cookie.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, wreq_many
+
+        with wreqs_session(single_flight=True):
+            # 100 identical requests, one network call
+            reqs = [Request("GET", "https://config.example.com/flags")] * 100
+            results = list(wreq_many(reqs, max_workers=100))
+        ```
+    """
+
+    def __init__(self, vary_headers: Sequence[str] = DEFAULT_VARY_HEADERS) -> None:
+        self.vary_headers = tuple(vary_headers)
+        self._calls: Dict[Hashable, _Call] = {}
+        self._leaders = 0
+        self._shared = 0
+        self._lock = threading.Lock()
+
+    def key(self, request: PreparedRequest) -> Optional[Hashable]:
+        """
+        Coalescing key for `request`.
+
+        Returns:
+            Optional[Hashable]: The key, or None if the request must not be coalesced.
+        """
+        method = (request.method or "GET").upper()
+        if method not in ("GET", "HEAD", "OPTIONS") or request.body:
+            return None
+        return (
+            method,
+            request.url,
+            tuple(request.headers.get(name) for name in self.vary_headers),
+        )
+
+    def do(
+        self, key: Hashable, fn: Callable[[], Response], timeout: Optional[float] = None
+    ) -> Tuple[Response, bool]:
+        """
+        Run `fn` for `key` unless an identical call is already in flight.
+
+        Args:
+            key (Hashable): Coalescing key returned by `key`.
+            fn (Callable[[], Response]): Performs the request; called by the leader only.
+            timeout (Optional[float], optional): Seconds a waiter may wait for the
+                leader, usually the time left before its deadline. The leader is not
+                limited. Defaults to None (no limit).
+
+        Returns:
+            Tuple[Response, bool]: A private copy of the response, and whether it was
+                shared from another caller's call.
+
+        Raises:
+            DeadlineExceededError: If a waiter's `timeout` passes before the leader
+                finishes.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._leaders += 1
+            else:
+                self._shared += 1
+
+        if leader:
+            try:
+                call.response = fn()
+                call.response.content  # load the body before anyone copies it
+            except BaseException as e:
+                call.exception = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        elif not call.done.wait(timeout):
+            raise DeadlineExceededError(
+                "Deadline exceeded while waiting for an identical in-flight request"
+            )
+
+        if call.exception is not None:
+            if leader:
+                raise call.exception
+            # one exception object raised in many threads would have its traceback
+            # and context rewritten by each of them
+            raise _copy_exception(call.exception) from call.exception
+        assert call.response is not None
+        return copy_response(call.response), not leader
+
+    def stats(self) -> SingleFlightStats:
+        """Snapshot of the coalescing counters."""
+        with self._lock:
+            return SingleFlightStats(self._leaders, self._shared, len(self._calls))
+
+
+def _copy_exception(exception: BaseException) -> BaseException:
+    try:
+        clone = copy.copy(exception)
+    except Exception:
+        return RuntimeError(f"Shared request failed: {exception!r}")
+    clone.__traceback__ = None
+    clone.__context__ = None
+    return clone
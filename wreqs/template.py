@@ -0,0 +1,155 @@
+from typing import Any, Callable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+from requests import PreparedRequest, Request, Session
+from requests.auth import AuthBase
+from requests.models import RequestEncodingMixin
+from requests.utils import requote_uri
+
+ParamsType = Optional[Union[Mapping[str, Any], str]]
+
+
+class RequestTemplate:
+    """
+    A request prepared once and stamped out many times.
+
+    Method, base URL, headers, cookies and auth are merged with the session and
+    prepared when the template is created. Each call to `prepare` only copies that
+    prepared request and fills in the path, query parameters and body, skipping the
+    header and cookie merging, URL parsing and auth setup that `Session.prepare_request`
+    repeats on every call. The result is a `PreparedRequest` that `wreq`, `awreq` and
+    `wreq_many` accept directly.
+
+    Args:
+        method (str): HTTP method, e.g. "GET".
+        base_url (str): URL that paths are appended to. A query string in it becomes
+            default params.
+        headers (Optional[Mapping[str, str]], optional): Headers sent with every request.
+            Defaults to None.
+        params (ParamsType, optional): Query parameters sent with every request; per-call
+            params are added after them. Defaults to None.
+        auth (Optional[Union[Tuple[str, str], AuthBase, Callable]], optional): Auth for
+            every request. Basic auth tuples are applied once; other auth handlers run on
+            every `prepare`, since they may sign the URL or body. Defaults to None.
+        cookies (Optional[Mapping[str, str]], optional): Cookies sent with every request.
+            Defaults to None.
+        session (Optional[Session], optional): Session whose headers, cookies and auth are
+            merged in. Defaults to None.
+
+    Example:
+        ```python
+        from wreqs import wreq, wreqs_session, RequestTemplate
+
+        with wreqs_session() as session:
+            items = RequestTemplate(
+                "GET",
+                "https://api.example.com/v1/items",
+                headers={"Accept": "application/json"},
+                auth=("user", "secret"),
+                session=session,
+            )
+            while True:
+                with wreq(items.prepare("pending", params={"limit": 100})) as response:
+                    handle(response.json())
+        ```
+
+    Notes:
+        - Session headers and cookies are captured when the template is created; cookies
+          the session receives later are not added to templated requests.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        base_url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        params: ParamsType = None,
+        auth: Optional[Union[Tuple[str, str], AuthBase, Callable]] = None,
+        cookies: Optional[Mapping[str, str]] = None,
+        session: Optional[Session] = None,
+    ) -> None:
+        scheme, netloc, path, query, _ = urlsplit(base_url)
+        default_params = parse_qsl(query, keep_blank_values=True)
+        if params:
+            default_params.extend(
+                parse_qsl(params, keep_blank_values=True)
+                if isinstance(params, str)
+                else _pairs(params)
+            )
+
+        effective_auth = auth if auth is not None else session and session.auth
+        per_call_auth = (
+            effective_auth
+            if effective_auth and not isinstance(effective_auth, tuple)
+            else None
+        )
+        request = Request(
+            method,
+            urlunsplit((scheme, netloc, path, "", "")),
+            headers=dict(headers or {}),
+            cookies=dict(cookies or {}),
+            # a no-op keeps the session from applying per-call auth to the template itself
+            auth=_no_auth if per_call_auth else auth,
+        )
+        prepared = (session or Session()).prepare_request(request)
+
+        self.method = prepared.method
+        self._base = prepared
+        self._url = prepared.url or ""
+        self._prefix = self._url.rstrip("/") + "/"
+        self._params = RequestEncodingMixin._encode_params(default_params)
+        self._auth = per_call_auth
+
+    def prepare(
+        self,
+        path: str = "",
+        params: ParamsType = None,
+        data: Any = None,
+        json: Any = None,
+        files: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> PreparedRequest:
+        """
+        Build a request from the template.
+
+        Args:
+            path (str, optional): Path appended to the base URL. Defaults to "".
+            params (ParamsType, optional): Extra query parameters. Defaults to None.
+            data (Any, optional): Form data or raw body, as for `requests.Request`.
+            json (Any, optional): JSON body. Defaults to None.
+            files (Any, optional): Multipart files. Defaults to None.
+            headers (Optional[Mapping[str, str]], optional): Extra headers for this request
+                only. Defaults to None.
+
+        Returns:
+            PreparedRequest: A new request, independent of every other one built.
+        """
+        prepared = self._base.copy()
+        url = self._prefix + requote_uri(path.lstrip("/")) if path else self._url
+        query = self._params
+        if params:
+            extra = RequestEncodingMixin._encode_params(params)
+            query = f"{query}&{extra}" if query and extra else query or extra
+        prepared.url = f"{url}?{query}" if query else url
+        if headers:
+            prepared.headers.update(headers)
+        if data is not None or json is not None or files is not None:
+            prepared.prepare_body(data, files, json)
+        if self._auth is not None:
+            # copy() shares the hooks lists, and auth handlers may register hooks
+            prepared.hooks = {event: list(h) for event, h in prepared.hooks.items()}
+            prepared.prepare_auth(self._auth)
+        return prepared
+
+
+def _no_auth(request: PreparedRequest) -> PreparedRequest:
+    return request
+
+
+def _pairs(params: Mapping[str, Any]) -> List[Tuple[str, Any]]:
+    pairs: List[Tuple[str, Any]] = []
+    for key, value in params.items():
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            if item is not None:
+                pairs.append((key, item))
+    return pairs